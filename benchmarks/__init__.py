@@ -0,0 +1,5 @@
+"""
+Benchmark suite measuring MinioExtensions operations against a local S3 compatible server.
+
+Run it with ``python -m benchmarks.run``. See ``benchmarks/run.py`` for the available options.
+"""
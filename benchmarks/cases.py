@@ -0,0 +1,197 @@
+import io
+import os
+import tempfile
+import uuid
+
+from minio import Minio
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Callable,
+    Any
+)
+from minio_extensions.cache import MetadataCache
+from minio_extensions.extensions import MinioExtensions
+from minio_extensions.metadata.metadata import (
+    ObjectMetadata,
+    VersionMetadata
+)
+
+KiB = 1024
+MiB = 1024 * KiB
+
+MATRICES = {
+    "quick": {"sizes": [4 * KiB, 1 * MiB], "counts": [10, 100], "versions": [5]},
+    "full": {"sizes": [4 * KiB, 1 * MiB, 32 * MiB], "counts": [10, 100, 1000], "versions": [5, 50]}
+}
+
+# Objects of this size are used on cases measuring per object overhead
+SMALL_OBJECT_SIZE = 64 * KiB
+
+
+class Case:
+    """
+    A single benchmark measurement. run is timed on every repetition, before_each is not.
+    """
+
+    def __init__(self, name: str, params: Dict[str, Any], run: Callable[[], Any],
+                 bytes_per_run: int = 0, ops_per_run: int = 1,
+                 before_each: Optional[Callable[[], Any]] = None) -> None:
+        self.name = name
+        self.params = params
+        self.run = run
+        self.bytes_per_run = bytes_per_run
+        self.ops_per_run = ops_per_run
+        self.before_each = before_each
+
+    @property
+    def id(self) -> str:
+        return "{0}[{1}]".format(self.name, ",".join(f"{k}={v}" for k, v in self.params.items()))
+
+
+class Fixtures:
+    """
+    Creates the buckets and objects benchmarked, removing them once the suite finishes.
+    """
+
+    def __init__(self, client: Minio) -> None:
+        self.client = client
+        self.bucket = f"bench-{uuid.uuid4().hex[:12]}"
+        self.versioned_bucket = f"{self.bucket}-versioned"
+        self.workdir = tempfile.mkdtemp(prefix = "minio-extensions-bench-")
+        self.downloads = set()
+
+        client.make_bucket(bucket_name = self.bucket)
+        client.make_bucket(bucket_name = self.versioned_bucket)
+        MinioExtensions.enable_object_versioning(client, bucket = self.versioned_bucket)
+
+    def put_objects(self, prefix: str, count: int, size: int) -> List[str]:
+        payload = os.urandom(size)
+        names = [f"{prefix}/{i:06d}.bin" for i in range(count)]
+
+        for name in names:
+            self.client.put_object(bucket_name = self.bucket, object_name = name, data = io.BytesIO(payload),
+                                   length = size)
+        return names
+
+    def local_file(self, size: int) -> str:
+        path = os.path.join(self.workdir, f"{size}.bin")
+
+        if not os.path.exists(path):
+            with open(path, "wb") as fb:
+                fb.write(os.urandom(size))
+        return path
+
+    def download_path(self, name: str) -> str:
+        """Path inside the fixtures work directory to download an object to, removed on close."""
+        return os.path.join(self.workdir, "downloads", name)
+
+    def track(self, result):
+        """Records the file downloaded by an operation returning (object, path), so it is removed on close."""
+        self.downloads.add(result[1])
+        return result
+
+    def close(self):
+        import shutil
+
+        for path in self.downloads:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+        for bucket in (self.bucket, self.versioned_bucket):
+            MinioExtensions.remove_objects(self.client, bucket = bucket, prefix = "", include_versions = True,
+                                           remove_all = True)
+            self.client.remove_bucket(bucket_name = bucket)
+
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+
+def build_cases(fixtures: Fixtures, matrix: Dict[str, List[int]]) -> List[Case]:
+    client, bucket = fixtures.client, fixtures.bucket
+    cases: List[Case] = []
+
+    for count in matrix["counts"]:
+        names = fixtures.put_objects(f"count-{count}", count, SMALL_OBJECT_SIZE)
+
+        for workers in (1, 16):
+            cases.append(Case("get_objects", {"count": count, "size": SMALL_OBJECT_SIZE, "workers": workers},
+                              lambda names = names, workers = workers: MinioExtensions.get_objects(
+                                  client, bucket = bucket, files = names, max_workers = workers),
+                              bytes_per_run = count * SMALL_OBJECT_SIZE, ops_per_run = count))
+
+        cases.append(Case("list_files_from_bucket", {"count": count},
+                          lambda count = count: list(MinioExtensions.list_files_from_bucket(
+                              client, bucket = bucket, prefix = f"count-{count}/", recurse = True)),
+                          ops_per_run = count))
+
+        cases.append(Case("get_object_metadata", {"count": count, "cache": "none"},
+                          lambda names = names: [MinioExtensions.get_object_metadata(
+                              client, bucket = bucket, object_name = n) for n in names],
+                          ops_per_run = count))
+
+        cases.append(Case("get_objects_metadata", {"count": count, "workers": 16},
+                          lambda names = names: list(MinioExtensions.get_objects_metadata(
+                              client, bucket = bucket, files = names, max_workers = 16)),
+                          ops_per_run = count))
+
+        cache = MetadataCache(max_entries = max(count, 1), ttl = 3600)
+        cases.append(Case("get_object_metadata", {"count": count, "cache": "warm"},
+                          lambda names = names, cache = cache: [MinioExtensions.get_object_metadata(
+                              client, bucket = bucket, object_name = n, cache = cache) for n in names],
+                          ops_per_run = count))
+
+    # Every fixture created so far, spread over one folder per count and size
+    for workers in (1, 16):
+        cases.append(Case("list_files_from_bucket", {"count": "all", "workers": workers},
+                          lambda workers = workers: list(MinioExtensions.list_files_from_bucket(
+                              client, bucket = bucket, recurse = True, parallel = workers > 1,
+                              max_workers = workers))))
+
+    for size in matrix["sizes"]:
+        name = fixtures.put_objects(f"size-{size}", 1, size)[0]
+        local_path = fixtures.local_file(size)
+
+        cases.append(Case("fload_file_from_bucket", {"size": size, "workers": "single"},
+                          lambda name = name: MinioExtensions.fload_file_from_bucket(
+                              client, bucket_name = bucket, object_name = name,
+                              file_path = fixtures.download_path(name)),
+                          bytes_per_run = size))
+
+        if size >= 8 * MiB:
+            cases.append(Case("fload_file_from_bucket", {"size": size, "workers": 8},
+                              lambda name = name: MinioExtensions.fload_file_from_bucket(
+                                  client, bucket_name = bucket, object_name = name, max_workers = 8,
+                                  part_size = 5 * MiB, file_path = fixtures.download_path(name)),
+                              bytes_per_run = size))
+
+        cases.append(Case("upload_object", {"size": size},
+                          lambda size = size, local_path = local_path: MinioExtensions.upload_object(
+                              client, bucket = bucket, object_name = f"upload/{size}.bin", local_path = local_path,
+                              content_type = "application/octet-stream"),
+                          bytes_per_run = size))
+
+    for versions in matrix["versions"]:
+        name = f"versions-{versions}/object.bin"
+        local_path = fixtures.local_file(4 * KiB)
+
+        for minor in range(versions):
+            MinioExtensions.upload_object(client, bucket = fixtures.versioned_bucket, object_name = name,
+                                          local_path = local_path, content_type = "application/octet-stream",
+                                          metadata = ObjectMetadata(version = VersionMetadata(major = 1,
+                                                                                              minor = minor)))
+
+        target = VersionMetadata(major = 1, minor = versions // 2)
+        resolve = lambda name = name, target = target: fixtures.track(MinioExtensions.get_object(
+            client, bucket = fixtures.versioned_bucket, file_name = name, tag_version = target))
+        drop_index = lambda name = name: client.remove_object(
+            bucket_name = fixtures.versioned_bucket, object_name = MinioExtensions._version_index_name(name))
+
+        cases.append(Case("get_object_version", {"versions": versions, "index": "warm"}, resolve))
+        cases.append(Case("get_object_version", {"versions": versions, "index": "cold"}, resolve,
+                          before_each = drop_index))
+
+    return cases
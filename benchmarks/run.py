@@ -0,0 +1,184 @@
+"""
+Runs the benchmark suite against a local S3 compatible server and compares the results with a baseline.
+
+Examples:
+    python -m benchmarks.run --matrix quick --output results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --tolerance 0.15 --fail-on-regression
+
+Results are stored as JSON holding the median, p95 and minimum duration of every case, along with its
+throughput in bytes or operations per second. A case regresses when its median duration grows, or its
+throughput drops, by more than the tolerance relative to the baseline.
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Any
+)
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def measure(case, repeat: int, warmup: int) -> Dict[str, Any]:
+    durations: List[float] = []
+
+    for i in range(warmup + repeat):
+        if case.before_each is not None:
+            case.before_each()
+
+        start = time.perf_counter()
+        case.run()
+        elapsed = time.perf_counter() - start
+
+        if i >= warmup:
+            durations.append(elapsed)
+
+    durations.sort()
+    median = statistics.median(durations)
+    result = {
+        "name": case.name,
+        "params": case.params,
+        "median_s": median,
+        "p95_s": durations[min(len(durations) - 1, int(round(0.95 * (len(durations) - 1))))],
+        "min_s": durations[0],
+        "ops_per_s": case.ops_per_run / median if median > 0 else None
+    }
+
+    if case.bytes_per_run:
+        result["bytes_per_s"] = case.bytes_per_run / median if median > 0 else None
+
+    return result
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Compares two result files returning a row per case present on both, flagged when it regressed.
+    """
+    rows = []
+
+    for case_id, result in current["results"].items():
+        reference = baseline["results"].get(case_id)
+
+        if reference is None:
+            continue
+
+        latency_ratio = result["median_s"] / reference["median_s"] if reference["median_s"] else None
+        throughput_key = "bytes_per_s" if "bytes_per_s" in result else "ops_per_s"
+        throughput_ratio = result[throughput_key] / reference[throughput_key] \
+            if reference.get(throughput_key) and result.get(throughput_key) else None
+
+        rows.append({
+            "case": case_id,
+            "latency_ratio": latency_ratio,
+            "throughput_ratio": throughput_ratio,
+            "regressed": (latency_ratio is not None and latency_ratio > 1 + tolerance) or
+                         (throughput_ratio is not None and throughput_ratio < 1 - tolerance)
+        })
+
+    return rows
+
+
+def _format_ratio(ratio: Optional[float]) -> str:
+    return f"{ratio:6.2f}x" if ratio is not None else "    n/a"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog = "python -m benchmarks.run", description = __doc__,
+                                     formatter_class = argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--server", choices = ["minio", "moto", "memory"], default = None,
+                        help = "Local server to benchmark against. Defaults to a minio binary when found. "
+                               "memory runs against the in-memory storage backend, measuring library overhead only.")
+    parser.add_argument("--matrix", choices = ["quick", "full"], default = "quick")
+    parser.add_argument("--repeat", type = int, default = 5)
+    parser.add_argument("--warmup", type = int, default = 1)
+    parser.add_argument("--filter", default = None, help = "Only run cases whose id contains this text.")
+    parser.add_argument("--output", default = None, help = "Path of the JSON results file to write.")
+    parser.add_argument("--baseline", default = None, help = "Path of a JSON results file to compare with.")
+    parser.add_argument("--tolerance", type = float, default = 0.10)
+    parser.add_argument("--fail-on-regression", action = "store_true")
+    args = parser.parse_args(argv)
+
+    from benchmarks.cases import MATRICES, Fixtures, build_cases
+    from benchmarks.server import ACCESS_KEY, SECRET_KEY, local_s3_server
+    from minio_extensions import __version__
+    from minio_extensions.providers import ClientBuilder
+
+    server = contextlib.nullcontext(("memory", None)) if args.server == "memory" else local_s3_server(args.server)
+
+    with server as (server_kind, endpoint):
+        if endpoint is None:
+            client = ClientBuilder("memory").configure()
+        else:
+            os.environ.update({
+                "MINIO_S3_ENDPOINT_URL": endpoint,
+                "MINIO_S3_USERNAME": ACCESS_KEY,
+                "MINIO_S3_PASSWORD": SECRET_KEY,
+                "MINIO_S3_CHECK_CERTIFICATES": "false",
+                "MINIO_S3_IGNORE_SECURE_CONNECTION": "true"
+            })
+            client = ClientBuilder("env", is_proxy_conn = False, pool_maxsize = 32).configure()
+
+        fixtures = Fixtures(client)
+
+        try:
+            cases = [c for c in build_cases(fixtures, MATRICES[args.matrix])
+                     if args.filter is None or args.filter in c.id]
+            results = {}
+
+            for case in cases:
+                results[case.id] = result = measure(case, args.repeat, args.warmup)
+                print(f"{case.id:<70} median {result['median_s'] * 1000:10.2f} ms", file = sys.stderr)
+        finally:
+            fixtures.close()
+
+    current = {
+        "format": RESULTS_FORMAT_VERSION,
+        "meta": {
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "package_version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "server": server_kind,
+            "matrix": args.matrix,
+            "repeat": args.repeat,
+            "warmup": args.warmup
+        },
+        "results": results
+    }
+
+    if args.output is not None:
+        with open(args.output, "w") as fo:
+            json.dump(current, fo, indent = 2, sort_keys = True)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, "r") as fb:
+        baseline = json.load(fb)
+
+    rows = compare(current, baseline, args.tolerance)
+    regressions = [row for row in rows if row["regressed"]]
+
+    for row in rows:
+        flag = "REGRESSED" if row["regressed"] else ""
+        print(f"{row['case']:<70} latency {_format_ratio(row['latency_ratio'])} "
+              f"throughput {_format_ratio(row['throughput_ratio'])} {flag}")
+
+    print(f"{len(regressions)} regression(s) out of {len(rows)} compared case(s) "
+          f"with a {args.tolerance:.0%} tolerance.")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
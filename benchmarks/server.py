@@ -0,0 +1,103 @@
+import os
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from minio_extensions._typing import Optional
+
+ACCESS_KEY = "benchmark"
+SECRET_KEY = "benchmark-secret"
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_until_ready(url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout = 1)
+            return
+        except Exception:
+            time.sleep(0.1)
+
+    raise TimeoutError(f"Local S3 server at {url} did not start in {timeout} seconds.")
+
+
+@contextmanager
+def _minio_server(binary: str):
+    port = _free_port()
+    data_dir = tempfile.mkdtemp(prefix = "minio-extensions-bench-")
+    environment = dict(os.environ, MINIO_ROOT_USER = ACCESS_KEY, MINIO_ROOT_PASSWORD = SECRET_KEY,
+                       MINIO_API_SELECT_PARQUET = "on")
+    process = subprocess.Popen([binary, "server", data_dir, "--address", f"127.0.0.1:{port}", "--quiet"],
+                               env = environment, stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL)
+    try:
+        _wait_until_ready(f"http://127.0.0.1:{port}/minio/health/live")
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.wait(timeout = 30)
+        shutil.rmtree(data_dir, ignore_errors = True)
+
+
+@contextmanager
+def _moto_server():
+    import logging
+    from moto.server import ThreadedMotoServer
+
+    # Request logs of the embedded werkzeug server would drown the benchmark output. werkzeug installs its own
+    # handler and only sets a level on a logger left unset, so the logger is disabled instead of raising its level
+    werkzeug_logger, moto_logger = logging.getLogger("werkzeug"), logging.getLogger("moto")
+    werkzeug_disabled, moto_level = werkzeug_logger.disabled, moto_logger.level
+    werkzeug_logger.disabled = True
+    moto_logger.setLevel(logging.ERROR)
+
+    port = _free_port()
+    server = ThreadedMotoServer(ip_address = "127.0.0.1", port = port, verbose = False)
+    server.start()
+    try:
+        _wait_until_ready(f"http://127.0.0.1:{port}/moto-api/")
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.stop()
+        werkzeug_logger.disabled = werkzeug_disabled
+        moto_logger.setLevel(moto_level)
+
+
+@contextmanager
+def local_s3_server(kind: Optional[str] = None):
+    """
+    Starts an S3 compatible server listening on loopback and yields its kind and endpoint url.
+
+    A MinIO binary found on MINIO_BINARY or on PATH is preferred since it behaves like production servers.
+    The in-process moto server is used otherwise, when installed.
+    """
+    binary = os.environ.get("MINIO_BINARY") or shutil.which("minio")
+
+    if kind in (None, "minio") and binary is not None:
+        with _minio_server(binary) as endpoint:
+            yield "minio", endpoint
+        return
+
+    if kind in (None, "moto"):
+        try:
+            import moto.server
+        except ImportError:
+            if kind == "moto":
+                raise
+        else:
+            with _moto_server() as endpoint:
+                yield "moto", endpoint
+            return
+
+    raise RuntimeError("No local S3 server available. Install a minio binary on PATH or set MINIO_BINARY, "
+                       "or install moto[server].")
@@ -22,6 +22,8 @@ client = builder.configure()
 
 # The same client can also be generated from environment through a direct call to MinioExtensions.create_provider()
 # In this case is not specified any arguments since it already considers the "env" as default option.
+# Clients returned by create_provider are shared by the whole process for the same configuration, so calling it
+# again, or from forked worker processes, reuses the configuration already loaded and keeps connections warm.
 #client = MinioExtensions.create_provider()
 
 print(client.bucket_exists("sample-bucket"))
@@ -0,0 +1,20 @@
+import pyarrow.parquet as pq
+from minio_extensions.extensions import MinioExtensions
+from minio_extensions.providers import ClientBuilder
+from dotenv import load_dotenv
+
+load_dotenv()
+
+builder = ClientBuilder("env", is_proxy_conn = False)
+client = builder.configure()
+
+sample_bucket = "my-bucket"
+sample_object_name = "data/orders.parquet"
+
+# Only the parquet footer and the chunks of the selected columns are fetched from the bucket
+with MinioExtensions.open_object_file(client = client,
+                                      bucket_name = sample_bucket,
+                                      object_name = sample_object_name) as file:
+    table = pq.read_table(file, columns = ["order_id", "amount"])
+    
+    print(table.num_rows, f"{file.bytes_fetched} of {file.size} bytes fetched in {file.requests} requests")
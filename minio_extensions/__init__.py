@@ -2,17 +2,33 @@ from .metadata.metadata import (
     ObjectMetadata,
     ObjectMetadataInfo,
     VersionMetadata,
-    TagMetadata
+    TagMetadata,
+    VersionIndex
 )
 
 from .extensions import MinioExtensions
+from .session import MinioSession
+from .aio import AsyncMinioExtensions
+from .inventory import BucketInventory
+from .backends import MemoryBackend, LocalDirectoryBackend
+from .registry import ClientRegistry
+from .table import ObjectTable, ObjectRecord
 
 __all__ = [
     "MinioExtensions",
+    "MinioSession",
+    "AsyncMinioExtensions",
+    "BucketInventory",
+    "MemoryBackend",
+    "LocalDirectoryBackend",
+    "ClientRegistry",
+    "ObjectTable",
+    "ObjectRecord",
     "VersionMetadata",
     "ObjectMetadata",
     "ObjectMetadataInfo",
-    "TagMetadata"
+    "TagMetadata",
+    "VersionIndex"
 ]
 
 __version__ = "0.1.2"
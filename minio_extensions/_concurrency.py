@@ -0,0 +1,126 @@
+import threading
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait
+)
+from contextlib import contextmanager
+
+from minio_extensions._typing import (
+    Optional,
+    Iterable,
+    Iterator,
+    Callable,
+    Tuple,
+    Any
+)
+
+from minio_extensions.environment import (
+    MINIO_S3_TRANSFER_MAX_WORKERS,
+    MINIO_S3_TRANSFER_MAX_BYTES_IN_FLIGHT
+)
+
+
+def resolve_max_workers(max_workers: Optional[int] = None) -> int:
+    """
+    Resolves the number of workers to use on a single call, bounded by the process wide limit
+    defined through MINIO_S3_TRANSFER_MAX_WORKERS.
+    """
+    limit = MINIO_S3_TRANSFER_MAX_WORKERS.get()
+
+    if max_workers is None:
+        return max(1, limit)
+
+    if max_workers < 1:
+        raise ValueError("The number of workers must be greater than zero.")
+
+    return max(1, min(max_workers, limit))
+
+
+def resolve_max_bytes_in_flight(max_bytes_in_flight: Optional[int] = None) -> int:
+    """
+    Resolves the amount of bytes allowed in flight for a single call falling back to
+    MINIO_S3_TRANSFER_MAX_BYTES_IN_FLIGHT when not specified.
+    """
+    if max_bytes_in_flight is None:
+        return MINIO_S3_TRANSFER_MAX_BYTES_IN_FLIGHT.get()
+
+    if max_bytes_in_flight < 1:
+        raise ValueError("The amount of bytes in flight must be greater than zero.")
+
+    return max_bytes_in_flight
+
+
+class ByteBudget:
+    """
+    Counting limiter for the amount of bytes being transferred at the same time.
+
+    A reservation larger than the whole budget is still granted once nothing else is in flight,
+    so oversized objects are transferred alone instead of blocking forever.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self, size: int):
+        size = max(0, size)
+        with self._condition:
+            while self._in_flight > 0 and self._in_flight + size > self._limit:
+                self._condition.wait()
+            self._in_flight += size
+
+    def release(self, size: int):
+        size = max(0, size)
+        with self._condition:
+            self._in_flight -= size
+            self._condition.notify_all()
+
+    @contextmanager
+    def reserve(self, size: int):
+        self.acquire(size)
+        try:
+            yield
+        finally:
+            self.release(size)
+
+
+def iter_completed(func: Callable[[Any], Any],
+                   items: Iterable[Any],
+                   max_workers: int) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+    """
+    Runs func over items on a bounded thread pool yielding (item, result, error) tuples as soon as
+    each call finishes. Items are consumed lazily so only a small window of calls is pending at once,
+    and a failure on one item never prevents the remaining ones from running.
+    """
+    items = iter(items)
+    window = max_workers * 2
+
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        pending = {}
+
+        def _fill():
+            while len(pending) < window:
+                try:
+                    item = next(items)
+                except StopIteration:
+                    return
+                pending[executor.submit(func, item)] = item
+
+        try:
+            _fill()
+            while pending:
+                done, _ = wait(pending, return_when = FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    error = future.exception()
+                    yield item, None if error is not None else future.result(), error
+                _fill()
+        finally:
+            for future in pending:
+                future.cancel()
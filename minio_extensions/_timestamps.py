@@ -0,0 +1,75 @@
+import calendar
+import datetime
+import email.utils
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Iterable
+)
+
+# Marks missing timestamps on epoch microsecond columns, the same value NumPy reads as NaT
+MISSING_TIMESTAMP = -2 ** 63
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo = datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds = 1)
+
+_MONTHS = {name: i for i, name in enumerate(["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                                              "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], 1)}
+
+
+def datetime_to_epoch_us(value: Optional[datetime.datetime]) -> int:
+    """
+    Converts a datetime to microseconds since epoch. Naive datetimes are taken as UTC.
+    """
+    if value is None:
+        return MISSING_TIMESTAMP
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo = datetime.timezone.utc)
+
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def epoch_us_to_datetime(value: int) -> Optional[datetime.datetime]:
+    if value == MISSING_TIMESTAMP:
+        return None
+    return _EPOCH + datetime.timedelta(microseconds = value)
+
+
+def parse_http_date(value: str) -> datetime.datetime:
+    """
+    Parses an HTTP date header value, like ``Sat, 17 Oct 2026 13:10:06 GMT``, into a naive UTC datetime.
+
+    The fixed length format sent by S3 servers is parsed by position, several times faster than strptime,
+    falling back to the generic parser on any other format.
+    """
+    if len(value) == 29 and value.endswith(" GMT") and (month := _MONTHS.get(value[8:11])) is not None:
+        return datetime.datetime(int(value[12:16]), month, int(value[5:7]),
+                                 int(value[17:19]), int(value[20:22]), int(value[23:25]))
+
+    return email.utils.parsedate_to_datetime(value).astimezone(datetime.timezone.utc).replace(tzinfo = None)
+
+
+def parse_http_dates(values: Iterable[Optional[str]]) -> List[int]:
+    """
+    Parses a batch of HTTP date header values into microseconds since epoch, MISSING_TIMESTAMP for missing
+    values. Objects written together share their modification second, so each distinct value is parsed once.
+    """
+    parsed: Dict[str, int] = {}
+    result = []
+
+    for value in values:
+        if value is None:
+            result.append(MISSING_TIMESTAMP)
+            continue
+
+        timestamp = parsed.get(value)
+
+        if timestamp is None:
+            timestamp = parsed[value] = calendar.timegm(parse_http_date(value).timetuple()) * 1000000
+
+        result.append(timestamp)
+
+    return result
@@ -8,7 +8,13 @@ from typing import (
     Union,
     Dict,
     Any,
-    Tuple
+    Tuple,
+    Iterable,
+    Iterator,
+    Callable,
+    Awaitable,
+    Deque,
+    Set
 )
 
 from typing_extensions import Annotated
@@ -22,6 +28,9 @@ IntStr = Union[PosInt, str]
 # Object tagging dupplicate handling options
 TagDuplicateOptions = Literal["raise", "preserve", "append"]
 
+# Bulk object tagging operations
+TagOperationOptions = Literal["set", "merge", "remove"]
+
 # Object versioning handling options
 VersionLike = Union[Literal["first","latest"], "IntStr"]
 
@@ -0,0 +1,335 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+
+from minio import Minio
+
+from minio_extensions._concurrency import resolve_max_workers
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Type,
+    Any,
+    Iterable,
+    Awaitable,
+    Union,
+    Tuple,
+    Set
+)
+from minio_extensions.environment import (
+    MINIO_S3_TRANSFER_CHUNK_SIZE,
+    MINIO_S3_HTTP_POOL_MAXSIZE
+)
+from minio_extensions.exceptions import (
+    BatchOperationException,
+    InvalidBucketException,
+    TransferCancelledException
+)
+from minio_extensions.extensions import MinioExtensions
+from minio_extensions.metadata.metadata import (
+    ObjectMetadata,
+    ObjectMetadataInfo
+)
+from minio_extensions.registry import CLIENT_REGISTRY
+from minio_extensions.session import _takes_client
+
+
+class _CancellationProgress:
+    """
+    Progress tracker aborting the transfer it is attached to once its cancellation event is set.
+    """
+
+    def __init__(self, cancelled: threading.Event) -> None:
+        self._cancelled = cancelled
+
+    def set_meta(self, object_name: str, total_length: int):
+        self._check()
+
+    def update(self, length: int):
+        self._check()
+
+    def _check(self):
+        if self._cancelled.is_set():
+            raise TransferCancelledException("Transfer cancelled by the awaiting task.")
+
+
+class AsyncMinioExtensions:
+    """
+    asyncio counterpart of MinioExtensions.
+
+    Blocking client calls run on a bounded thread pool shared by every coroutine of the instance, so the event
+    loop is never blocked and the number of requests in flight never exceeds ``max_concurrency``. The client
+    created when none is given keeps at least ``max_concurrency`` pooled connections, while a client passed in
+    should be built with a pool at least as large to keep its connections warm. Cancelling an awaiting task
+    aborts its transfer between chunks, closing the response or aborting the multipart upload.
+
+    Every other MinioExtensions operation is also available as a coroutine running off the event loop, with the
+    client bound when the operation takes one, e.g. ``await extensions.get_object(bucket = "bucket",
+    file_name = "file")``.
+    """
+
+    def __init__(self, client: Optional[Type[Minio]] = None, max_concurrency: Optional[int] = None) -> None:
+        self._max_concurrency = resolve_max_workers(max_concurrency)
+        self._client = client if client is not None else CLIENT_REGISTRY.get(
+            "env", is_proxy_conn = False,
+            pool_maxsize = max(self._max_concurrency, MINIO_S3_HTTP_POOL_MAXSIZE.get() or resolve_max_workers()))
+        self._executor = ThreadPoolExecutor(max_workers = self._max_concurrency,
+                                            thread_name_prefix = "minio-extensions")
+        self._futures: Set[Future] = set()
+
+    @property
+    def client(self) -> Type[Minio]:
+        return self._client
+
+    async def close(self):
+        # Calls still queued are cancelled by hand, as shutdown only cancels them from Python 3.9
+        for future in list(self._futures):
+            future.cancel()
+
+        self._executor.shutdown(wait = False)
+
+    async def __aenter__(self) -> "AsyncMinioExtensions":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _run(self, func, *args, cancelled: Optional[threading.Event] = None, **kwargs):
+        future = self._executor.submit(functools.partial(func, *args, **kwargs))
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.set()
+            raise
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        operation = getattr(MinioExtensions, name)
+
+        if not _takes_client(operation):
+            @functools.wraps(operation)
+            async def _operation(*args, **kwargs):
+                return await self._run(operation, *args, **kwargs)
+        else:
+            @functools.wraps(operation)
+            async def _operation(*args, **kwargs):
+                return await self._run(operation, self._client, *args, **kwargs)
+
+        return _operation
+
+    async def load_file_from_bucket(self, bucket_name: Optional[str] = None,
+                                    object_name: Optional[str] = None,
+                                    version_id: Optional[str] = None) -> BytesIO:
+        """
+        Asynchronously reads an object from bucket into memory.
+
+        Args:
+            bucket_name: Name of the bucket to read the object from.
+            object_name: Fully qualified name of the object inside the bucket.
+            version_id: Version ID of the object to read. Defaults to the latest version.
+
+        Returns:
+            Bytes object of the file that was loaded from the bucket.
+        """
+        cancelled = threading.Event()
+
+        def _read():
+            file_io = BytesIO()
+            chunk_size = MINIO_S3_TRANSFER_CHUNK_SIZE.get()
+
+            with MinioExtensions.open_object(self._client, bucket_name = bucket_name, object_name = object_name,
+                                             version_id = version_id) as reader:
+                while chunk := reader.read(chunk_size):
+                    if cancelled.is_set():
+                        raise TransferCancelledException("Transfer cancelled by the awaiting task.")
+                    file_io.write(chunk)
+
+            file_io.seek(0)
+            return file_io
+
+        return await self._run(_read, cancelled = cancelled)
+
+    async def fload_file_from_bucket(self, bucket_name: Optional[str] = None,
+                                     object_name: Optional[str] = None,
+                                     version_id: Optional[str] = None,
+                                     **kwargs):
+        """
+        Asynchronous counterpart of MinioExtensions.fload_file_from_bucket. Cancelling the awaiting task aborts
+        the download.
+        """
+        cancelled = threading.Event()
+        return await self._run(MinioExtensions.fload_file_from_bucket, self._client,
+                               bucket_name = bucket_name, object_name = object_name, version_id = version_id,
+                               progress = _CancellationProgress(cancelled), cancelled = cancelled, **kwargs)
+
+    async def upload_object(self, bucket: Optional[str] = None, object_name: Optional[str] = None,
+                            local_path: Optional[str] = None, content_type: Optional[str] = None,
+                            metadata: Optional[ObjectMetadata] = None,
+                            **kwargs):
+        """
+        Asynchronous counterpart of MinioExtensions.upload_object. Cancelling the awaiting task aborts the
+        upload, including any multipart upload already started.
+        """
+        cancelled = threading.Event()
+        return await self._run(MinioExtensions.upload_object, self._client,
+                               bucket = bucket, object_name = object_name, local_path = local_path,
+                               content_type = content_type, metadata = metadata,
+                               progress = _CancellationProgress(cancelled), cancelled = cancelled, **kwargs)
+
+    async def list_files_from_bucket(self, bucket: Optional[str], prefix: Optional[str] = None,
+                                     recurse: Optional[bool] = False,
+                                     include_versions: Optional[bool] = False,
+                                     include_metadata: Optional[bool] = False,
+                                     parallel: Optional[bool] = False,
+                                     max_workers: Optional[int] = None,
+                                     ordered: Optional[bool] = True) -> List[Any]:
+        """
+        Asynchronously lists the files of a bucket, paginating the listing off the event loop.
+        """
+        return await self._run(lambda: list(MinioExtensions.list_files_from_bucket(
+            self._client,
+            bucket = bucket,
+            prefix = prefix,
+            recurse = recurse,
+            include_versions = include_versions,
+            include_metadata = include_metadata,
+            parallel = parallel,
+            max_workers = max_workers,
+            ordered = ordered
+        )))
+
+    async def stat_object(self, bucket: Optional[str] = None, object_name: Optional[str] = None,
+                          version_id: Optional[str] = None):
+        return await self._run(self._client.stat_object, bucket_name = bucket, object_name = object_name,
+                               version_id = version_id)
+
+    async def get_object_tags(self, bucket: Optional[str] = None, object_name: Optional[str] = None,
+                              version_id: Optional[str] = None):
+        return await self._run(self._client.get_object_tags, bucket_name = bucket, object_name = object_name,
+                               version_id = version_id)
+
+    async def set_object_tags(self, bucket: Optional[str] = None, object_name: Optional[str] = None,
+                              tags = None, version_id: Optional[str] = None):
+        return await self._run(self._client.set_object_tags, bucket_name = bucket, object_name = object_name,
+                               tags = tags, version_id = version_id)
+
+    async def get_objects(self, bucket: Optional[str] = None,
+                          files: Optional[Iterable[str]] = None,
+                          errors: Optional[Dict[str, BaseException]] = None) -> Dict[str, BytesIO]:
+        """
+        Concurrently reads multiple objects from bucket into memory, in the same shape returned by
+        MinioExtensions.get_objects.
+
+        Args:
+            bucket: The bucket to retrieve the files from.
+            files: Fully qualified names of the files to retrieve.
+            errors: Optional dictionary collecting the exception raised for each file that could not be
+                downloaded. When not provided, failures are raised as a BatchOperationException once every
+                transfer has finished.
+
+        Returns:
+            A dictionary containing the files and their contents as BytesIO objects.
+        """
+        if not await self.check_bucket_exists(bucket = bucket):
+            raise ValueError(f"Bucket {bucket} specified does not exists on provider.")
+
+        names = [getattr(f, "object_name", f) for f in files or []]
+        results = await self.gather(*[self.load_file_from_bucket(bucket_name = bucket, object_name = name)
+                                      for name in names])
+
+        objects: Dict[str, BytesIO] = {}
+        failures: Dict[str, BaseException] = errors if errors is not None else {}
+
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                failures[name] = result
+            else:
+                objects[name.split("/")[-1]] = result
+
+        if errors is None and len(failures) > 0:
+            raise BatchOperationException(
+                f"Failed to retrieve {len(failures)} object(s) from bucket {bucket}.",
+                results = objects,
+                errors = failures)
+
+        return objects
+
+    async def get_objects_metadata(self, bucket: Optional[str] = None,
+                                   files: Optional[Iterable[Union[str, Tuple[str, Optional[str]]]]] = None,
+                                   prefix: Optional[str] = None,
+                                   include_versions: bool = False,
+                                   errors: Optional[Dict[Tuple[str, Optional[str]], BaseException]] = None
+                                   ) -> List[ObjectMetadataInfo]:
+        """
+        Concurrently retrieves the metadata of multiple objects, skipping the tags request of untagged objects as
+        MinioExtensions.get_objects_metadata does.
+
+        Args:
+            bucket: Bucket where the objects are stored.
+            files: Fully qualified names of the objects, or (name, version_id) pairs of specific object versions.
+            prefix: Retrieves the metadata of every object under the prefix. Can be combined with files.
+            include_versions: Whether to retrieve the metadata of every version of the objects under prefix.
+            errors: Optional dictionary collecting the exception raised for each (name, version_id) whose metadata
+                could not be retrieved. When not provided, failures are raised as a BatchOperationException once
+                every request has finished.
+
+        Returns:
+            Metadata of each object retrieved, in the order of files followed by the objects under prefix.
+        """
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+
+        if files is None and prefix is None:
+            raise ValueError("Either files or prefix must be specified to retrieve objects metadata from bucket.")
+
+        if not await self.check_bucket_exists(bucket = bucket):
+            raise ValueError(f"Bucket {bucket} specified does not exists on provider.")
+
+        targets = await self._run(lambda: list(MinioExtensions._metadata_targets(
+            self._client, bucket = bucket, files = files, prefix = prefix, include_versions = include_versions)))
+        results = await self.gather(*[self.get_object_metadata(bucket = bucket, object_name = name,
+                                                               version_id = version_id)
+                                      for name, version_id in targets])
+
+        infos: List[ObjectMetadataInfo] = []
+        failures: Dict[Tuple[str, Optional[str]], BaseException] = errors if errors is not None else {}
+
+        for (name, version_id), result in zip(targets, results):
+            if isinstance(result, BaseException):
+                failures[(name, version_id)] = result
+                continue
+
+            info = ObjectMetadataInfo.from_meta(result)
+            info.object_name = name
+            infos.append(info)
+
+        if errors is None and len(failures) > 0:
+            raise BatchOperationException(
+                f"Failed to retrieve the metadata of {len(failures)} object(s) from bucket {bucket}.",
+                results = {},
+                errors = failures)
+
+        return infos
+
+    @staticmethod
+    async def gather(*operations: Awaitable[Any]) -> List[Any]:
+        """
+        Runs operations concurrently returning their results in order, with the exception raised by each
+        failed operation in place of its result. Cancelling the gathering task cancels every operation.
+        """
+        tasks = [asyncio.ensure_future(op) for op in operations]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions = True)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions = True)
+            raise
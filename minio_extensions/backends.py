@@ -0,0 +1,893 @@
+import datetime
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+
+from minio import S3Error, ServerError
+from minio.commonconfig import Tags, ENABLED
+from minio.datatypes import Bucket, Object
+from minio.deleteobjects import DeleteError
+from minio.helpers import (
+    ObjectWriteResult,
+    ProgressType,
+    check_bucket_name,
+    check_non_empty_string
+)
+from minio.time import to_http_header
+from minio.versioningconfig import VersioningConfig
+from urllib3 import HTTPResponse
+from urllib3._collections import HTTPHeaderDict
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Iterable,
+    Iterator,
+    Any
+)
+from minio_extensions.environment import MINIO_S3_TRANSFER_CHUNK_SIZE
+
+# Version id of objects written while bucket versioning is not enabled
+_NULL_VERSION = "null"
+
+# Request metadata keys stored as object headers instead of user metadata
+_OBJECT_HEADERS = {
+    "cache-control",
+    "content-disposition",
+    "content-encoding",
+    "content-language",
+    "expires"
+}
+
+_USER_META_PREFIX = "x-amz-meta-"
+
+
+def _error(code: str, message: str, bucket_name: Optional[str] = None,
+           object_name: Optional[str] = None) -> S3Error:
+    resource = "/".join(p for p in ("", bucket_name, object_name) if p is not None)
+    return S3Error(None, code, message, resource, None, None, bucket_name = bucket_name, object_name = object_name)
+
+
+def _now() -> datetime.datetime:
+    # S3 listings report modification times with millisecond precision
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return now.replace(microsecond = now.microsecond // 1000 * 1000)
+
+
+def _normalize_metadata(metadata: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    normalized = {}
+
+    for key, value in (metadata or {}).items():
+        key = str(key).lower()
+        value = ",".join(str(v) for v in value) if isinstance(value, (list, tuple)) else str(value)
+
+        if key == "content-type":
+            continue
+        if not key.startswith(_USER_META_PREFIX) and key not in _OBJECT_HEADERS:
+            key = _USER_META_PREFIX + key
+
+        normalized[key] = value
+
+    return normalized
+
+
+class _Version:
+    """
+    A single object version, or delete marker, kept by a storage backend.
+    """
+
+    __slots__ = ("version_id", "etag", "size", "last_modified", "content_type", "metadata", "tags",
+                 "is_delete_marker", "data", "token")
+
+    def __init__(self, version_id: str, last_modified: datetime.datetime,
+                 etag: Optional[str] = None,
+                 size: int = 0,
+                 content_type: Optional[str] = None,
+                 metadata: Optional[Dict[str, str]] = None,
+                 tags: Optional[Dict[str, str]] = None,
+                 is_delete_marker: bool = False,
+                 token: Optional[str] = None) -> None:
+        self.version_id = version_id
+        self.last_modified = last_modified
+        self.etag = etag
+        self.size = size
+        self.content_type = content_type
+        self.metadata = metadata or {}
+        self.tags = tags or {}
+        self.is_delete_marker = is_delete_marker
+        self.data: Optional[bytes] = None
+        self.token = token
+
+    @property
+    def public_version_id(self) -> Optional[str]:
+        return None if self.version_id == _NULL_VERSION else self.version_id
+
+    def headers(self) -> HTTPHeaderDict:
+        headers = HTTPHeaderDict({
+            "Accept-Ranges": "bytes",
+            "Content-Length": str(self.size),
+            "Content-Type": self.content_type or "application/octet-stream",
+            "ETag": '"{0}"'.format(self.etag),
+            "Last-Modified": to_http_header(self.last_modified)
+        })
+
+        if self.public_version_id is not None:
+            headers["x-amz-version-id"] = self.public_version_id
+        if len(self.tags) > 0:
+            headers["x-amz-tagging-count"] = str(len(self.tags))
+
+        for key, value in self.metadata.items():
+            headers[key] = value
+
+        return headers
+
+    def as_object(self, bucket_name: str, object_name: str,
+                  is_latest: Optional[bool] = None,
+                  include_user_meta: bool = False) -> Object:
+        return Object(
+            bucket_name,
+            object_name,
+            last_modified = self.last_modified,
+            etag = self.etag,
+            size = self.size,
+            metadata = {k: v for k, v in self.metadata.items() if k.startswith(_USER_META_PREFIX)}
+            if include_user_meta else None,
+            version_id = self.version_id if is_latest is not None else None,
+            is_latest = None if is_latest is None else str(is_latest).lower(),
+            storage_class = "STANDARD",
+            is_delete_marker = self.is_delete_marker
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "version_id": self.version_id,
+            "last_modified": self.last_modified.isoformat(),
+            "etag": self.etag,
+            "size": self.size,
+            "content_type": self.content_type,
+            "metadata": self.metadata,
+            "tags": self.tags,
+            "is_delete_marker": self.is_delete_marker,
+            "token": self.token
+        }
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "_Version":
+        return cls(value["version_id"], datetime.datetime.fromisoformat(value["last_modified"]),
+                   etag = value.get("etag"),
+                   size = value.get("size", 0),
+                   content_type = value.get("content_type"),
+                   metadata = value.get("metadata"),
+                   tags = value.get("tags"),
+                   is_delete_marker = value.get("is_delete_marker", False),
+                   token = value.get("token"))
+
+
+class _Bucket:
+
+    __slots__ = ("name", "created", "versioning", "objects")
+
+    def __init__(self, name: str, created: Optional[datetime.datetime] = None,
+                 versioning: Optional[str] = None) -> None:
+        self.name = name
+        self.created = created or _now()
+        self.versioning = versioning
+        # Versions of each object name, newest first
+        self.objects: Dict[str, List[_Version]] = {}
+
+    def latest(self, object_name: str) -> Optional[_Version]:
+        versions = self.objects.get(object_name)
+
+        if not versions or versions[0].is_delete_marker:
+            return None
+        return versions[0]
+
+
+class StorageBackend:
+    """
+    Client keeping buckets and objects on a local store instead of an S3 server.
+
+    Implements the subset of the ``minio.Minio`` interface used by MinioExtensions, with the same bucket
+    versioning semantics and the same S3Error codes (NoSuchBucket, NoSuchKey, NoSuchVersion, ...), so instances
+    can be passed as the client of any MinioExtensions operation. Object versions, delete markers, tags and user
+    metadata are kept, while server side features like encryption, retention or S3 Select are not supported.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.RLock()
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        check_bucket_name(bucket_name)
+
+        with self._lock:
+            return self._find_bucket(bucket_name) is not None
+
+    def make_bucket(self, bucket_name: str, location: Optional[str] = None, object_lock: bool = False):
+        check_bucket_name(bucket_name, True)
+
+        with self._lock:
+            if self._find_bucket(bucket_name) is not None:
+                raise _error("BucketAlreadyOwnedByYou",
+                             "Your previous request to create the named bucket succeeded and you already own it.",
+                             bucket_name = bucket_name)
+
+            self._buckets[bucket_name] = self._create_bucket(bucket_name)
+
+    def remove_bucket(self, bucket_name: str):
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+
+            if len(bucket.objects) > 0:
+                raise _error("BucketNotEmpty", "The bucket you tried to delete is not empty.",
+                             bucket_name = bucket_name)
+
+            self._delete_bucket(bucket)
+            self._buckets.pop(bucket_name, None)
+
+    def list_buckets(self) -> List[Bucket]:
+        with self._lock:
+            buckets = [self._find_bucket(name) for name in sorted(self._bucket_names())]
+            return [Bucket(b.name, b.created) for b in buckets if b is not None]
+
+    def set_bucket_versioning(self, bucket_name: str, config: VersioningConfig):
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+            bucket.versioning = config.status
+            self._save_bucket(bucket)
+
+    def get_bucket_versioning(self, bucket_name: str) -> VersioningConfig:
+        with self._lock:
+            return VersioningConfig(self._get_bucket(bucket_name).versioning)
+
+    def put_object(self, bucket_name: str, object_name: str, data, length: int,
+                   content_type: str = "application/octet-stream",
+                   metadata: Optional[Dict[str, Any]] = None,
+                   sse = None,
+                   progress: Optional[ProgressType] = None,
+                   part_size: int = 0,
+                   num_parallel_uploads: int = 3,
+                   tags: Optional[Tags] = None,
+                   retention = None,
+                   legal_hold: bool = False,
+                   write_offset: Optional[int] = None) -> ObjectWriteResult:
+        payload = data.read() if length is None or length < 0 else data.read(length)
+
+        if length is not None and 0 <= length != len(payload):
+            raise ValueError(f"Expected {length} bytes to upload but the stream held {len(payload)}.")
+
+        if progress is not None:
+            progress.set_meta(object_name = object_name, total_length = len(payload))
+
+        result = self._put(bucket_name, object_name, payload, content_type, metadata, tags)
+
+        if progress is not None:
+            progress.update(len(payload))
+
+        return result
+
+    def fput_object(self, bucket_name: str, object_name: str, file_path: str,
+                    content_type: str = "application/octet-stream",
+                    metadata: Optional[Dict[str, Any]] = None,
+                    sse = None,
+                    progress: Optional[ProgressType] = None,
+                    part_size: int = 0,
+                    num_parallel_uploads: int = 3,
+                    tags: Optional[Tags] = None,
+                    retention = None,
+                    legal_hold: bool = False) -> ObjectWriteResult:
+        with open(file_path, "rb") as fb:
+            return self.put_object(bucket_name, object_name, fb, os.fstat(fb.fileno()).st_size,
+                                   content_type = content_type, metadata = metadata, progress = progress,
+                                   tags = tags)
+
+    def get_object(self, bucket_name: str, object_name: str, offset: int = 0, length: int = 0,
+                   request_headers: Optional[Dict[str, str]] = None,
+                   ssec = None,
+                   version_id: Optional[str] = None,
+                   extra_query_params: Optional[Dict[str, Any]] = None) -> HTTPResponse:
+        check_non_empty_string(object_name)
+
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+            version = self._resolve(bucket, object_name, version_id)
+            self._check_conditions(version, request_headers)
+
+            if offset > 0 and offset >= version.size:
+                raise _error("InvalidRange", "The requested range is not satisfiable.",
+                             bucket_name = bucket_name, object_name = object_name)
+
+            end = min(version.size, offset + length) if length > 0 else version.size
+            data = self._read_data(bucket, object_name, version, offset, end - offset)
+
+        headers = version.headers()
+        headers["Content-Length"] = str(len(data))
+        ranged = offset > 0 or length > 0
+
+        if ranged:
+            headers["Content-Range"] = "bytes {0}-{1}/{2}".format(offset, max(offset, end - 1), version.size)
+
+        return HTTPResponse(body = io.BytesIO(data), headers = headers, status = 206 if ranged else 200,
+                            preload_content = False, decode_content = False, request_method = "GET")
+
+    def fget_object(self, bucket_name: str, object_name: str, file_path: str,
+                    request_headers: Optional[Dict[str, str]] = None,
+                    ssec = None,
+                    version_id: Optional[str] = None,
+                    extra_query_params: Optional[Dict[str, Any]] = None,
+                    tmp_file_path: Optional[str] = None,
+                    progress: Optional[ProgressType] = None) -> Object:
+        if os.path.isdir(file_path):
+            raise ValueError(f"file {file_path} is a directory")
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+
+        stat = self.stat_object(bucket_name, object_name, version_id = version_id)
+        response = self.get_object(bucket_name, object_name, request_headers = request_headers,
+                                   version_id = stat.version_id or version_id)
+        tmp_file_path = tmp_file_path or f"{file_path}.{stat.etag}.part.minio"
+
+        try:
+            if progress is not None:
+                progress.set_meta(object_name = object_name, total_length = stat.size)
+
+            with open(tmp_file_path, "wb") as fb:
+                for chunk in response.stream(MINIO_S3_TRANSFER_CHUNK_SIZE.get()):
+                    fb.write(chunk)
+                    if progress is not None:
+                        progress.update(len(chunk))
+
+            os.replace(tmp_file_path, file_path)
+            return stat
+        finally:
+            response.close()
+            response.release_conn()
+
+    def stat_object(self, bucket_name: str, object_name: str, ssec = None,
+                    version_id: Optional[str] = None,
+                    extra_headers: Optional[Dict[str, str]] = None,
+                    extra_query_params: Optional[Dict[str, Any]] = None) -> Object:
+        check_non_empty_string(object_name)
+
+        with self._lock:
+            version = self._resolve(self._get_bucket(bucket_name), object_name, version_id)
+            self._check_conditions(version, extra_headers)
+
+        return Object(
+            bucket_name,
+            object_name,
+            last_modified = version.last_modified,
+            etag = version.etag,
+            size = version.size,
+            content_type = version.content_type,
+            metadata = version.headers(),
+            version_id = version.public_version_id
+        )
+
+    def remove_object(self, bucket_name: str, object_name: str, version_id: Optional[str] = None):
+        check_non_empty_string(object_name)
+
+        with self._lock:
+            self._remove(self._get_bucket(bucket_name), object_name, version_id)
+
+    def remove_objects(self, bucket_name: str, delete_object_list: Iterable[Any],
+                       bypass_governance_mode: bool = False) -> Iterator[DeleteError]:
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+
+        for target in delete_object_list:
+            try:
+                with self._lock:
+                    self._remove(bucket, target.name, target.version_id)
+            except S3Error as e:
+                yield DeleteError(e.code, e.message, target.name, target.version_id)
+
+    def list_objects(self, bucket_name: str, prefix: Optional[str] = None,
+                     recursive: bool = False,
+                     start_after: Optional[str] = None,
+                     include_user_meta: bool = False,
+                     include_version: bool = False,
+                     use_api_v1: bool = False,
+                     use_url_encoding_type: bool = True,
+                     fetch_owner: bool = False,
+                     extra_headers: Optional[Dict[str, str]] = None,
+                     extra_query_params: Optional[Dict[str, Any]] = None) -> Iterator[Object]:
+        prefix = prefix or ""
+
+        # The listing is taken as a snapshot, so writes made while iterating do not affect it
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+            keys = sorted(k for k in bucket.objects
+                          if k.startswith(prefix) and (start_after is None or k > start_after))
+            entries: List[Object] = []
+            common_prefixes = set()
+
+            for key in keys:
+                versions = bucket.objects[key]
+
+                if not include_version and versions[0].is_delete_marker:
+                    continue
+
+                if not recursive:
+                    delimiter = key.find("/", len(prefix))
+
+                    if delimiter >= 0:
+                        common_prefix = key[:delimiter + 1]
+                        if common_prefix not in common_prefixes:
+                            common_prefixes.add(common_prefix)
+                            entries.append(Object(bucket_name, common_prefix))
+                        continue
+
+                if include_version:
+                    entries.extend(v.as_object(bucket_name, key, is_latest = i == 0,
+                                               include_user_meta = include_user_meta)
+                                   for i, v in enumerate(versions))
+                else:
+                    entries.append(versions[0].as_object(bucket_name, key, include_user_meta = include_user_meta))
+
+        yield from entries
+
+    def get_object_tags(self, bucket_name: str, object_name: str,
+                        version_id: Optional[str] = None) -> Optional[Tags]:
+        with self._lock:
+            version = self._resolve(self._get_bucket(bucket_name), object_name, version_id)
+
+            if len(version.tags) == 0:
+                return None
+
+            tags = Tags.new_object_tags()
+            tags.update(version.tags)
+            return tags
+
+    def set_object_tags(self, bucket_name: str, object_name: str, tags: Tags, version_id: Optional[str] = None):
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+            self._resolve(bucket, object_name, version_id).tags = dict(tags)
+            self._commit(bucket, object_name)
+
+    def delete_object_tags(self, bucket_name: str, object_name: str, version_id: Optional[str] = None):
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+            self._resolve(bucket, object_name, version_id).tags = {}
+            self._commit(bucket, object_name)
+
+    def select_object_content(self, bucket_name: str, object_name: str, request):
+        raise NotImplementedError("S3 Select queries are not supported by local storage backends.")
+
+    def _get_bucket(self, bucket_name: str) -> _Bucket:
+        bucket = self._find_bucket(bucket_name)
+
+        if bucket is None:
+            raise _error("NoSuchBucket", "The specified bucket does not exist", bucket_name = bucket_name)
+        return bucket
+
+    def _resolve(self, bucket: _Bucket, object_name: str, version_id: Optional[str]) -> _Version:
+        versions = bucket.objects.get(object_name)
+
+        if version_id is None:
+            if not versions or versions[0].is_delete_marker:
+                raise _error("NoSuchKey", "The specified key does not exist.",
+                             bucket_name = bucket.name, object_name = object_name)
+            return versions[0]
+
+        for version in versions or []:
+            if version.version_id != version_id:
+                continue
+            if version.is_delete_marker:
+                raise _error("MethodNotAllowed", "The specified method is not allowed against this resource.",
+                             bucket_name = bucket.name, object_name = object_name)
+            return version
+
+        if not versions:
+            raise _error("NoSuchKey", "The specified key does not exist.",
+                         bucket_name = bucket.name, object_name = object_name)
+
+        raise _error("NoSuchVersion", "The specified version does not exist.",
+                     bucket_name = bucket.name, object_name = object_name)
+
+    @staticmethod
+    def _check_conditions(version: _Version, headers: Optional[Dict[str, str]]):
+        headers = HTTPHeaderDict(headers or {})
+
+        if (expected := headers.get("If-Match")) is not None:
+            if expected.strip() != "*" and expected.strip().strip('"') != version.etag:
+                raise _error("PreconditionFailed", "At least one of the pre-conditions you specified did not hold")
+
+        if (unexpected := headers.get("If-None-Match")) is not None:
+            if unexpected.strip() == "*" or unexpected.strip().strip('"') == version.etag:
+                raise ServerError("server failed with HTTP status code 304", 304)
+
+    def _put(self, bucket_name: str, object_name: str, data: bytes, content_type: Optional[str],
+             metadata: Optional[Dict[str, Any]], tags: Optional[Tags]) -> ObjectWriteResult:
+        check_non_empty_string(object_name)
+
+        with self._lock:
+            bucket = self._get_bucket(bucket_name)
+            self._check_object_name(bucket, object_name)
+
+            versions = bucket.objects.setdefault(object_name, [])
+            version = _Version(self._new_version_id(bucket), self._next_modified(versions),
+                               etag = hashlib.md5(data).hexdigest(),
+                               size = len(data),
+                               content_type = content_type,
+                               metadata = _normalize_metadata(metadata),
+                               tags = dict(tags or {}))
+
+            if version.version_id == _NULL_VERSION:
+                self._drop_null_version(bucket, object_name, versions)
+
+            self._write_data(bucket, object_name, version, data)
+            versions.insert(0, version)
+            self._commit(bucket, object_name)
+
+        return ObjectWriteResult(bucket_name, object_name, version.public_version_id, version.etag,
+                                 version.headers(), last_modified = version.last_modified)
+
+    def _remove(self, bucket: _Bucket, object_name: str, version_id: Optional[str]):
+        versions = bucket.objects.get(object_name)
+
+        if not versions:
+            return
+
+        if version_id is not None:
+            for i, version in enumerate(versions):
+                if version.version_id == version_id:
+                    del versions[i]
+                    self._discard_data(bucket, object_name, version)
+                    break
+            else:
+                return
+
+        elif bucket.versioning is None:
+            self._drop_null_version(bucket, object_name, versions)
+
+        else:
+            # Versioned buckets keep the removed object data behind a delete marker
+            marker = _Version(self._new_version_id(bucket), self._next_modified(versions), is_delete_marker = True)
+
+            if marker.version_id == _NULL_VERSION:
+                self._drop_null_version(bucket, object_name, versions)
+
+            versions.insert(0, marker)
+
+        if len(versions) == 0:
+            del bucket.objects[object_name]
+
+        self._commit(bucket, object_name)
+
+    def _drop_null_version(self, bucket: _Bucket, object_name: str, versions: List[_Version]):
+        for i, version in enumerate(versions):
+            if version.version_id == _NULL_VERSION:
+                del versions[i]
+                self._discard_data(bucket, object_name, version)
+                return
+
+    @staticmethod
+    def _new_version_id(bucket: _Bucket) -> str:
+        return str(uuid.uuid4()) if bucket.versioning == ENABLED else _NULL_VERSION
+
+    @staticmethod
+    def _next_modified(versions: List[_Version]) -> datetime.datetime:
+        now = _now()
+
+        # Versions written on the same millisecond still sort by modification time
+        if versions and versions[0].last_modified >= now:
+            return versions[0].last_modified + datetime.timedelta(milliseconds = 1)
+        return now
+
+    def _find_bucket(self, bucket_name: str) -> Optional[_Bucket]:
+        return self._buckets.get(bucket_name)
+
+    def _bucket_names(self) -> List[str]:
+        return list(self._buckets)
+
+    def _create_bucket(self, bucket_name: str) -> _Bucket:
+        return _Bucket(bucket_name)
+
+    def _delete_bucket(self, bucket: _Bucket):
+        pass
+
+    def _save_bucket(self, bucket: _Bucket):
+        pass
+
+    def _check_object_name(self, bucket: _Bucket, object_name: str):
+        pass
+
+    def _write_data(self, bucket: _Bucket, object_name: str, version: _Version, data: bytes):
+        raise NotImplementedError
+
+    def _read_data(self, bucket: _Bucket, object_name: str, version: _Version, offset: int, length: int) -> bytes:
+        raise NotImplementedError
+
+    def _discard_data(self, bucket: _Bucket, object_name: str, version: _Version):
+        pass
+
+    def _commit(self, bucket: _Bucket, object_name: str):
+        pass
+
+
+class MemoryBackend(StorageBackend):
+    """
+    Storage backend keeping every bucket and object in process memory.
+
+    Nothing is persisted, so each instance starts empty and its contents are lost once it is garbage collected.
+    Reads are served without any copy of the stored object data when whole objects are requested.
+    """
+
+    def _write_data(self, bucket: _Bucket, object_name: str, version: _Version, data: bytes):
+        version.data = bytes(data)
+
+    def _read_data(self, bucket: _Bucket, object_name: str, version: _Version, offset: int, length: int) -> bytes:
+        return version.data[offset:offset + length]
+
+
+class LocalDirectoryBackend(StorageBackend):
+    """
+    Storage backend keeping each bucket as a directory under a root folder.
+
+    The latest version of every object is available as a regular file at ``<root>/<bucket>/<object name>``, so
+    buckets can be inspected with any file tool. Object versions, tags and metadata are kept under the
+    ``<root>/.minio-extensions-state`` folder. Files already present on a bucket directory when it is first accessed
+    are imported as objects, which allows seeding buckets by copying fixture files into them.
+
+    Like MinIO on a single drive, an object can not be named after a folder of other objects, nor inside an
+    object name. The root folder must not be shared by backends of concurrent processes.
+    """
+
+    _STATE_FOLDER = ".minio-extensions-state"
+
+    def __init__(self, root: str) -> None:
+        super().__init__()
+        self._root = os.path.abspath(root)
+        os.makedirs(os.path.join(self._root, self._STATE_FOLDER), exist_ok = True)
+
+    @property
+    def root(self) -> str:
+        return self._root
+
+    def _bucket_path(self, bucket_name: str) -> str:
+        return os.path.join(self._root, bucket_name)
+
+    def _state_path(self, bucket_name: str, *parts: str) -> str:
+        return os.path.join(self._root, self._STATE_FOLDER, bucket_name, *parts)
+
+    def _object_path(self, bucket_name: str, object_name: str) -> str:
+        return os.path.join(self._bucket_path(bucket_name), *object_name.rstrip("/").split("/"))
+
+    def _blob_path(self, bucket_name: str, version: _Version) -> str:
+        return self._state_path(bucket_name, "blobs", version.token)
+
+    def _catalog_path(self, bucket_name: str, object_name: str) -> str:
+        return self._state_path(bucket_name, "objects",
+                                hashlib.sha1(object_name.encode("utf-8")).hexdigest() + ".json")
+
+    def _find_bucket(self, bucket_name: str) -> Optional[_Bucket]:
+        bucket = self._buckets.get(bucket_name)
+
+        if bucket is not None:
+            return bucket
+
+        try:
+            check_bucket_name(bucket_name)
+        except ValueError:
+            return None
+
+        if not os.path.isdir(self._bucket_path(bucket_name)):
+            return None
+
+        bucket = self._buckets[bucket_name] = self._load_bucket(bucket_name)
+        return bucket
+
+    def _bucket_names(self) -> List[str]:
+        names = []
+
+        for name in os.listdir(self._root):
+            try:
+                check_bucket_name(name)
+            except ValueError:
+                continue
+            if os.path.isdir(self._bucket_path(name)):
+                names.append(name)
+
+        return names
+
+    def _create_bucket(self, bucket_name: str) -> _Bucket:
+        bucket = _Bucket(bucket_name)
+        os.makedirs(self._bucket_path(bucket_name), exist_ok = True)
+        os.makedirs(self._state_path(bucket_name, "objects"), exist_ok = True)
+        os.makedirs(self._state_path(bucket_name, "blobs"), exist_ok = True)
+        self._save_bucket(bucket)
+        return bucket
+
+    def _delete_bucket(self, bucket: _Bucket):
+        shutil.rmtree(self._state_path(bucket.name), ignore_errors = True)
+        shutil.rmtree(self._bucket_path(bucket.name), ignore_errors = True)
+
+    def _save_bucket(self, bucket: _Bucket):
+        self._write_json(self._state_path(bucket.name, "bucket.json"), {
+            "created": bucket.created.isoformat(),
+            "versioning": bucket.versioning
+        })
+
+    def _load_bucket(self, bucket_name: str) -> _Bucket:
+        config_path = self._state_path(bucket_name, "bucket.json")
+        config = {}
+
+        if os.path.isfile(config_path):
+            with open(config_path, "r") as fc:
+                config = json.load(fc)
+
+        bucket = _Bucket(bucket_name,
+                         created = datetime.datetime.fromisoformat(config["created"]) if "created" in config else None,
+                         versioning = config.get("versioning"))
+
+        os.makedirs(self._state_path(bucket_name, "objects"), exist_ok = True)
+        os.makedirs(self._state_path(bucket_name, "blobs"), exist_ok = True)
+
+        if "created" not in config:
+            self._save_bucket(bucket)
+
+        for entry in os.scandir(self._state_path(bucket_name, "objects")):
+            if not entry.name.endswith(".json"):
+                continue
+            with open(entry.path, "r") as fc:
+                record = json.load(fc)
+            bucket.objects[record["object_name"]] = [_Version.from_json(v) for v in record["versions"]]
+
+        self._import_files(bucket)
+        return bucket
+
+    def _import_files(self, bucket: _Bucket):
+        root = self._bucket_path(bucket.name)
+
+        for directory, _, files in os.walk(root):
+            for file_name in files:
+                path = os.path.join(directory, file_name)
+                object_name = os.path.relpath(path, root).replace(os.sep, "/")
+
+                if bucket.latest(object_name) is not None:
+                    continue
+
+                versions = bucket.objects.setdefault(object_name, [])
+                stat = os.stat(path)
+                version = _Version(self._new_version_id(bucket),
+                                   datetime.datetime.fromtimestamp(stat.st_mtime, datetime.timezone.utc),
+                                   etag = self._file_md5(path),
+                                   size = stat.st_size,
+                                   token = uuid.uuid4().hex)
+
+                if version.version_id == _NULL_VERSION:
+                    self._drop_null_version(bucket, object_name, versions)
+
+                self._link(path, self._blob_path(bucket.name, version))
+                versions.insert(0, version)
+                self._write_catalog(bucket, object_name)
+
+    def _check_object_name(self, bucket: _Bucket, object_name: str):
+        components = object_name.rstrip("/").split("/")
+
+        if "\x00" in object_name or any(c in ("", ".", "..") for c in components):
+            raise _error("XMinioInvalidObjectName", "Object name contains unsupported characters.",
+                         bucket_name = bucket.name, object_name = object_name)
+
+        # Folder objects are folders themselves, so every component of their name is a parent folder
+        parents = len(components) if object_name.endswith("/") else len(components) - 1
+
+        for i in range(1, parents + 1):
+            if bucket.latest("/".join(components[:i])) is not None:
+                raise _error("XMinioParentIsObject", "Object-prefix is already an object, please choose a "
+                                                     "different object-prefix name.",
+                             bucket_name = bucket.name, object_name = object_name)
+
+        if not object_name.endswith("/") and os.path.isdir(self._object_path(bucket.name, object_name)):
+            raise _error("XMinioObjectExistsAsDirectory", "Object name already exists as a directory.",
+                         bucket_name = bucket.name, object_name = object_name)
+
+    def _write_data(self, bucket: _Bucket, object_name: str, version: _Version, data: bytes):
+        version.token = uuid.uuid4().hex
+
+        with open(self._blob_path(bucket.name, version), "wb") as fb:
+            fb.write(data)
+
+    def _read_data(self, bucket: _Bucket, object_name: str, version: _Version, offset: int, length: int) -> bytes:
+        with open(self._blob_path(bucket.name, version), "rb") as fb:
+            fb.seek(offset)
+            return fb.read(length)
+
+    def _discard_data(self, bucket: _Bucket, object_name: str, version: _Version):
+        if version.token is None:
+            return
+        try:
+            os.remove(self._blob_path(bucket.name, version))
+        except FileNotFoundError:
+            pass
+
+    def _commit(self, bucket: _Bucket, object_name: str):
+        self._write_catalog(bucket, object_name)
+
+        path = self._object_path(bucket.name, object_name)
+        latest = bucket.latest(object_name)
+
+        if object_name.endswith("/"):
+            if latest is not None:
+                os.makedirs(path, exist_ok = True)
+            else:
+                self._prune(bucket, path)
+            return
+
+        if os.path.lexists(path):
+            os.remove(path)
+
+        if latest is not None:
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+            self._link(self._blob_path(bucket.name, latest), path)
+        else:
+            self._prune(bucket, os.path.dirname(path))
+
+    def _write_catalog(self, bucket: _Bucket, object_name: str):
+        path = self._catalog_path(bucket.name, object_name)
+        versions = bucket.objects.get(object_name)
+
+        if not versions:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            return
+
+        self._write_json(path, {"object_name": object_name, "versions": [v.to_json() for v in versions]})
+
+    def _prune(self, bucket: _Bucket, directory: str):
+        # Removes the folders left empty by removed objects, unless they are folder objects themselves
+        root = self._bucket_path(bucket.name)
+
+        while directory != root and directory.startswith(root):
+            folder = os.path.relpath(directory, root).replace(os.sep, "/") + "/"
+
+            if bucket.latest(folder) is not None:
+                return
+            try:
+                os.rmdir(directory)
+            except OSError:
+                return
+
+            directory = os.path.dirname(directory)
+
+    @staticmethod
+    def _write_json(path: str, value: Dict[str, Any]):
+        # Written to a sibling file first so readers never see a partially written document
+        fd, tmp_path = tempfile.mkstemp(dir = os.path.dirname(path), suffix = ".tmp")
+        try:
+            with os.fdopen(fd, "w") as fo:
+                json.dump(value, fo)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _link(source: str, target: str):
+        # Hard links share the stored data with the bucket file, copies are only made where links are unsupported
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+
+    @staticmethod
+    def _file_md5(path: str) -> str:
+        digest = hashlib.md5()
+        chunk_size = MINIO_S3_TRANSFER_CHUNK_SIZE.get()
+
+        with open(path, "rb") as fb:
+            while chunk := fb.read(chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,368 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+from minio.datatypes import Object
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    Tuple,
+    Any
+)
+
+from minio_extensions.environment import (
+    MINIO_S3_METADATA_CACHE_MAX_ENTRIES,
+    MINIO_S3_METADATA_CACHE_TTL,
+    MINIO_S3_DISK_CACHE_DIR,
+    MINIO_S3_DISK_CACHE_MAX_BYTES
+)
+from minio_extensions.instrumentation import record_cache_lookup
+
+CacheKey = Tuple[str, str, Optional[str]]
+
+
+class CacheEntry:
+    """
+    Represents a cached object metadata entry.
+    """
+
+    __slots__ = ("value", "etag", "expires_at")
+
+    def __init__(self, value: Dict[str, Any], etag: Optional[str], expires_at: Optional[float]) -> None:
+        self.value = value
+        self.etag = etag
+        self.expires_at = expires_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at is None or time.monotonic() < self.expires_at
+
+
+class MetadataCache:
+    """
+    In-process, size bounded LRU cache for object metadata keyed by (bucket, object_name, version_id).
+
+    Entries of pinned version ids are immutable on server side and never expire, while entries of the latest
+    object version are trusted for ``ttl`` seconds and then revalidated by ETag. Tags are fetched again on
+    revalidation whenever the object was or is now tagged, since tagging an object leaves its ETag untouched.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        self._max_entries = max_entries if max_entries is not None else MINIO_S3_METADATA_CACHE_MAX_ENTRIES.get()
+        self._ttl = ttl if ttl is not None else MINIO_S3_METADATA_CACHE_TTL.get()
+
+        if self._max_entries < 1:
+            raise ValueError("Metadata cache must hold at least one entry.")
+
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions
+        }
+
+    def lookup(self, bucket: str, object_name: str, version_id: Optional[str] = None) -> Optional[CacheEntry]:
+        """
+        Returns the cached entry for an object, fresh or not, or None when the object is not cached.
+        """
+        key = (bucket, object_name, version_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                record_cache_lookup("metadata", hit = False)
+                return None
+
+            self._entries.move_to_end(key)
+
+            # Stale entries cost a request to the server, so they count as misses
+            hit = entry.is_fresh
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+            record_cache_lookup("metadata", hit = hit)
+
+            return entry
+
+    def store(self, bucket: str, object_name: str, version_id: Optional[str], value: Dict[str, Any],
+              etag: Optional[str] = None):
+        """
+        Caches the metadata of an object, evicting the least recently used entries when full.
+        """
+        key = (bucket, object_name, version_id)
+        expires_at = None if version_id is not None else time.monotonic() + self._ttl
+
+        with self._lock:
+            self._entries[key] = CacheEntry(value, etag, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last = False)
+                self.evictions += 1
+
+    def revalidate(self, bucket: str, object_name: str, version_id: Optional[str] = None):
+        """
+        Marks a stale entry whose ETag still matches the server one as fresh for another TTL period.
+        """
+        key = (bucket, object_name, version_id)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires_at is not None:
+                entry.expires_at = time.monotonic() + self._ttl
+                self.revalidations += 1
+
+    def invalidate(self, bucket: str, object_name: Optional[str] = None):
+        """
+        Drops the cached entries of an object, of every version, or of a whole bucket when object_name
+        is not specified.
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == bucket and (object_name is None or k[1] == object_name)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCacheEntry:
+    """
+    Represents an object stored on the disk cache.
+    """
+
+    __slots__ = ("path", "bucket_name", "object_name", "version_id", "etag", "size", "last_modified")
+
+    def __init__(self, path: str, bucket_name: str, object_name: str, version_id: Optional[str],
+                 etag: Optional[str], size: int, last_modified: Optional[str] = None) -> None:
+        self.path = path
+        self.bucket_name = bucket_name
+        self.object_name = object_name
+        self.version_id = version_id
+        self.etag = etag
+        self.size = size
+        self.last_modified = last_modified
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__ if name != "path"}
+
+    def as_object(self) -> Object:
+        """Describes the cached object the same way minio describes downloaded objects."""
+        return Object(
+            bucket_name = self.bucket_name,
+            object_name = self.object_name,
+            last_modified = parsedate_to_datetime(self.last_modified) if self.last_modified else None,
+            etag = self.etag,
+            size = self.size,
+            version_id = self.version_id
+        )
+
+
+class ObjectDiskCache:
+    """
+    Persistent, size bounded cache of downloaded objects keyed by (bucket, object_name, version_id).
+
+    Each object is stored as a data file next to a small json sidecar describing it. The least recently used
+    objects are evicted once the cached bytes exceed ``max_bytes``. The cache directory can be shared by
+    several processes on the same node since entries are published with atomic renames.
+
+    The cached bytes are kept as a running total, so storing an object only scans the directory when the budget
+    is exceeded. Objects stored by other processes are accounted for once such a scan happens.
+    """
+
+    _META_SUFFIX = ".json"
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        directory = directory if directory is not None else MINIO_S3_DISK_CACHE_DIR.get()
+        self._directory = directory if directory is not None \
+            else os.path.join(tempfile.gettempdir(), "minio-extensions-cache")
+        self._max_bytes = max_bytes if max_bytes is not None else MINIO_S3_DISK_CACHE_MAX_BYTES.get()
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(self._directory, exist_ok = True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def size(self) -> int:
+        """Amount of bytes currently cached."""
+        with self._lock:
+            return self._tracked_size()
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
+
+    def _path(self, bucket_name: str, object_name: str, version_id: Optional[str]) -> str:
+        key = "\0".join([bucket_name, object_name, version_id or ""]).encode("utf-8")
+        return os.path.join(self._directory, hashlib.sha256(key).hexdigest())
+
+    def temporary_path(self) -> str:
+        """
+        Returns a fresh path inside the cache directory to download an object to before storing it.
+        """
+        fd, path = tempfile.mkstemp(dir = self._directory, suffix = ".part.minio")
+        os.close(fd)
+        return path
+
+    def lookup(self, bucket_name: str, object_name: str, version_id: Optional[str] = None) -> Optional[DiskCacheEntry]:
+        """
+        Returns the cached entry of an object, or None when the object is not cached.
+        """
+        path = self._path(bucket_name, object_name, version_id)
+
+        try:
+            with open(path + self._META_SUFFIX, "r") as fm:
+                meta = json.load(fm)
+            if os.path.getsize(path) != meta["size"]:
+                raise ValueError("Cached object size mismatch.")
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return DiskCacheEntry(path = path, **meta)
+
+    def record(self, hit: bool):
+        """Accounts a read served from cache, or one that had to fetch the object contents."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        record_cache_lookup("disk", hit = hit)
+
+    def store(self, file_path: str, bucket_name: str, object_name: str, version_id: Optional[str] = None,
+              etag: Optional[str] = None, last_modified: Optional[str] = None) -> DiskCacheEntry:
+        """
+        Moves a downloaded file into the cache, evicting the least recently used objects when over budget.
+        """
+        path = self._path(bucket_name, object_name, version_id)
+        entry = DiskCacheEntry(path, bucket_name, object_name, version_id, etag, os.path.getsize(file_path),
+                               last_modified)
+
+        tmp_meta_path = f"{path}.{os.getpid()}.{threading.get_ident()}{self._META_SUFFIX}.tmp"
+        with open(tmp_meta_path, "w") as fm:
+            json.dump(entry.as_dict(), fm)
+
+        with self._lock:
+            size = self._tracked_size()
+            replaced = self.lookup(bucket_name, object_name, version_id)
+
+            os.replace(file_path, path)
+            os.replace(tmp_meta_path, path + self._META_SUFFIX)
+
+            self._size = size + entry.size - (replaced.size if replaced is not None else 0)
+            over_budget = self._size > self._max_bytes
+
+        if over_budget:
+            self.evict(keep = path)
+
+        return entry
+
+    def touch(self, path: str):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def invalidate(self, bucket_name: str, object_name: str, version_id: Optional[str] = None):
+        with self._lock:
+            entry = self.lookup(bucket_name, object_name, version_id)
+            self._remove(self._path(bucket_name, object_name, version_id))
+
+            if entry is not None and self._size is not None:
+                self._size -= entry.size
+
+    def clear(self):
+        with self._lock:
+            for entry in self._entries():
+                self._remove(entry.path)
+
+            self._size = 0
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Removes the least recently used objects until the cached bytes fit the cache budget.
+        """
+        with self._lock:
+            entries = sorted(self._entries(), key = lambda e: self._last_used(e.path))
+            total = sum(e.size for e in entries)
+
+            for entry in entries:
+                if total <= self._max_bytes:
+                    break
+                if entry.path == keep:
+                    continue
+                self._remove(entry.path)
+                total -= entry.size
+                self.evictions += 1
+
+            self._size = total
+
+    def _tracked_size(self) -> int:
+        # The directory is only scanned the first time, later stores and removals update the running total
+        if self._size is None:
+            self._size = sum(entry.size for entry in self._entries())
+
+        return self._size
+
+    def _entries(self):
+        for name in os.listdir(self._directory):
+            if not name.endswith(self._META_SUFFIX):
+                continue
+
+            path = os.path.join(self._directory, name[:-len(self._META_SUFFIX)])
+
+            try:
+                with open(path + self._META_SUFFIX, "r") as fm:
+                    yield DiskCacheEntry(path = path, **json.load(fm))
+            except (OSError, ValueError, TypeError):
+                continue
+
+    @staticmethod
+    def _last_used(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    @staticmethod
+    def _remove(path: str):
+        for p in (path + ObjectDiskCache._META_SUFFIX, path):
+            try:
+                os.remove(p)
+            except OSError:
+                pass
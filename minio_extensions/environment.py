@@ -142,3 +142,107 @@ MINIO_S3_DEFAULT_BUCKET_NAME = _EnvVarBase("MINIO_S3_DEFAULT_BUCKET_NAME", str,
 
 #: Specifies if minio client has to check certificates at client construction
 MINIO_S3_CHECK_CERTIFICATES = _BooleanEnvironmentVariable("MINIO_S3_CHECK_CERTIFICATES", True)
+
+#: Specifies the maximum number of concurrent workers used by batch transfer operations.
+#: (default: ``16``)
+MINIO_S3_TRANSFER_MAX_WORKERS = _EnvVarBase("MINIO_S3_TRANSFER_MAX_WORKERS", int, 16)
+
+#: Specifies the maximum amount of bytes allowed to be in flight at once on batch transfer operations.
+#: (default: ``268435456``)
+MINIO_S3_TRANSFER_MAX_BYTES_IN_FLIGHT = _EnvVarBase("MINIO_S3_TRANSFER_MAX_BYTES_IN_FLIGHT", int, 256 * 1024 * 1024)
+
+#: Specifies the size in bytes of the chunks read from object streams.
+#: (default: ``1048576``)
+MINIO_S3_TRANSFER_CHUNK_SIZE = _EnvVarBase("MINIO_S3_TRANSFER_CHUNK_SIZE", int, 1024 * 1024)
+
+#: Specifies the size in bytes of each part on multipart transfers.
+#: (default: ``16777216``)
+MINIO_S3_TRANSFER_PART_SIZE = _EnvVarBase("MINIO_S3_TRANSFER_PART_SIZE", int, 16 * 1024 * 1024)
+
+#: Specifies the object size in bytes from which transfers are split in concurrent parts.
+#: Smaller objects are transferred on a single stream.
+#: (default: ``67108864``)
+MINIO_S3_TRANSFER_MULTIPART_THRESHOLD = _EnvVarBase("MINIO_S3_TRANSFER_MULTIPART_THRESHOLD", int, 64 * 1024 * 1024)
+
+#: Specifies the maximum number of entries kept by object metadata caches.
+#: (default: ``4096``)
+MINIO_S3_METADATA_CACHE_MAX_ENTRIES = _EnvVarBase("MINIO_S3_METADATA_CACHE_MAX_ENTRIES", int, 4096)
+
+#: Specifies the time in seconds object metadata cached for the latest object version is trusted without
+#: revalidation.
+#: (default: ``30``)
+MINIO_S3_METADATA_CACHE_TTL = _EnvVarBase("MINIO_S3_METADATA_CACHE_TTL", float, 30.0)
+
+#: Specifies whether objects whose stat response carries no x-amz-tagging-count header are taken as untagged,
+#: skipping their tags request. S3 and MinIO only send the header for tagged objects, other servers may never send it.
+#: (default: ``True``)
+MINIO_S3_METADATA_TRUST_TAGGING_COUNT = _BooleanEnvironmentVariable("MINIO_S3_METADATA_TRUST_TAGGING_COUNT", True)
+
+#: Specifies the time in seconds a bucket known to exist is trusted by sessions before being checked again.
+#: (default: ``300``)
+MINIO_S3_SESSION_BUCKET_TTL = _EnvVarBase("MINIO_S3_SESSION_BUCKET_TTL", float, 300.0)
+
+#: Specifies the maximum number of connections kept open per host on minio HTTP connection pools.
+#: Falls back to MINIO_S3_TRANSFER_MAX_WORKERS, so batch transfers never open connections beyond the pool.
+#: (default: ``None``)
+MINIO_S3_HTTP_POOL_MAXSIZE = _EnvVarBase("MINIO_S3_HTTP_POOL_MAXSIZE", int, None)
+
+#: Specifies the number of per host connection pools kept by minio HTTP clients.
+#: (default: ``10``)
+MINIO_S3_HTTP_NUM_POOLS = _EnvVarBase("MINIO_S3_HTTP_NUM_POOLS", int, 10)
+
+#: Specifies whether requests wait for a free pooled connection instead of opening and discarding extra ones
+#: when the pool is exhausted.
+#: (default: ``False``)
+MINIO_S3_HTTP_POOL_BLOCK = _BooleanEnvironmentVariable("MINIO_S3_HTTP_POOL_BLOCK", False)
+
+#: Specifies whether TCP keep-alive probes are enabled on pooled connections.
+#: (default: ``True``)
+MINIO_S3_HTTP_KEEP_ALIVE = _BooleanEnvironmentVariable("MINIO_S3_HTTP_KEEP_ALIVE", True)
+
+#: Specifies the timeout in seconds to establish minio HTTP connections. Falls back to MINIO_HTTP_REQUEST_TIMEOUT.
+#: Direct connections keep minio's own 300 seconds timeout while MINIO_HTTP_REQUEST_TIMEOUT is not declared.
+#: (default: ``None``)
+MINIO_S3_HTTP_CONNECT_TIMEOUT = _EnvVarBase("MINIO_S3_HTTP_CONNECT_TIMEOUT", float, None)
+
+#: Specifies the timeout in seconds to read from minio HTTP connections. Falls back to MINIO_HTTP_REQUEST_TIMEOUT.
+#: Direct connections keep minio's own 300 seconds timeout while MINIO_HTTP_REQUEST_TIMEOUT is not declared.
+#: (default: ``None``)
+MINIO_S3_HTTP_READ_TIMEOUT = _EnvVarBase("MINIO_S3_HTTP_READ_TIMEOUT", float, None)
+
+#: Specifies the backoff factor applied between retries of minio HTTP requests.
+#: (default: ``0.2``)
+MINIO_S3_HTTP_RETRY_BACKOFF_FACTOR = _EnvVarBase("MINIO_S3_HTTP_RETRY_BACKOFF_FACTOR", float, 0.2)
+
+#: Specifies the directory where downloaded objects are cached on disk.
+#: (default: ``None``, a ``minio-extensions-cache`` folder inside the system temporary directory)
+MINIO_S3_DISK_CACHE_DIR = _EnvVarBase("MINIO_S3_DISK_CACHE_DIR", str, None)
+
+#: Specifies the maximum amount of bytes kept on the downloaded objects disk cache.
+#: (default: ``10737418240``)
+MINIO_S3_DISK_CACHE_MAX_BYTES = _EnvVarBase("MINIO_S3_DISK_CACHE_MAX_BYTES", int, 10 * 1024 * 1024 * 1024)
+
+#: Specifies the path of the SQLite database holding local bucket inventories.
+#: (default: ``None``, a ``minio-extensions-inventory.sqlite3`` file inside the system temporary directory)
+MINIO_S3_INVENTORY_PATH = _EnvVarBase("MINIO_S3_INVENTORY_PATH", str, None)
+
+#: Specifies the size in bytes of the blocks fetched and cached by random access object files.
+#: (default: ``1048576``)
+MINIO_S3_READ_BLOCK_SIZE = _EnvVarBase("MINIO_S3_READ_BLOCK_SIZE", int, 1024 * 1024)
+
+#: Specifies the maximum number of blocks cached by each random access object file.
+#: (default: ``64``)
+MINIO_S3_READ_CACHE_BLOCKS = _EnvVarBase("MINIO_S3_READ_CACHE_BLOCKS", int, 64)
+
+#: Specifies the maximum number of blocks fetched ahead of sequential reads on random access object files.
+#: (default: ``16``)
+MINIO_S3_READ_AHEAD_MAX_BLOCKS = _EnvVarBase("MINIO_S3_READ_AHEAD_MAX_BLOCKS", int, 16)
+
+#: Specifies where clients created from environment variables keep objects: ``s3`` for the server on
+#: MINIO_S3_ENDPOINT_URL, ``memory`` for an in-process store or ``local`` for the directory on MINIO_S3_LOCAL_ROOT.
+#: (default: ``s3``)
+MINIO_S3_STORAGE_BACKEND = _EnvVarBase("MINIO_S3_STORAGE_BACKEND", str, "s3")
+
+#: Specifies the directory holding the buckets of the local storage backend.
+#: (default: ``None``)
+MINIO_S3_LOCAL_ROOT = _EnvVarBase("MINIO_S3_LOCAL_ROOT", str, None)
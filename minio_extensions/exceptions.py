@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Dict, Any
 
 
 class BucketException(Exception):
@@ -25,3 +25,31 @@ class ClientConfigurationException(Exception):
 class ClientProxyConfigurationException(ClientConfigurationException):
     def __init__(self, message: object) -> None:
         super().__init__(message)
+
+
+class BatchOperationException(Exception):
+    results: Optional[Dict[str, Any]] = None
+    errors: Optional[Dict[str, BaseException]] = None
+    
+    def __init__(self, message,
+                 results: Optional[Dict[str, Any]] = None,
+                 errors: Optional[Dict[str, BaseException]] = None) -> None:
+        self.message = message
+        self.results = results if results is not None else {}
+        self.errors = errors if errors is not None else {}
+        super().__init__(message)
+
+
+class ObjectIntegrityException(Exception):
+    object_name: Optional[str] = None
+    
+    def __init__(self, message, object_name: Optional[str] = None) -> None:
+        self.object_name = object_name
+        self.message = message
+        super().__init__(message)
+
+
+class TransferCancelledException(Exception):
+    def __init__(self, message: object) -> None:
+        self.message = message
+        super().__init__(self.message)
@@ -1,6 +1,10 @@
+import io
 import os
 import tempfile
-from minio import Minio, S3Error
+import uuid
+from contextlib import contextmanager
+from minio import Minio, S3Error, ServerError
+from minio.helpers import ProgressType, get_part_info
 
 from minio_extensions.providers import (
     ClientBuilder,
@@ -11,11 +15,22 @@ from minio_extensions.metadata.metadata import (
     VersionMetadata,
     ObjectMetadataInfo,
     ObjectMetadata,
-    TagMetadata
+    TagMetadata,
+    VersionIndex
+)
+
+from minio_extensions.metadata.constants import (
+    VERSION_INDEX_PREFIX,
+    OBJECT_META_LAST_MODIFIED_ATT,
+    OBJECT_META_TAGCOUNT_ATT,
+    MAX_DELETE_OBJECTS_PER_REQUEST,
+    Json
 )
 
 from minio_extensions._typing import (
-    VersionLike
+    VersionLike,
+    TagDuplicateOptions,
+    TagOperationOptions
 )
 
 from io import BytesIO
@@ -24,29 +39,101 @@ from typing import (
     Dict,
     List,
     Union,
-    Type
+    Type,
+    Iterator,
+    Iterable,
+    Tuple,
+    Any
 )
 
 from minio.versioningconfig import VersioningConfig
 
+from minio_extensions.environment import (
+    MINIO_S3_TRANSFER_CHUNK_SIZE,
+    MINIO_S3_TRANSFER_PART_SIZE,
+    MINIO_S3_TRANSFER_MULTIPART_THRESHOLD,
+    MINIO_S3_METADATA_TRUST_TAGGING_COUNT
+)
+
 from minio_extensions.exceptions import (
-    InvalidBucketException
+    InvalidBucketException,
+    BatchOperationException
+)
+
+from minio_extensions._concurrency import (
+    ByteBudget,
+    iter_completed,
+    resolve_max_workers,
+    resolve_max_bytes_in_flight
+)
+
+from minio_extensions.reports import (
+    SyncReport,
+    RemovalReport,
+    ObjectRemovalResult,
+    TaggingReport,
+    ObjectTaggingResult
+)
+
+from minio_extensions.cache import (
+    MetadataCache,
+    ObjectDiskCache
 )
 
+from minio_extensions.transfer import (
+    download_ranges,
+    readinto_response
+)
 
+from minio_extensions.inventory import (
+    BucketInventory
+)
+
+from minio_extensions.registry import (
+    CLIENT_REGISTRY
+)
+
+from minio_extensions.listing import (
+    iter_objects_parallel
+)
+
+from minio_extensions.table import (
+    DEFAULT_BATCH_SIZE,
+    ObjectTable
+)
+
+from minio_extensions.objectfile import (
+    ObjectFile
+)
+
+from minio_extensions.instrumentation import (
+    instrument_operations
+)
+
+from minio_extensions.query import (
+    InputFormat,
+    OutputFormat,
+    select_records,
+    fan_out_select
+)
+
+
+@instrument_operations
 class MinioExtensions:
     
     @staticmethod
     def get_object(client: Type[Minio], bucket: Optional[str] = None,
                    file_name: Optional[str] = None,
-                   tag_version: Optional[Union[VersionMetadata, VersionLike]] = "latest"):
+                   tag_version: Optional[Union[VersionMetadata, VersionLike]] = "latest",
+                   inventory: Optional[BucketInventory] = None):
         """
         Retrieve a single file from minio given a bucket and file information
 
         Args: client: Minio client instance bucket: The bucket to retrieve the files from. file_name: The name of the
         file to retrieve from the bucket. tag_version: Version to catch specified file. Can be either a version
         metadata to find inside object versions metadata, or a tag representing first or latest version of file.
-        Defaults to latest version if not defined.
+        Defaults to latest version if not defined. inventory: Optional bucket inventory to resolve the file name
+        prefix from instead of listing the bucket. It must have been refreshed including object versions.
             
             file_name:
                 The name of the file to retrieve.
@@ -60,33 +147,52 @@ class MinioExtensions:
         selected_file = None
         has_to_find_by_meta = isinstance(tag_version, VersionMetadata)
         
+        if has_to_find_by_meta:
+            # Semantic versions are resolved through the object version index, falling back to a full scan of
+            # the object versions when missing or stale. Reads never write the index back, so they keep working
+            # with read-only credentials, and rebuild_version_index persists it explicitly
+            index = MinioExtensions.read_version_index(client = client, bucket = bucket, object_name = file_name)
+            version_id = index.resolve(tag_version) if index is not None else None
+            
+            rebuilt = version_id is None
+            
+            if rebuilt:
+                index = MinioExtensions._scan_version_index(client = client, bucket = bucket,
+                                                            object_name = file_name)
+                version_id = index.resolve(tag_version)
+            
+            if version_id is None:
+                raise ValueError(f"Could not find version {tag_version} of file {file_name} on bucket {bucket}.")
+            
+            try:
+                return MinioExtensions.fload_file_from_bucket(client, bucket_name = bucket,
+                                                              object_name = file_name,
+                                                              version_id = version_id)
+            except S3Error as e:
+                # Versions removed after being indexed leave the index pointing to them
+                if rebuilt or e.code not in ("NoSuchVersion", "NoSuchKey"):
+                    raise
+            
+            version_id = MinioExtensions._scan_version_index(client = client, bucket = bucket,
+                                                             object_name = file_name).resolve(tag_version)
+            
+            if version_id is None:
+                raise ValueError(f"Could not find version {tag_version} of file {file_name} on bucket {bucket}.")
+            
+            return MinioExtensions.fload_file_from_bucket(client, bucket_name = bucket,
+                                                          object_name = file_name,
+                                                          version_id = version_id)
+        
         files_found = [f for f in MinioExtensions.list_files_from_bucket(
             client = client,
             bucket = bucket,
             prefix = file_name,
             recurse = False,
             include_versions = True,
-            include_metadata = True
+            include_metadata = True,
+            inventory = inventory
         )]
         
-        if has_to_find_by_meta:
-            available_files = [{
-                "name": f.object_name,
-                "version_id": f.version_id,
-                "metadata_info": ObjectMetadataInfo.from_meta(
-                    MinioExtensions.get_object_metadata(client = client,
-                                                        bucket = bucket,
-                                                        object_name = f.object_name,
-                                                        version_id = f.version_id)
-                )
-            } for f in files_found]
-            
-            selected_file = next(
-                file for file in available_files if file["metadata_info"].version == tag_version)
-            
-            return MinioExtensions.fload_file_from_bucket(client, bucket_name = bucket,
-                                                          object_name = selected_file["name"],
-                                                          version_id = selected_file["version_id"])
         if len(files_found) == 0:
             raise ValueError(
                 "Could not find any file corresponding to the following prefix on bucket: {}".format(file_name))
@@ -123,7 +229,14 @@ class MinioExtensions:
         Returns:
             bool: True if the given file exists in the given bucket otherwise False
         """
-        return client.get_object(bucket_name = bucket_name, object_name = object_name) is None
+        try:
+            client.stat_object(bucket_name = bucket_name, object_name = object_name)
+            return True
+        
+        except S3Error as e:
+            if e.code in ["NoSuchKey", "NoSuchObject"]:
+                return False
+            raise
     
     @staticmethod
     def as_bytes_io(file: str):
@@ -192,22 +305,216 @@ class MinioExtensions:
         if client is None:
             raise ValueError("Minio client is not available.")
         
-        client_response = client.get_object(bucket_name = bucket_name, object_name = object_name)
-        file_io = io.BytesIO(client_response.data)
+        file_io = io.BytesIO()
+        
+        # Copying the response by chunks avoids holding both the urllib3 buffer and the BytesIO copy
+        # of the whole object at once
+        for chunk in MinioExtensions.stream_object(client, bucket_name = bucket_name, object_name = object_name):
+            file_io.write(chunk)
+        
+        file_io.seek(0)
         file_path = file_io
         return file_path
     
+    @staticmethod
+    def stream_object(client: Type[Minio], bucket_name: Optional[str] = None,
+                      object_name: Optional[str] = None,
+                      version_id: Optional[str] = None,
+                      chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Lazily reads an object from bucket yielding its contents in fixed size chunks, so memory usage stays
+        bounded to a single chunk regardless of object size.
+        
+        Args:
+            client: Minio client instance.
+            bucket_name: Name of the bucket to read the object from.
+            object_name: Fully qualified name of the object inside the bucket.
+            version_id: Version ID of the object to read. Defaults to the latest version.
+            chunk_size: Size in bytes of each chunk yielded. Defaults to MINIO_S3_TRANSFER_CHUNK_SIZE.
+        
+        Returns:
+            Iterator over the object contents. The underlying connection is released back to the pool once
+            the iterator is exhausted or closed.
+        """
+        with MinioExtensions.open_object(client, bucket_name = bucket_name, object_name = object_name,
+                                         version_id = version_id, chunk_size = chunk_size) as reader:
+            chunk_size = chunk_size or MINIO_S3_TRANSFER_CHUNK_SIZE.get()
+            
+            while chunk := reader.read(chunk_size):
+                yield chunk
+    
+    @staticmethod
+    @contextmanager
+    def open_object(client: Type[Minio], bucket_name: Optional[str] = None,
+                    object_name: Optional[str] = None,
+                    version_id: Optional[str] = None,
+                    chunk_size: Optional[int] = None,
+                    offset: int = 0,
+                    length: int = 0):
+        """
+        Opens a read only file-like object over the HTTP response of an object stored on bucket.
+        
+        Args:
+            client: Minio client instance.
+            bucket_name: Name of the bucket to read the object from.
+            object_name: Fully qualified name of the object inside the bucket.
+            version_id: Version ID of the object to read. Defaults to the latest version.
+            chunk_size: Size in bytes of the read buffer. Defaults to MINIO_S3_TRANSFER_CHUNK_SIZE.
+            offset: Start byte position of the object data to read.
+            length: Number of bytes to read from offset. Reads up to the end of the object when zero.
+        
+        Returns:
+            Context manager yielding a buffered binary reader. The connection is released back to the pool when
+            the context exits.
+        """
+        if bucket_name is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if object_name is None:
+            raise ValueError("Object name is required to search for objects on bucket")
+        
+        if client is None:
+            raise ValueError("Minio client is not available.")
+        
+        response = client.get_object(bucket_name = bucket_name, object_name = object_name,
+                                     version_id = version_id, offset = offset, length = length)
+        # The reader decides when the stream is exhausted, so urllib3 must not close the response on its own
+        response.auto_close = False
+        try:
+            yield io.BufferedReader(response, buffer_size = chunk_size or MINIO_S3_TRANSFER_CHUNK_SIZE.get())
+        finally:
+            response.close()
+            response.release_conn()
+    
+    @staticmethod
+    def open_object_file(client: Type[Minio], bucket_name: Optional[str] = None,
+                         object_name: Optional[str] = None,
+                         version_id: Optional[str] = None,
+                         block_size: Optional[int] = None,
+                         cache_blocks: Optional[int] = None,
+                         max_read_ahead: Optional[int] = None) -> ObjectFile:
+        """
+        Opens a seekable, read only file-like object over an object, fetching only the byte ranges read.
+        
+        Args:
+            client: Minio client instance.
+            bucket_name: Name of the bucket to read the object from.
+            object_name: Fully qualified name of the object inside the bucket.
+            version_id: Version ID of the object to read. Defaults to the latest version.
+            block_size: Size in bytes of the blocks fetched and cached. Defaults to MINIO_S3_READ_BLOCK_SIZE.
+            cache_blocks: Maximum number of blocks cached. Defaults to MINIO_S3_READ_CACHE_BLOCKS.
+            max_read_ahead: Maximum number of blocks fetched ahead of sequential reads. Defaults to
+                MINIO_S3_READ_AHEAD_MAX_BLOCKS.
+        
+        Returns:
+            File object usable directly by pyarrow or pandas, e.g. ``pyarrow.parquet.read_table(file,
+            columns = [...])``.
+        """
+        if bucket_name is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if object_name is None:
+            raise ValueError("Object name is required to search for objects on bucket")
+        
+        return ObjectFile(client, bucket_name = bucket_name, object_name = object_name, version_id = version_id,
+                          block_size = block_size, cache_blocks = cache_blocks, max_read_ahead = max_read_ahead)
+    
+    @staticmethod
+    def readinto_object(client: Type[Minio], buffer: Any,
+                        bucket_name: Optional[str] = None,
+                        object_name: Optional[str] = None,
+                        version_id: Optional[str] = None,
+                        offset: int = 0,
+                        length: int = 0) -> memoryview:
+        """
+        Reads an object, or a byte range of it, directly into a caller owned buffer without intermediate copies.
+        
+        Args:
+            client: Minio client instance.
+            buffer: Writable, contiguous buffer to read the object into, like a bytearray, memoryview, mmap or
+                NumPy array. It must be large enough to hold the bytes read.
+            bucket_name: Name of the bucket to read the object from.
+            object_name: Fully qualified name of the object inside the bucket.
+            version_id: Version ID of the object to read. Defaults to the latest version.
+            offset: Start byte position of the object data to read.
+            length: Number of bytes to read from offset. Reads up to the end of the object when zero.
+        
+        Returns:
+            Byte view over the part of the buffer holding the data read.
+        """
+        if bucket_name is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if object_name is None:
+            raise ValueError("Object name is required to search for objects on bucket")
+        
+        response = client.get_object(bucket_name = bucket_name, object_name = object_name,
+                                     version_id = version_id, offset = offset, length = length)
+        try:
+            return readinto_response(response, buffer, object_name = object_name)
+        finally:
+            response.close()
+            response.release_conn()
+    
+    @staticmethod
+    def load_object_view(client: Type[Minio], bucket_name: Optional[str] = None,
+                         object_name: Optional[str] = None,
+                         version_id: Optional[str] = None,
+                         offset: int = 0,
+                         length: int = 0) -> memoryview:
+        """
+        Reads an object, or a byte range of it, into a buffer allocated once with the exact object size.
+        
+        Returns:
+            Read only byte view over the object contents.
+        """
+        if bucket_name is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if object_name is None:
+            raise ValueError("Object name is required to search for objects on bucket")
+        
+        response = client.get_object(bucket_name = bucket_name, object_name = object_name,
+                                     version_id = version_id, offset = offset, length = length)
+        try:
+            content_length = response.headers.get("Content-Length")
+            
+            # Bodies of unknown length can not be preallocated
+            if content_length is None:
+                return memoryview(response.read())
+            
+            buffer = bytearray(int(content_length))
+            return readinto_response(response, buffer, object_name = object_name).toreadonly()
+        finally:
+            response.close()
+            response.release_conn()
+    
     @staticmethod
     def fload_file_from_bucket(client: Type[Minio], bucket_name: Optional[str] = None,
                                object_name: Optional[str] = None,
-                               version_id: Optional[str] = None):
+                               version_id: Optional[str] = None,
+                               max_workers: Optional[int] = None,
+                               part_size: Optional[int] = None,
+                               progress: Optional[ProgressType] = None,
+                               disk_cache: Optional[ObjectDiskCache] = None,
+                               file_path: Optional[str] = None):
         """
                 Retrieve a single file from minio given a bucket, current minio client and file information.
 
                  Args: client: Minio client instance to search for objects bucket_name: Name of the bucket to search
                  for object_name: Name of the object to search for in the bucket. NOTE.: This needs to be the fully
                  qualified path of the path to desired file inside the bucket including subfolders to catch the file
-                 version_id: Version ID to search for on bucket for given file
+                 version_id: Version ID to search for on bucket for given file max_workers: Number of byte ranges to
+                 download concurrently. When not specified the object is downloaded on a single stream, otherwise
+                 objects bigger than MINIO_S3_TRANSFER_MULTIPART_THRESHOLD are split in ranges, verified against
+                 the object size and ETag once downloaded. part_size: Size in bytes of each downloaded range.
+                 Defaults to MINIO_S3_TRANSFER_PART_SIZE. progress: Optional progress tracker notified of the
+                 downloaded bytes. Raising from it aborts the download. disk_cache: Optional disk cache to serve
+                 the file from. Pinned versions are read from disk without any request once cached, while the
+                 latest version is revalidated with an ETag conditional GET. The returned path points inside the
+                 cache directory and must not be modified. file_path: Local path to download the object to.
+                 Defaults to the object name inside the system temporary directory. Ignored when served from
+                 disk_cache.
 
                  Returns:
                      Bytes object of the file that was loaded from the bucket
@@ -221,14 +528,43 @@ class MinioExtensions:
         if client is None:
             raise ValueError("Minio client is not available.")
         
-        local_file_path = os.path.join(tempfile.gettempdir(), object_name)
-        local_file_path = local_file_path.replace("/", "\\")
-        client_response = client.fget_object(
-            bucket_name = bucket_name,
-            object_name = object_name,
-            file_path = local_file_path,
-            version_id = version_id
-        )
+        if disk_cache is not None:
+            return MinioExtensions._fload_cached_file(client, bucket_name = bucket_name, object_name = object_name,
+                                                      version_id = version_id, disk_cache = disk_cache,
+                                                      max_workers = max_workers, part_size = part_size,
+                                                      progress = progress)
+        
+        local_file_path = file_path or os.path.join(tempfile.gettempdir(), os.path.normpath(object_name))
+        
+        if max_workers is not None:
+            part_size = part_size or MINIO_S3_TRANSFER_PART_SIZE.get()
+            stat = client.stat_object(bucket_name = bucket_name, object_name = object_name, version_id = version_id)
+            
+            if stat.size > max(part_size, MINIO_S3_TRANSFER_MULTIPART_THRESHOLD.get()):
+                download_ranges(client, bucket_name = bucket_name, object_name = object_name,
+                                file_path = local_file_path, stat = stat, part_size = part_size,
+                                max_workers = resolve_max_workers(max_workers), progress = progress)
+                return stat, local_file_path
+            
+            # Small objects are not worth splitting, the stat'ed version is pinned for the single stream
+            version_id = stat.version_id or version_id
+        
+        # minio leaves the partial download behind when aborted, e.g. by a raising progress tracker
+        tmp_file_path = "{0}.{1}.part.minio".format(local_file_path, uuid.uuid4().hex)
+        
+        try:
+            client_response = client.fget_object(
+                bucket_name = bucket_name,
+                object_name = object_name,
+                file_path = local_file_path,
+                version_id = version_id,
+                tmp_file_path = tmp_file_path,
+                progress = progress
+            )
+        except BaseException:
+            if os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+            raise
         
         if not os.path.isfile(local_file_path):
             raise FileNotFoundError(
@@ -240,24 +576,169 @@ class MinioExtensions:
         return file_info, local_file_path
     
     @staticmethod
-    def create_provider(creation_options: ConfigurationOptions = "env"):
+    @contextmanager
+    def mmap_file_from_bucket(client: Type[Minio], bucket_name: Optional[str] = None,
+                              object_name: Optional[str] = None,
+                              version_id: Optional[str] = None,
+                              disk_cache: Optional[ObjectDiskCache] = None,
+                              **kwargs):
+        """
+        Downloads an object like fload_file_from_bucket and maps the downloaded file read only into memory.
+        
+        The mapping is backed by the page cache, so threads sharing it, or processes forked while it is open,
+        read the same physical pages instead of holding private copies of the object.
+        
+        Args:
+            client: Minio client instance.
+            bucket_name: Name of the bucket to read the object from.
+            object_name: Fully qualified name of the object inside the bucket.
+            version_id: Version ID of the object to read. Defaults to the latest version.
+            disk_cache: Optional disk cache to serve the file from. Cached files are mapped in place and kept
+                once the context exits.
+            **kwargs: Any other option accepted by fload_file_from_bucket.
+        
+        Returns:
+            Context manager yielding the downloaded object information and a read only mmap of its contents.
+            The mapping is closed and the downloaded file removed when the context exits.
+        """
+        import mmap
+        
+        download_path = None
+        
+        # Each context downloads to a file of its own, so exiting never removes a file another one maps or a
+        # path outside the temporary directory named after the object
+        if disk_cache is None:
+            fd, download_path = tempfile.mkstemp(suffix = ".minio")
+            os.close(fd)
+        
+        try:
+            file_info, local_file_path = MinioExtensions.fload_file_from_bucket(client, bucket_name = bucket_name,
+                                                                                object_name = object_name,
+                                                                                version_id = version_id,
+                                                                                disk_cache = disk_cache,
+                                                                                file_path = download_path, **kwargs)
+            
+            with open(local_file_path, "rb") as fb:
+                # Empty files can not be mapped
+                if os.fstat(fb.fileno()).st_size == 0:
+                    yield file_info, memoryview(b"")
+                    return
+                
+                mapped = mmap.mmap(fb.fileno(), 0, access = mmap.ACCESS_READ)
+            
+            try:
+                yield file_info, mapped
+            finally:
+                mapped.close()
+        
+        finally:
+            if download_path is not None:
+                try:
+                    os.remove(download_path)
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _fload_cached_file(client: Type[Minio], bucket_name: str, object_name: str,
+                           version_id: Optional[str],
+                           disk_cache: ObjectDiskCache,
+                           max_workers: Optional[int] = None,
+                           part_size: Optional[int] = None,
+                           progress: Optional[ProgressType] = None):
+        entry = disk_cache.lookup(bucket_name, object_name, version_id)
+        
+        # Pinned versions are immutable, so a cached copy never needs to be revalidated
+        if entry is not None and version_id is not None:
+            disk_cache.record(hit = True)
+            disk_cache.touch(entry.path)
+            return entry.as_object(), entry.path
+        
+        tmp_file_path = disk_cache.temporary_path()
+        
+        try:
+            if entry is None and max_workers is not None:
+                part_size = part_size or MINIO_S3_TRANSFER_PART_SIZE.get()
+                stat = client.stat_object(bucket_name = bucket_name, object_name = object_name,
+                                          version_id = version_id)
+                
+                if stat.size > max(part_size, MINIO_S3_TRANSFER_MULTIPART_THRESHOLD.get()):
+                    download_ranges(client, bucket_name = bucket_name, object_name = object_name,
+                                    file_path = tmp_file_path, stat = stat, part_size = part_size,
+                                    max_workers = resolve_max_workers(max_workers), progress = progress)
+                    disk_cache.record(hit = False)
+                    entry = disk_cache.store(tmp_file_path, bucket_name, object_name, version_id,
+                                             etag = stat.etag,
+                                             last_modified = stat.metadata.get(OBJECT_META_LAST_MODIFIED_ATT)
+                                             if stat.metadata else None)
+                    return stat, entry.path
+            
+            request_headers = {"If-None-Match": '"{0}"'.format(entry.etag)} \
+                if entry is not None and entry.etag else None
+            
+            try:
+                response = client.get_object(bucket_name = bucket_name, object_name = object_name,
+                                             version_id = version_id, request_headers = request_headers)
+            except ServerError as e:
+                if e.status_code == 304 and entry is not None:
+                    disk_cache.record(hit = True)
+                    disk_cache.touch(entry.path)
+                    return entry.as_object(), entry.path
+                raise
+            
+            try:
+                if progress is not None:
+                    progress.set_meta(object_name = object_name,
+                                      total_length = int(response.headers.get("Content-Length", 0)))
+                
+                with open(tmp_file_path, "wb") as fb:
+                    for chunk in response.stream(MINIO_S3_TRANSFER_CHUNK_SIZE.get()):
+                        fb.write(chunk)
+                        if progress is not None:
+                            progress.update(len(chunk))
+            finally:
+                response.close()
+                response.release_conn()
+            
+            disk_cache.record(hit = False)
+            entry = disk_cache.store(tmp_file_path, bucket_name, object_name, version_id,
+                                     etag = response.headers.get("ETag", "").strip('"') or None,
+                                     last_modified = response.headers.get(OBJECT_META_LAST_MODIFIED_ATT))
+            return entry.as_object(), entry.path
+        
+        finally:
+            if os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+    
+    @staticmethod
+    def create_provider(creation_options: ConfigurationOptions = "env", shared: bool = True, reload: bool = False):
         """
         Create a minio client instance from provided configuration options.
         
         Args: creation_options: Literal str representing the creation to be used by ClientBuilder class. Defaults to
         env where the minio client instance is created from predefined environment variables exported on .env files.
+        Use memory or local to get a storage backend keeping objects in process memory or on the directory set on
+        MINIO_S3_LOCAL_ROOT, also selectable for env through MINIO_S3_STORAGE_BACKEND. shared: Whether to return the
+        client shared by the process for the same configuration, reusing its warm connections, instead of building
+        a new one. The .env file is only loaded on the first call. reload: Whether to reload the .env file and
+        forget the shared clients before creating the client.
         
         Returns:
-            Minio client fresh instance from provided parameters.
+            Minio client instance from provided parameters, shared by every caller of the process when shared.
         """
-        import dotenv as de
-        de.load_dotenv()
+        if reload:
+            CLIENT_REGISTRY.reload()
+        
+        if shared:
+            return CLIENT_REGISTRY.get(creation_options, is_proxy_conn = False)
+        
+        CLIENT_REGISTRY.load_environment()
         builder = ClientBuilder(creation_option = creation_options, is_proxy_conn = False)
         return builder.configure()
     
     @staticmethod
     def get_object_metadata(client: Type[Minio], bucket: Optional[str] = None, object_name: str = None,
-                            version_id: Optional[str] = None):
+                            version_id: Optional[str] = None,
+                            cache: Optional[MetadataCache] = None):
         """
         Retrieve object metadata from bucket if any.
         
@@ -266,6 +747,9 @@ class MinioExtensions:
             bucket: Bucket to check for the file whose metadata has to be retrieved.
             object_name: Name of the file to be searched on provided bucket to fetch metadata.
             version_id: Minio object internal version id.
+            cache: Optional metadata cache to serve repeated requests from. Metadata of pinned version ids is
+                served without any request, while the latest version metadata is revalidated by ETag once
+                the cache TTL expires.
         
         Returns: Dictionary of contents containing the tags defined for search object along with current available
         metadata on object.
@@ -279,19 +763,137 @@ class MinioExtensions:
             
             }
         
+        entry = cache.lookup(bucket, object_name, version_id) if cache is not None else None
+        
+        if entry is not None and entry.is_fresh:
+            return MinioExtensions._copy_metadata(entry.value)
+        
         meta = client.stat_object(bucket_name = bucket, object_name = object_name, version_id = version_id)
-        tags = client.get_object_tags(bucket_name = bucket, object_name = object_name, version_id = version_id)
+        
+        # Tagging an object leaves its ETag untouched, so only stale entries of objects untagged before and after
+        # are refreshed skipping the tags request
+        if entry is not None and entry.etag is not None and entry.etag == meta.etag and \
+                not entry.value.get("tags") and not MinioExtensions._may_have_tags(meta.metadata):
+            cache.revalidate(bucket, object_name, version_id)
+            return MinioExtensions._copy_metadata(entry.value)
+        
+        tags = client.get_object_tags(bucket_name = bucket, object_name = object_name, version_id = version_id) \
+            if MinioExtensions._may_have_tags(meta.metadata) else None
         
         dict_meta = dict(zip(meta.metadata.keys(), meta.metadata.values()))
         dict_meta["tags"] = tags if not tags is None else {}
+        
+        if cache is not None:
+            cache.store(bucket, object_name, version_id, MinioExtensions._copy_metadata(dict_meta), etag = meta.etag)
+        
         return dict_meta
     
+    @staticmethod
+    def get_objects_metadata(client: Type[Minio], bucket: Optional[str] = None,
+                             files: Optional[Iterable[Union[str, Tuple[str, Optional[str]]]]] = None,
+                             prefix: Optional[str] = None,
+                             include_versions: bool = False,
+                             max_workers: Optional[int] = None,
+                             cache: Optional[MetadataCache] = None,
+                             errors: Optional[Dict[Tuple[str, Optional[str]], BaseException]] = None
+                             ) -> Iterator[ObjectMetadataInfo]:
+        """
+        Retrieves the metadata of many objects concurrently, yielding it as soon as each object is processed.
+        
+        Each object costs a stat request, followed by a tags request only when the stat response reports the
+        object as tagged.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket where the objects are stored.
+            files: Fully qualified names of the objects, or (name, version_id) pairs of specific object versions.
+            prefix: Retrieves the metadata of every object under the prefix. Can be combined with files.
+            include_versions: Whether to retrieve the metadata of every version of the objects under prefix.
+            max_workers: Number of objects processed concurrently. Defaults to MINIO_S3_TRANSFER_MAX_WORKERS.
+            cache: Optional metadata cache to serve repeated requests from, as on get_object_metadata.
+            errors: Optional dictionary collecting the exception raised for each (name, version_id) whose metadata
+                could not be retrieved. When not provided, failures are raised as a BatchOperationException once
+                every other object was yielded.
+        
+        Returns:
+            Iterator over the metadata of each object, in the order their requests complete.
+        """
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if files is None and prefix is None:
+            raise ValueError("Either files or prefix must be specified to retrieve objects metadata from bucket.")
+        
+        def _fetch(target):
+            name, version_id = target
+            return MinioExtensions.get_object_metadata(client = client, bucket = bucket, object_name = name,
+                                                       version_id = version_id, cache = cache)
+        
+        targets = MinioExtensions._metadata_targets(client, bucket = bucket, files = files, prefix = prefix,
+                                                    include_versions = include_versions)
+        return MinioExtensions._iter_objects_metadata(_fetch, targets, bucket, max_workers, errors)
+    
+    @staticmethod
+    def _metadata_targets(client: Type[Minio], bucket: str,
+                          files: Optional[Iterable[Union[str, Tuple[str, Optional[str]]]]],
+                          prefix: Optional[str],
+                          include_versions: bool) -> Iterator[Tuple[str, Optional[str]]]:
+        for file in files or []:
+            yield (file, None) if isinstance(file, str) else tuple(file)
+        
+        if prefix is not None:
+            for obj in MinioExtensions.list_files_from_bucket(client = client, bucket = bucket, prefix = prefix,
+                                                              recurse = True,
+                                                              include_versions = include_versions):
+                if obj.is_delete_marker or obj.object_name.startswith(VERSION_INDEX_PREFIX):
+                    continue
+                yield obj.object_name, obj.version_id if include_versions else None
+    
+    @staticmethod
+    def _iter_objects_metadata(fetch, targets, bucket: str, max_workers: Optional[int],
+                               errors: Optional[Dict[Tuple[str, Optional[str]], BaseException]]
+                               ) -> Iterator[ObjectMetadataInfo]:
+        failures: Dict[Tuple[str, Optional[str]], BaseException] = errors if errors is not None else {}
+        
+        for (name, version_id), metadata, error in iter_completed(fetch, targets, resolve_max_workers(max_workers)):
+            if error is not None:
+                failures[(name, version_id)] = error
+                continue
+            
+            info = ObjectMetadataInfo.from_meta(metadata)
+            info.object_name = name
+            yield info
+        
+        if errors is None and len(failures) > 0:
+            raise BatchOperationException(f"Failed to retrieve the metadata of {len(failures)} object(s) from "
+                                          f"bucket {bucket}.", results = {}, errors = failures)
+    
+    @staticmethod
+    def _may_have_tags(metadata) -> bool:
+        count = metadata.get(OBJECT_META_TAGCOUNT_ATT)
+        
+        if count is None:
+            return not MINIO_S3_METADATA_TRUST_TAGGING_COUNT.get()
+        
+        return int(count) > 0
+    
+    @staticmethod
+    def _copy_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        import copy
+        
+        copied = dict(metadata)
+        copied["tags"] = copy.copy(copied["tags"]) if copied.get("tags") is not None else {}
+        return copied
+    
     @staticmethod
     def get_objects(client: Type[Minio],
                     bucket: Optional[str] = None,
                     bucket_folder_path: Optional[str] = None,
                     files: Optional[List[str]] = None,
-                    suppress_file_path_update: Optional[bool] = True) -> Dict[str, BytesIO]:
+                    suppress_file_path_update: Optional[bool] = True,
+                    max_workers: Optional[int] = None,
+                    max_bytes_in_flight: Optional[int] = None,
+                    errors: Optional[Dict[str, BaseException]] = None) -> Dict[str, BytesIO]:
         """
         Retrieve multiple files from minio given a bucket and files fully qualified bucket path information.
 
@@ -300,12 +902,18 @@ class MinioExtensions:
         suppress file fully qualified path updating when trying to get objects from the bucket. Defaults to False and
         only intended to be used in case the files parameter passed is result of a MinioClient.list_objects call
         using a prefix for search since this call already returns the fully qualified path to resource on bucket if
-        it exists.
+        it exists. max_workers: Number of concurrent downloads to run. When not specified files are downloaded one
+        at a time, otherwise the value is bounded by MINIO_S3_TRANSFER_MAX_WORKERS. max_bytes_in_flight: Maximum
+        amount of bytes being downloaded at the same time on concurrent mode. Defaults to
+        MINIO_S3_TRANSFER_MAX_BYTES_IN_FLIGHT. errors: Optional dictionary collecting the exception raised for each
+        file that could not be downloaded. When not provided, failures are raised as a BatchOperationException
+        once the whole batch has been processed.
 
         Returns:
             A dictionary containing the files and their contents as BytesIO objects.
         """
         objects: Dict[str, BytesIO] = {}
+        failures: Dict[str, BaseException] = errors if errors is not None else {}
         
         if bucket is None:
             raise InvalidBucketException("Specified bucket doesnt exists on client.")
@@ -316,15 +924,68 @@ class MinioExtensions:
         if bucket_folder_path is None and not suppress_file_path_update:
             raise ValueError("Bucket folder path must be provided when suppress_file_path_update is False.")
         
-        for file in files:
+        def _resolve(file):
+            # Listing results carry the object size, which is used to reserve the transfer budget
+            # before the request is issued
+            size = getattr(file, "size", None)
+            file = getattr(file, "object_name", file)
             
             if not suppress_file_path_update:
                 file = f"{bucket_folder_path}/{file}"
             
-            file_io = MinioExtensions.load_file_from_bucket(client, bucket_name = bucket,
-                                                            object_name = file)
+            return file, size
+        
+        if max_workers is None:
+            for file in files or []:
+                file, _ = _resolve(file)
+                
+                try:
+                    objects[file.split("/")[-1]] = MinioExtensions.load_file_from_bucket(client,
+                                                                                         bucket_name = bucket,
+                                                                                         object_name = file)
+                except Exception as e:
+                    if errors is None:
+                        raise
+                    failures[file] = e
+            
+            return objects
+        
+        budget = ByteBudget(resolve_max_bytes_in_flight(max_bytes_in_flight))
+        
+        def _download(item):
+            file, size = item
+            
+            if size is not None:
+                with budget.reserve(size):
+                    return MinioExtensions.load_file_from_bucket(client, bucket_name = bucket, object_name = file)
+            
+            # Size is not known beforehand, so the object is stat'ed to reserve the budget before any body is
+            # requested, pinning the stat'ed version so the body matches the reserved size
+            stat = client.stat_object(bucket_name = bucket, object_name = file)
+            
+            with budget.reserve(stat.size or 0):
+                file_io = BytesIO()
+                for chunk in MinioExtensions.stream_object(client, bucket_name = bucket, object_name = file,
+                                                           version_id = stat.version_id):
+                    file_io.write(chunk)
+                file_io.seek(0)
+                return file_io
+        
+        for (file, _), file_io, error in iter_completed(_download,
+                                                        (_resolve(f) for f in files or []),
+                                                        resolve_max_workers(max_workers)):
+            if error is not None:
+                failures[file] = error
+                continue
+            
             objects[file.split("/")[-1]] = file_io
         
+        if errors is None and len(failures) > 0:
+            raise BatchOperationException(
+                f"Failed to retrieve {len(failures)} object(s) from bucket {bucket}.",
+                results = objects,
+                errors = failures)
+        
         return objects
     
     @staticmethod
@@ -380,7 +1041,10 @@ class MinioExtensions:
     @staticmethod
     def upload_object(client: Type[Minio], bucket: Optional[str] = None, object_name: Optional[str] = None,
                       local_path: Optional[str] = None, content_type: Optional[str] = None,
-                      metadata: Optional[ObjectMetadata] = None):
+                      metadata: Optional[ObjectMetadata] = None,
+                      progress: Optional[ProgressType] = None,
+                      max_workers: Optional[int] = None,
+                      part_size: Optional[int] = None):
         """
         Upload a file to minio given a bucket and file information
 
@@ -391,11 +1055,16 @@ class MinioExtensions:
             local_path: Local path pointing to file stream used to upload on provider.
             content_type: Content type of local file stream to be uploaded. For now only csv files are supported for upload
             metadata: Optional metadata to add to the file.
+            progress: Optional progress tracker notified of the uploaded bytes. Raising from it aborts the upload.
+            max_workers: Number of parts uploaded concurrently on multipart uploads, bounded by
+                MINIO_S3_TRANSFER_MAX_WORKERS. Defaults to the minio client default when not specified.
+            part_size: Size in bytes of each uploaded part. Defaults to MINIO_S3_TRANSFER_PART_SIZE when
+                max_workers is specified, and is raised to the minimum size allowed for the file otherwise.
+                Only one part per worker is held in memory at a time, and a failed multipart upload is aborted.
 
         """
         
         from minio.commonconfig import Tags
-        _metadata = metadata
         _metadata_tags = Tags.new_object_tags()
         
         if bucket is None:
@@ -413,22 +1082,226 @@ class MinioExtensions:
         # if content_type != ContentType.CSV:
         #     raise TypeError("Currently only csv files are supported to upload on provider.")
         
-        if metadata is None:
-            _metadata = {}
+        _metadata = {}
         
-        if _metadata.tags is not None and len(_metadata.tags) > 0:
-            _metadata = _metadata.dict()
-            _metadata.pop("tags")
+        if metadata is not None and metadata.version is not None:
+            _metadata["version"] = str(metadata.version)
+        
+        if metadata is not None and metadata.tags is not None and len(metadata.tags) > 0:
             _metadata_tags = TagMetadata.as_tag(metadata.tags)
         
-        client.fput_object(
+        transfer_options = {}
+        
+        if max_workers is not None or part_size is not None:
+            part_size = part_size or MINIO_S3_TRANSFER_PART_SIZE.get()
+            
+            # Large files would exceed the multipart upload parts limit with the requested part size
+            transfer_options["part_size"] = max(part_size, get_part_info(os.path.getsize(local_path), 0)[0])
+        
+        if max_workers is not None:
+            transfer_options["num_parallel_uploads"] = resolve_max_workers(max_workers)
+        
+        result = client.fput_object(
             bucket_name = bucket,
             object_name = object_name,
             file_path = local_path,
             content_type = content_type,
             metadata = _metadata,
-            tags = _metadata_tags
+            tags = _metadata_tags,
+            progress = progress,
+            **transfer_options
         )
+        
+        # Writing through the version index so the uploaded version can be resolved without scanning. The index is
+        # best-effort: concurrent uploads of the same object may drop each other entries, which get_object then
+        # recovers by scanning the object versions
+        if metadata is not None and metadata.version is not None and result.version_id is not None:
+            index = MinioExtensions.read_version_index(client = client, bucket = bucket, object_name = object_name)
+            index = index if index is not None else VersionIndex(object_name = object_name)
+            index.versions[str(metadata.version)] = result.version_id
+            MinioExtensions._write_version_index(client = client, bucket = bucket, index = index)
+        
+        return result
+    
+    @staticmethod
+    def read_version_index(client: Type[Minio], bucket: Optional[str] = None,
+                           object_name: Optional[str] = None) -> Optional[VersionIndex]:
+        """
+        Reads the version index manifest of an object from bucket.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket where the object is stored.
+            object_name: Fully qualified name of the versioned object.
+        
+        Returns:
+            The object version index or None if no index was written for the object yet.
+        """
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if object_name is None:
+            raise ValueError("Object name is required to read its version index.")
+        
+        try:
+            response = client.get_object(bucket_name = bucket,
+                                         object_name = MinioExtensions._version_index_name(object_name))
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+        
+        try:
+            return VersionIndex.model_validate_json(response.data)
+        finally:
+            response.close()
+            response.release_conn()
+    
+    @staticmethod
+    def rebuild_version_index(client: Type[Minio], bucket: Optional[str] = None,
+                              object_name: Optional[str] = None,
+                              max_workers: Optional[int] = None) -> VersionIndex:
+        """
+        Regenerates the version index manifest of an object scanning all of its stored versions.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket where the object is stored.
+            object_name: Fully qualified name of the versioned object.
+            max_workers: Number of concurrent metadata requests. Defaults to MINIO_S3_TRANSFER_MAX_WORKERS.
+        
+        Returns:
+            The rebuilt version index, already persisted on bucket.
+        """
+        if object_name is None:
+            raise ValueError("Object name is required to rebuild its version index.")
+        
+        index = MinioExtensions._scan_version_index(client = client, bucket = bucket, object_name = object_name,
+                                                    max_workers = max_workers)
+        MinioExtensions._write_version_index(client = client, bucket = bucket, index = index)
+        return index
+    
+    @staticmethod
+    def _scan_version_index(client: Type[Minio], bucket: str, object_name: str,
+                            max_workers: Optional[int] = None) -> VersionIndex:
+        versions = [f for f in MinioExtensions.list_files_from_bucket(
+            client = client,
+            bucket = bucket,
+            prefix = object_name,
+            recurse = False,
+            include_versions = True
+        ) if f.object_name == object_name and not f.is_delete_marker]
+        
+        def _stat(f):
+            return client.stat_object(bucket_name = bucket, object_name = f.object_name, version_id = f.version_id)
+        
+        stats = []
+        for _, stat, error in iter_completed(_stat, versions, resolve_max_workers(max_workers)):
+            if error is not None:
+                raise error
+            stats.append(stat)
+        
+        index = VersionIndex(object_name = object_name)
+        
+        # Newer uploads of the same semantic version take precedence over the older ones
+        for stat in sorted(stats, key = lambda st: st.last_modified or 0):
+            version = ObjectMetadataInfo.from_meta(dict(stat.metadata or {})).version
+            
+            if version is not None and stat.version_id is not None:
+                index.versions[str(version)] = stat.version_id
+        
+        return index
+    
+    @staticmethod
+    def _write_version_index(client: Type[Minio], bucket: str, index: VersionIndex):
+        data = index.model_dump_json().encode("utf-8")
+        client.put_object(bucket_name = bucket,
+                          object_name = MinioExtensions._version_index_name(index.object_name),
+                          data = BytesIO(data),
+                          length = len(data),
+                          content_type = Json)
+    
+    @staticmethod
+    def _version_index_name(object_name: str) -> str:
+        return f"{VERSION_INDEX_PREFIX}{object_name.lstrip('/')}.json"
+    
+    @staticmethod
+    def sync_up(client: Type[Minio], bucket: Optional[str] = None, local_dir: Optional[str] = None,
+                prefix: Optional[str] = None,
+                delete: bool = False,
+                max_workers: Optional[int] = None,
+                part_size: Optional[int] = None,
+                remove_all: bool = False) -> SyncReport:
+        """
+        Incrementally uploads a local directory tree to a bucket prefix.
+        
+        Local files are compared against a single recursive listing of the prefix by size and modification
+        time, falling back to a multipart aware ETag comparison, so only new or changed files are uploaded.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket to upload the directory to.
+            local_dir: Local directory to upload.
+            prefix: Bucket folder the directory maps to. Defaults to the bucket root.
+            delete: Whether to remove objects under prefix that do not exist locally.
+            max_workers: Number of concurrent uploads. Defaults to MINIO_S3_TRANSFER_MAX_WORKERS.
+            part_size: Part size of multipart uploads. Defaults to MINIO_S3_TRANSFER_PART_SIZE.
+            remove_all: Whether deleting without a prefix is allowed to remove every object of the bucket that
+                does not exist locally.
+        
+        Returns:
+            Report of the transferred, skipped, deleted and failed keys.
+        """
+        from minio_extensions.sync import sync_up
+        
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if not MinioExtensions.check_bucket_exists(client = client, bucket = bucket):
+            raise ValueError("Specified bucket does not exists on provider.")
+        
+        if local_dir is None:
+            raise ValueError("Local directory to synchronize must be specified.")
+        
+        return sync_up(client, bucket = bucket, local_dir = local_dir, prefix = prefix, delete = delete,
+                       max_workers = max_workers, part_size = part_size, remove_all = remove_all)
+    
+    @staticmethod
+    def sync_down(client: Type[Minio], bucket: Optional[str] = None, local_dir: Optional[str] = None,
+                  prefix: Optional[str] = None,
+                  delete: bool = False,
+                  max_workers: Optional[int] = None) -> SyncReport:
+        """
+        Incrementally downloads a bucket prefix to a local directory tree.
+        
+        Objects from a single recursive listing of the prefix are compared against local files by size and
+        modification time, falling back to a multipart aware ETag comparison, so only new or changed objects
+        are downloaded.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket to download the objects from.
+            local_dir: Local directory the prefix maps to.
+            prefix: Bucket folder to download. Defaults to the bucket root.
+            delete: Whether to remove local files that do not exist under prefix.
+            max_workers: Number of concurrent downloads. Defaults to MINIO_S3_TRANSFER_MAX_WORKERS.
+        
+        Returns:
+            Report of the transferred, skipped, deleted and failed keys.
+        """
+        from minio_extensions.sync import sync_down
+        
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if not MinioExtensions.check_bucket_exists(client = client, bucket = bucket):
+            raise ValueError("Specified bucket does not exists on provider.")
+        
+        if local_dir is None:
+            raise ValueError("Local directory to synchronize must be specified.")
+        
+        return sync_down(client, bucket = bucket, local_dir = local_dir, prefix = prefix, delete = delete,
+                         max_workers = max_workers)
     
     @staticmethod
     def remove_object(client: Type[Minio], bucket: Optional[str], file: Optional[str]):
@@ -460,6 +1333,371 @@ class MinioExtensions:
                 f"Unknown error when trying to remove object from bucket {bucket}. \nException Message: {S3Error}",
                 False)
     
+    @staticmethod
+    def remove_objects(client: Type[Minio], bucket: Optional[str] = None,
+                       files: Optional[Iterable[Union[str, Tuple[str, Optional[str]]]]] = None,
+                       prefix: Optional[str] = None,
+                       include_versions: bool = False,
+                       max_workers: Optional[int] = None,
+                       remove_all: bool = False) -> RemovalReport:
+        """
+        Removes objects from bucket in batches of multi-object delete requests run concurrently.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket to remove objects from.
+            files: Fully qualified names of the objects to remove, or (name, version_id) pairs to remove specific
+                object versions.
+            prefix: Removes every object under the prefix. Can be combined with files.
+            include_versions: Whether to remove every version and delete marker of the objects under prefix
+                instead of only creating delete markers for them on versioned buckets.
+            max_workers: Number of delete requests run concurrently. Defaults to MINIO_S3_TRANSFER_MAX_WORKERS.
+            remove_all: Whether an empty prefix is allowed to remove every object of the bucket.
+        
+        Returns:
+            Report with the outcome of each object or object version removal. Removed versions are also dropped
+            from the version index of their objects.
+        """
+        from minio.deleteobjects import DeleteObject
+        
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if files is None and prefix is None:
+            raise ValueError("Either files or prefix must be specified to remove objects from bucket.")
+        
+        if prefix == "" and not remove_all:
+            raise ValueError(f"An empty prefix removes every object of bucket {bucket}, set remove_all to do so.")
+        
+        def _targets():
+            for file in files or []:
+                name, version_id = (file, None) if isinstance(file, str) else file
+                yield DeleteObject(name, version_id)
+            
+            # Listings hide version indexes, so bucket wide removals list them on their own
+            prefixes = [prefix, VERSION_INDEX_PREFIX] if prefix == "" else [prefix] if prefix is not None else []
+            
+            for listed_prefix in prefixes:
+                for obj in MinioExtensions.list_files_from_bucket(client = client, bucket = bucket,
+                                                                  prefix = listed_prefix, recurse = True,
+                                                                  include_versions = include_versions):
+                    yield DeleteObject(obj.object_name, obj.version_id if include_versions else None)
+        
+        def _batches():
+            batch = []
+            for target in _targets():
+                batch.append(target)
+                if len(batch) == MAX_DELETE_OBJECTS_PER_REQUEST:
+                    yield batch
+                    batch = []
+            if len(batch) > 0:
+                yield batch
+        
+        def _remove(batch):
+            return list(client.remove_objects(bucket_name = bucket, delete_object_list = batch))
+        
+        report = RemovalReport()
+        
+        for batch, delete_errors, error in iter_completed(_remove, _batches(), resolve_max_workers(max_workers)):
+            failures = {}
+            
+            if error is not None:
+                code = getattr(error, "code", type(error).__name__)
+                failures = {(d.name, d.version_id): (code, str(error)) for d in batch}
+            else:
+                failures = {(e.name, e.version_id): (e.code, e.message) for e in delete_errors}
+            
+            for target in batch:
+                code, message = failures.get((target.name, target.version_id),
+                                             failures.get((target.name, None), (None, None)))
+                report.results.append(ObjectRemovalResult(object_name = target.name,
+                                                          version_id = target.version_id,
+                                                          removed = code is None,
+                                                          error_code = code,
+                                                          error_message = message))
+        
+        MinioExtensions._prune_version_indexes(client, bucket = bucket, removed = report.deleted,
+                                               max_workers = max_workers)
+        return report
+    
+    @staticmethod
+    def _prune_version_indexes(client: Type[Minio], bucket: str, removed: List[ObjectRemovalResult],
+                               max_workers: Optional[int] = None):
+        removed_versions: Dict[str, set] = {}
+        
+        for result in removed:
+            if result.version_id is not None and not result.object_name.startswith(VERSION_INDEX_PREFIX):
+                removed_versions.setdefault(result.object_name, set()).add(result.version_id)
+        
+        if len(removed_versions) == 0:
+            return
+        
+        # A single listing below the common prefix of the removed objects finds the indexes to prune, instead of
+        # requesting the index of every removed object
+        common_prefix = os.path.commonprefix(list(removed_versions))
+        index_prefix = MinioExtensions._version_index_name(common_prefix)[:-len(".json")]
+        indexed = {obj.object_name for obj in client.list_objects(bucket_name = bucket, prefix = index_prefix,
+                                                                  recursive = True)}
+        
+        def _prune(object_name):
+            index = MinioExtensions.read_version_index(client, bucket = bucket, object_name = object_name)
+            
+            if index is None:
+                return
+            
+            versions = {k: v for k, v in index.versions.items() if v not in removed_versions[object_name]}
+            
+            if versions == index.versions:
+                return
+            
+            if len(versions) == 0:
+                client.remove_object(bucket_name = bucket,
+                                     object_name = MinioExtensions._version_index_name(object_name))
+                return
+            
+            index.versions = versions
+            MinioExtensions._write_version_index(client = client, bucket = bucket, index = index)
+        
+        # Indexes left stale are rebuilt on their next read, so a failed prune does not fail the removal
+        targets = [name for name in removed_versions if MinioExtensions._version_index_name(name) in indexed]
+        
+        for _ in iter_completed(_prune, targets, resolve_max_workers(max_workers)):
+            pass
+    
+    @staticmethod
+    def tag_objects(client: Type[Minio], bucket: Optional[str] = None,
+                    files: Optional[Iterable[Union[str, Tuple[str, Optional[str]]]]] = None,
+                    prefix: Optional[str] = None,
+                    tags: Optional[Union[Dict[str, str], TagMetadata, List[TagMetadata], Iterable[str]]] = None,
+                    operation: TagOperationOptions = "merge",
+                    duplicate_options: TagDuplicateOptions = "raise",
+                    include_versions: bool = False,
+                    max_workers: Optional[int] = None,
+                    inventory: Optional[BucketInventory] = None,
+                    cache: Optional[MetadataCache] = None) -> TaggingReport:
+        """
+        Sets, merges or removes the tags of many objects concurrently.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket where the objects are stored.
+            files: Fully qualified names of the objects to tag, or (name, version_id) pairs to tag specific object
+                versions.
+            prefix: Tags every object under the prefix. Can be combined with files.
+            tags: Tags to write, as a dictionary or TagMetadata objects. Removals also accept the tag names alone,
+                while set and merge raise a ValueError for tags without a value.
+            operation: set replaces the tags of each object, merge adds the tags to the ones each object already
+                holds and remove drops the tags with the given names. Objects whose tags would not change are
+                left untouched.
+            duplicate_options: How tags already present on an object with a different content are merged, with the
+                same semantics of TagMetadata.as_tag: raise marks the object as failed, preserve keeps both tags
+                and append joins both contents.
+            include_versions: Whether to tag every version of the objects under prefix instead of the latest ones.
+            max_workers: Number of objects tagged concurrently. Defaults to MINIO_S3_TRANSFER_MAX_WORKERS.
+            inventory: Optional bucket inventory whose tag index is updated with the tags written, so tag queries
+                on it see them without being refreshed.
+            cache: Optional metadata cache whose entries of the tagged objects are invalidated.
+        
+        Returns:
+            Report with the outcome and resulting tags of each object or object version, also available keyed by
+            (object_name, version_id) through TaggingReport.by_object.
+        """
+        from minio.commonconfig import Tags
+        
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if files is None and prefix is None:
+            raise ValueError("Either files or prefix must be specified to tag objects from bucket.")
+        
+        if operation not in ("set", "merge", "remove"):
+            raise ValueError("The tagging operation must be either 'set', 'merge' or 'remove'.")
+        
+        if duplicate_options not in ("raise", "preserve", "append"):
+            raise ValueError("The parameter errors must be either 'raise', 'preserve' or append")
+        
+        pairs = MinioExtensions._tag_pairs(tags)
+        
+        if operation != "remove":
+            missing = [n for n, c in pairs if c is None]
+            if len(missing) > 0:
+                raise ValueError(f"Tags {', '.join(missing)} have no value, only removals accept tag names alone.")
+        
+        def _targets():
+            for file in files or []:
+                yield (file, None) if isinstance(file, str) else tuple(file)
+            
+            if prefix is not None:
+                for obj in MinioExtensions.list_files_from_bucket(client = client, bucket = bucket, prefix = prefix,
+                                                                  recurse = True,
+                                                                  include_versions = include_versions):
+                    if obj.is_delete_marker or obj.object_name.startswith(VERSION_INDEX_PREFIX):
+                        continue
+                    yield obj.object_name, obj.version_id if include_versions else None
+        
+        def _tag(target):
+            name, version_id = target
+            current = {} if operation == "set" else dict(client.get_object_tags(
+                bucket_name = bucket, object_name = name, version_id = version_id) or {})
+            updated = Tags.new_object_tags()
+            
+            if operation == "remove":
+                removed = {n for n, _ in pairs}
+                for n, c in current.items():
+                    if n not in removed:
+                        updated[n] = c
+            else:
+                for n, c in current.items():
+                    updated[n] = c
+                for n, c in pairs:
+                    if updated.get(n) != c:
+                        TagMetadata.merge(updated, n, c, duplicate_options = duplicate_options)
+            
+            if operation != "set" and dict(updated) == current:
+                return updated, False
+            
+            if len(updated) > 0:
+                client.set_object_tags(bucket_name = bucket, object_name = name, tags = updated,
+                                       version_id = version_id)
+            else:
+                client.delete_object_tags(bucket_name = bucket, object_name = name, version_id = version_id)
+            
+            return updated, True
+        
+        report = TaggingReport()
+        
+        for (name, version_id), result, error in iter_completed(_tag, _targets(), resolve_max_workers(max_workers)):
+            if error is not None:
+                report.results.append(ObjectTaggingResult(object_name = name, version_id = version_id, tagged = False,
+                                                          changed = False,
+                                                          error_code = getattr(error, "code", type(error).__name__),
+                                                          error_message = str(error)))
+                continue
+            
+            updated, changed = result
+            
+            if inventory is not None:
+                inventory.store_tags(bucket, name, updated, version_id = version_id)
+            
+            if cache is not None and changed:
+                cache.invalidate(bucket, name)
+            
+            report.results.append(ObjectTaggingResult(object_name = name, version_id = version_id, changed = changed,
+                                                      tags = dict(updated)))
+        
+        return report
+    
+    @staticmethod
+    def _tag_pairs(tags) -> List[Tuple[str, Optional[str]]]:
+        if tags is None:
+            return []
+        
+        if isinstance(tags, (TagMetadata, str)):
+            tags = [tags]
+        
+        if isinstance(tags, dict):
+            return list(tags.items())
+        
+        return [(t.name, t.content) if isinstance(t, TagMetadata) else (t, None) if isinstance(t, str) else tuple(t)
+                for t in tags]
+    
+    @staticmethod
+    def select_object(client: Type[Minio], bucket: Optional[str] = None, object_name: Optional[str] = None,
+                      expression: Optional[str] = None,
+                      input_format: Optional[InputFormat] = None,
+                      output_format: OutputFormat = "json",
+                      compression: Optional[str] = None,
+                      file_header_info: Optional[str] = "USE",
+                      field_delimiter: Optional[str] = None) -> Iterator[Any]:
+        """
+        Filters a CSV, JSON lines or Parquet object on server side with an S3 Select SQL expression, so only
+        the matching records are transferred.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket containing the object to query.
+            object_name: Fully qualified name of the object to query.
+            expression: S3 Select SQL expression, e.g. ``SELECT s.id FROM S3Object s WHERE s.total > 100``.
+            input_format: Format of the object contents, one of csv, json or parquet. Inferred from the object
+                name extension when not specified, along with gzip or bzip2 compression. Parquet objects require
+                a server with S3 Select over parquet enabled.
+            output_format: Format of the records yielded. json records are yielded as dictionaries while csv
+                records are yielded as lists of fields.
+            compression: Compression of the object contents, one of NONE, GZIP or BZIP2.
+            file_header_info: Header handling of CSV objects, one of USE, IGNORE or NONE.
+            field_delimiter: Field delimiter of CSV objects. Defaults to a tab for .tsv objects and to a comma
+                otherwise.
+        
+        Returns:
+            Iterator over the matching records, yielded as they are received. The response is released once
+            the iterator is exhausted or closed.
+        """
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if object_name is None or expression is None:
+            raise ValueError("Both object name and expression are required to query objects on bucket")
+        
+        return select_records(client, bucket, object_name, expression, output_format = output_format,
+                              input_format = input_format, compression = compression,
+                              file_header_info = file_header_info, field_delimiter = field_delimiter)
+    
+    @staticmethod
+    def select_objects(client: Type[Minio], bucket: Optional[str] = None,
+                       expression: Optional[str] = None,
+                       prefix: Optional[str] = None,
+                       files: Optional[Iterable[str]] = None,
+                       max_workers: Optional[int] = None,
+                       errors: Optional[Dict[str, BaseException]] = None,
+                       **kwargs) -> Iterator[Tuple[str, Any]]:
+        """
+        Runs an S3 Select SQL expression concurrently against every object of a list or below a prefix.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket containing the objects to query.
+            expression: S3 Select SQL expression to run against each object.
+            prefix: Prefix of the objects to query. Every object below it is queried.
+            files: Fully qualified names of the objects to query, in addition to the ones below prefix.
+            max_workers: Maximum number of objects queried at the same time.
+            errors: Optional dictionary collecting the exception raised for each object that could not be
+                queried. When not provided, failures are raised as a BatchOperationException once every other
+                object was queried.
+            **kwargs: Any serialization option accepted by select_object.
+        
+        Returns:
+            Iterator over (object_name, record) tuples, in the order records are received.
+        """
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if expression is None:
+            raise ValueError("Expression is required to query objects on bucket")
+        
+        return MinioExtensions._iter_selected_records(client, bucket, expression, prefix, files, max_workers,
+                                                      errors, **kwargs)
+    
+    @staticmethod
+    def _iter_selected_records(client: Type[Minio], bucket: str, expression: str, prefix: Optional[str],
+                               files: Optional[Iterable[str]], max_workers: Optional[int],
+                               errors: Optional[Dict[str, BaseException]],
+                               **kwargs) -> Iterator[Tuple[str, Any]]:
+        names = list(files or [])
+        
+        if prefix is not None:
+            names.extend(obj.object_name for obj in client.list_objects(bucket_name = bucket, prefix = prefix,
+                                                                        recursive = True)
+                         if not obj.is_dir and not obj.object_name.startswith(VERSION_INDEX_PREFIX))
+        
+        failures: Dict[str, BaseException] = errors if errors is not None else {}
+        
+        yield from fan_out_select(client, bucket, dict.fromkeys(names), expression,
+                                  max_workers = resolve_max_workers(max_workers), errors = failures, **kwargs)
+        
+        if errors is None and len(failures) > 0:
+            raise BatchOperationException(f"Failed to query {len(failures)} object(s) from bucket {bucket}.",
+                                          results = {}, errors = failures)
+    
     @staticmethod
     def is_bucket_active(client: Type[Minio], bucket: Optional[str], file: Optional[str]):
         """
@@ -482,7 +1720,8 @@ class MinioExtensions:
             return False
     
     @staticmethod
-    def is_folder(client: Type[Minio], bucket: Optional[str] = None, folder_name: Optional[str] = None) -> bool:
+    def is_folder(client: Type[Minio], bucket: Optional[str] = None, folder_name: Optional[str] = None,
+                  inventory: Optional[BucketInventory] = None) -> bool:
         """
         Checks if the given object exists in the given bucket.
 
@@ -490,6 +1729,7 @@ class MinioExtensions:
             client: Minio client instance.
             bucket: Target bucket name to try finding folder existence from.
             folder_name: Path inside bucket to the folder whose existence should be checked.
+            inventory: Optional bucket inventory to answer from instead of listing the bucket.
 
         Returns:
             True if specified folder exists inside bucket on informed path, otherwise false.
@@ -497,13 +1737,16 @@ class MinioExtensions:
         if bucket is None:
             raise InvalidBucketException("Bucket not specified.")
         
+        if inventory is not None:
+            return inventory.is_folder(bucket, folder_name)
+        
         bucket_objects = MinioExtensions.list_files_from_bucket(
             client = client,
             bucket = bucket,
             prefix = folder_name)
         
         for obj in bucket_objects:
-            if obj.object_name.enswith("/"):
+            if obj.object_name.endswith("/"):
                 return True
         
         return False
@@ -512,18 +1755,144 @@ class MinioExtensions:
     def list_files_from_bucket(client: Type[Minio], bucket: Optional[str], prefix: Optional[str] = None,
                                recurse: Optional[bool] = False,
                                include_versions: Optional[bool] = False,
-                               include_metadata: Optional[bool] = False):
-        """List all files in the specified bucket on current provider if exists any"""
+                               include_metadata: Optional[bool] = False,
+                               inventory: Optional[BucketInventory] = None,
+                               parallel: Optional[bool] = False,
+                               max_workers: Optional[int] = None,
+                               ordered: Optional[bool] = True):
+        """
+        List all files in the specified bucket on current provider if exists any.
+        
+        When an inventory is provided the listing is served from it, as recent as its last refresh, without
+        sending any request to the provider.
+        
+        Recursive listings can be run in parallel, listing each folder below prefix concurrently and splitting
+        folders holding more than a listing page by their own subfolders, as described on iter_objects_parallel.
+        Objects are still yielded in key order unless ordered is disabled, in which case they are yielded as soon
+        as their folder is listed. Folders are the only unit listings are split by, so flat prefixes holding
+        every key directly below them are listed sequentially anyway.
+        """
+        if inventory is not None:
+            return inventory.list_objects(bucket, prefix = prefix, recursive = recurse,
+                                          include_versions = include_versions)
+        
         if not MinioExtensions.check_bucket_exists(client = client, bucket = bucket):
             raise InvalidBucketException(f"Bucket {bucket} does not exist on current provider")
         
-        return client.list_objects(
-            bucket_name = bucket,
-            recursive = recurse,
-            prefix = prefix,
-            include_version = include_versions,
-            include_user_meta = include_metadata
-        )
+        if parallel and recurse:
+            objects = iter_objects_parallel(client, bucket, prefix = prefix, include_versions = include_versions,
+                                            include_metadata = include_metadata, max_workers = max_workers,
+                                            ordered = ordered)
+        else:
+            objects = client.list_objects(
+                bucket_name = bucket,
+                recursive = recurse,
+                prefix = prefix,
+                include_version = include_versions,
+                include_user_meta = include_metadata
+            )
+        
+        # Version index manifests are only listed when explicitly asked for
+        if prefix is not None and prefix.startswith(VERSION_INDEX_PREFIX.split("/")[0]):
+            return objects
+        
+        return (obj for obj in objects if not MinioExtensions._is_version_index_entry(obj))
+    
+    @staticmethod
+    def _is_version_index_entry(obj) -> bool:
+        return obj.object_name.startswith(VERSION_INDEX_PREFIX) or \
+            (obj.is_dir and VERSION_INDEX_PREFIX.startswith(obj.object_name))
+    
+    @staticmethod
+    def list_objects_table(client: Type[Minio], bucket: Optional[str] = None, prefix: Optional[str] = None,
+                           include_versions: bool = False,
+                           include_metadata: bool = False,
+                           batch_size: Optional[int] = None,
+                           inventory: Optional[BucketInventory] = None,
+                           max_workers: Optional[int] = None) -> ObjectTable:
+        """
+        Lists every object below prefix into a compact, column oriented table, built in batches while the
+        listing pages are received.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket to list objects from.
+            prefix: Prefix of the listed objects. Lists the whole bucket when not specified.
+            include_versions: Whether to list every object version and delete marker.
+            include_metadata: Whether to request the user metadata of objects, which includes their content
+                type on MinIO servers.
+            batch_size: Objects appended to the table per batch. Defaults to DEFAULT_BATCH_SIZE.
+            inventory: Optional bucket inventory to load the objects from instead of listing the bucket.
+            max_workers: Number of concurrent listings. When greater than one the folders below prefix are listed
+                in parallel, appending their objects to the table as each of them finishes.
+        
+        Returns:
+            Table exportable to NumPy, pyarrow or pandas, e.g. ``table.to_pandas()``.
+        """
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        if inventory is not None:
+            return inventory.query_table(bucket, prefix = prefix, batch_size = batch_size,
+                                         include_versions = include_versions)
+        
+        objects = MinioExtensions.list_files_from_bucket(client = client, bucket = bucket, prefix = prefix,
+                                                         recurse = True, include_versions = include_versions,
+                                                         include_metadata = include_metadata,
+                                                         parallel = max_workers is not None and max_workers > 1,
+                                                         max_workers = max_workers, ordered = False)
+        return ObjectTable.from_objects(objects, bucket_name = bucket, batch_size = batch_size)
+    
+    @staticmethod
+    def stat_objects_table(client: Type[Minio], bucket: Optional[str] = None,
+                           files: Optional[Iterable[Union[str, Tuple[str, Optional[str]]]]] = None,
+                           max_workers: Optional[int] = None,
+                           batch_size: Optional[int] = None,
+                           errors: Optional[Dict[str, BaseException]] = None) -> ObjectTable:
+        """
+        Fetches the metadata of several objects concurrently into a compact, column oriented table.
+        
+        Args:
+            client: Minio client instance.
+            bucket: Bucket where the objects are stored.
+            files: Fully qualified names of the objects, or (name, version_id) pairs of specific versions.
+            max_workers: Number of concurrent metadata requests. Defaults to MINIO_S3_TRANSFER_MAX_WORKERS.
+            batch_size: Objects appended to the table per batch. Defaults to DEFAULT_BATCH_SIZE.
+            errors: Optional dictionary collecting the exception raised for each object whose metadata could not
+                be fetched. When not provided, failures are raised as a BatchOperationException once every other
+                object was processed.
+        
+        Returns:
+            Table holding a row per object, in the order the requests completed.
+        """
+        if bucket is None:
+            raise InvalidBucketException("Bucket not specified.")
+        
+        def _stat(file):
+            name, version_id = (file, None) if isinstance(file, str) else file
+            return client.stat_object(bucket_name = bucket, object_name = name, version_id = version_id)
+        
+        table = ObjectTable(bucket)
+        failures: Dict[str, BaseException] = errors if errors is not None else {}
+        batch = []
+        
+        for file, stat, error in iter_completed(_stat, files or [], resolve_max_workers(max_workers)):
+            if error is not None:
+                failures[file if isinstance(file, str) else file[0]] = error
+                continue
+            
+            batch.append(stat)
+            if len(batch) == (batch_size or DEFAULT_BATCH_SIZE):
+                table.extend(batch)
+                batch = []
+        
+        table.extend(batch)
+        
+        if errors is None and len(failures) > 0:
+            raise BatchOperationException(f"Failed to fetch the metadata of {len(failures)} object(s) from bucket "
+                                          f"{bucket}.", results = {}, errors = failures)
+        
+        return table
     
     @staticmethod
     def enable_object_versioning(client: Type[Minio], bucket: Optional[str] = None):
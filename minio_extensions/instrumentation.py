@@ -0,0 +1,428 @@
+import bisect
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from urllib3 import PoolManager, ProxyManager
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Tuple,
+    Any
+)
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_hooks: Tuple["InstrumentationHook", ...] = ()
+_hooks_lock = threading.Lock()
+
+
+class InstrumentationHook:
+    """
+    Receives the measurements of MinioExtensions operations, HTTP requests and cache lookups.
+
+    Subclasses override the callbacks they are interested in. Callbacks run on the thread performing the
+    measured work, so they must be thread safe and quick.
+    """
+
+    def operation_started(self, operation: str) -> Any:
+        """Called when an operation starts. The returned value is handed back to operation_finished."""
+        return None
+
+    def operation_finished(self, operation: str, token: Any, duration: float, error: Optional[BaseException]):
+        pass
+
+    def request_finished(self, method: str, host: str, status: Optional[int], ttfb: float,
+                         transfer_time: Optional[float], bytes_sent: int, bytes_received: int, retries: int,
+                         started_at: float):
+        """
+        Called once the response of an HTTP request is read or closed. ttfb is the time until the response headers
+        were received and transfer_time the time spent afterwards reading the body. started_at is the wall
+        clock time the request was sent at.
+        """
+
+    def cache_lookup(self, cache: str, hit: bool):
+        pass
+
+
+def register(hook: InstrumentationHook) -> InstrumentationHook:
+    """Starts reporting measurements to a hook."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+    return hook
+
+
+def unregister(hook: InstrumentationHook):
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(h for h in _hooks if h is not hook)
+
+
+def is_enabled() -> bool:
+    return len(_hooks) > 0
+
+
+def record_cache_lookup(cache: str, hit: bool):
+    for hook in _hooks:
+        hook.cache_lookup(cache, hit)
+
+
+def instrument_operation(operation: str, func):
+    """
+    Wraps an operation reporting its duration and outcome to the registered hooks. Generator operations are
+    measured until they are exhausted or closed. When no hook is registered the wrapper only checks for them
+    before calling the operation.
+    """
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def _generator(*args, **kwargs):
+            if not _hooks:
+                return (yield from func(*args, **kwargs))
+            with _Measure(operation):
+                return (yield from func(*args, **kwargs))
+
+        return _generator
+
+    @functools.wraps(func)
+    def _operation(*args, **kwargs):
+        if not _hooks:
+            return func(*args, **kwargs)
+        with _Measure(operation):
+            return func(*args, **kwargs)
+
+    return _operation
+
+
+def instrument_operations(cls):
+    """
+    Instruments every public static method of a class. Context manager operations are measured until their
+    context exits.
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not isinstance(member, staticmethod):
+            continue
+
+        func = member.__func__
+        wrapped = getattr(func, "__wrapped__", None)
+
+        if wrapped is not None and inspect.isgeneratorfunction(wrapped):
+            instrumented = contextmanager(instrument_operation(f"{cls.__name__}.{name}", wrapped))
+        else:
+            instrumented = instrument_operation(f"{cls.__name__}.{name}", func)
+
+        setattr(cls, name, staticmethod(instrumented))
+    return cls
+
+
+class _Measure:
+
+    __slots__ = ("_operation", "_hooks", "_tokens", "_start")
+
+    def __init__(self, operation: str) -> None:
+        self._operation = operation
+
+    def __enter__(self):
+        self._hooks = _hooks
+        self._tokens = [hook.operation_started(self._operation) for hook in self._hooks]
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self._start
+        for hook, token in zip(self._hooks, self._tokens):
+            hook.operation_finished(self._operation, token, duration, exc_val)
+
+
+class _InstrumentedRequests:
+    """
+    Pool manager mixin measuring the requests sent by minio. Responses are always opened unloaded so the time
+    to first byte is taken apart from the body transfer time.
+    """
+
+    def urlopen(self, method, url, redirect = True, **kw):
+        if not _hooks:
+            return super().urlopen(method, url, redirect = redirect, **kw)
+
+        preload_content = kw.pop("preload_content", True)
+        body = kw.get("body")
+        started_at = time.time()
+        start = time.perf_counter()
+
+        response = super().urlopen(method, url, redirect = redirect, preload_content = False, **kw)
+        ttfb = time.perf_counter() - start
+        close = response.close
+        reported = []
+
+        def _report(transfer_time: Optional[float]):
+            if reported:
+                return
+            reported.append(True)
+            retries = len(response.retries.history) if response.retries is not None else 0
+            for hook in _hooks:
+                hook.request_finished(method, urlsplit(url).netloc, response.status, ttfb, transfer_time,
+                                      len(body) if isinstance(body, (bytes, bytearray)) else 0,
+                                      response.tell(), retries, started_at)
+
+        if preload_content:
+            transfer_start = time.perf_counter()
+            try:
+                response.data
+            finally:
+                _report(time.perf_counter() - transfer_start)
+                response.release_conn()
+            return response
+
+        def _close_and_report():
+            # Streamed bodies are read by the caller, which closes the response once done with it. urllib3 also
+            # releases fully read responses on its own, before accounting the last bytes read, so the release
+            # can not be used to report them
+            _report(time.perf_counter() - start - ttfb)
+            close()
+
+        response.close = _close_and_report
+        return response
+
+
+class InstrumentedPoolManager(_InstrumentedRequests, PoolManager):
+    pass
+
+
+class InstrumentedProxyManager(_InstrumentedRequests, ProxyManager):
+    pass
+
+
+class _Histogram:
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"buckets": dict(zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"], self.counts)),
+                "sum": self.total, "count": self.count}
+
+
+class InMemoryMetrics(InstrumentationHook):
+    """
+    Aggregates measurements in memory: call and error counts with latency histograms per operation, request
+    counts, time to first byte and transfer time histograms, bytes and retries per HTTP method, and hits and
+    misses per cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.operations: Dict[str, Dict[str, Any]] = {}
+            self.requests: Dict[str, Dict[str, Any]] = {}
+            self.caches: Dict[str, Dict[str, int]] = {}
+
+    def operation_finished(self, operation, token, duration, error):
+        with self._lock:
+            stats = self.operations.get(operation)
+            if stats is None:
+                stats = self.operations[operation] = {"calls": 0, "errors": 0, "latency": _Histogram()}
+            stats["calls"] += 1
+            stats["errors"] += error is not None
+            stats["latency"].observe(duration)
+
+    def request_finished(self, method, host, status, ttfb, transfer_time, bytes_sent, bytes_received, retries,
+                         started_at):
+        with self._lock:
+            stats = self.requests.get(method)
+            if stats is None:
+                stats = self.requests[method] = {"requests": 0, "errors": 0, "retries": 0, "bytes_sent": 0,
+                                                 "bytes_received": 0, "ttfb": _Histogram(),
+                                                 "transfer_time": _Histogram()}
+            stats["requests"] += 1
+            stats["errors"] += status is None or status >= 400
+            stats["retries"] += retries
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+            stats["ttfb"].observe(ttfb)
+            if transfer_time is not None:
+                stats["transfer_time"].observe(transfer_time)
+
+    def cache_lookup(self, cache, hit):
+        with self._lock:
+            stats = self.caches.setdefault(cache, {"hits": 0, "misses": 0})
+            stats["hits" if hit else "misses"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns a plain copy of the aggregated measurements."""
+        def _plain(stats):
+            return {k: v.as_dict() if isinstance(v, _Histogram) else v for k, v in stats.items()}
+
+        with self._lock:
+            return {
+                "operations": {name: _plain(s) for name, s in self.operations.items()},
+                "requests": {name: _plain(s) for name, s in self.requests.items()},
+                "caches": {name: dict(s) for name, s in self.caches.items()}
+            }
+
+
+class PrometheusExporter(InMemoryMetrics):
+    """
+    In-memory metrics rendered on the Prometheus text exposition format, optionally served over HTTP.
+    """
+
+    def __init__(self, namespace: str = "minio_extensions") -> None:
+        super().__init__()
+        self._namespace = namespace
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def render(self) -> str:
+        snapshot = self.snapshot()
+        ns = self._namespace
+        lines: List[str] = []
+
+        def _metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{ns}_{name}{labels} {value}")
+
+        def _histogram(name, help_text, label, items):
+            samples = []
+            for key, histogram in items:
+                cumulative = 0
+                for bound, count in histogram["buckets"].items():
+                    cumulative += count
+                    samples.append((f'_bucket{{{label}="{key}",le="{bound}"}}', cumulative))
+                samples.append((f'_sum{{{label}="{key}"}}', histogram["sum"]))
+                samples.append((f'_count{{{label}="{key}"}}', histogram["count"]))
+            _metric(name, "histogram", help_text, samples)
+
+        operations = sorted(snapshot["operations"].items())
+        requests = sorted(snapshot["requests"].items())
+        caches = sorted(snapshot["caches"].items())
+
+        _metric("operation_calls_total", "counter", "Operation calls.",
+                [(f'{{operation="{k}"}}', s["calls"]) for k, s in operations])
+        _metric("operation_errors_total", "counter", "Operation calls that raised.",
+                [(f'{{operation="{k}"}}', s["errors"]) for k, s in operations])
+        _histogram("operation_duration_seconds", "Operation duration.", "operation",
+                   [(k, s["latency"]) for k, s in operations])
+        _metric("http_requests_total", "counter", "HTTP requests sent.",
+                [(f'{{method="{k}"}}', s["requests"]) for k, s in requests])
+        _metric("http_request_errors_total", "counter", "HTTP requests answered with an error status.",
+                [(f'{{method="{k}"}}', s["errors"]) for k, s in requests])
+        _metric("http_request_retries_total", "counter", "HTTP request retries.",
+                [(f'{{method="{k}"}}', s["retries"]) for k, s in requests])
+        _metric("http_sent_bytes_total", "counter", "HTTP request body bytes sent.",
+                [(f'{{method="{k}"}}', s["bytes_sent"]) for k, s in requests])
+        _metric("http_received_bytes_total", "counter", "HTTP response body bytes received.",
+                [(f'{{method="{k}"}}', s["bytes_received"]) for k, s in requests])
+        _histogram("http_time_to_first_byte_seconds", "Time until the response headers were received.", "method",
+                   [(k, s["ttfb"]) for k, s in requests])
+        _histogram("http_transfer_seconds", "Time spent reading response bodies.", "method",
+                   [(k, s["transfer_time"]) for k, s in requests])
+        _metric("cache_hits_total", "counter", "Cache lookups served from cache.",
+                [(f'{{cache="{k}"}}', s["hits"]) for k, s in caches])
+        _metric("cache_misses_total", "counter", "Cache lookups missing the cache.",
+                [(f'{{cache="{k}"}}', s["misses"]) for k, s in caches])
+
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, address: str = "") -> ThreadingHTTPServer:
+        """
+        Serves the rendered metrics on a background thread at ``http://address:port/metrics``.
+        """
+        exporter = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+
+                payload = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((address, port), _MetricsHandler)
+        threading.Thread(target = self._server.serve_forever, name = "minio-extensions-metrics",
+                         daemon = True).start()
+        return self._server
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class OpenTelemetryExporter(InstrumentationHook):
+    """
+    Reports operations as OpenTelemetry spans and HTTP requests as child spans carrying their time to first
+    byte, transfer time, bytes and retries. Requires the opentelemetry-api package.
+    """
+
+    def __init__(self, tracer_provider = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as e:
+            raise ImportError("OpenTelemetryExporter requires the opentelemetry-api package.") from e
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("minio_extensions", tracer_provider = tracer_provider)
+
+    def operation_started(self, operation):
+        span = self._tracer.start_span(operation)
+        return span, self._trace.context_api.attach(self._trace.set_span_in_context(span))
+
+    def operation_finished(self, operation, token, duration, error):
+        span, context_token = token
+        self._trace.context_api.detach(context_token)
+
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+
+        span.end()
+
+    def request_finished(self, method, host, status, ttfb, transfer_time, bytes_sent, bytes_received, retries,
+                         started_at):
+        start_ns = int(started_at * 1e9)
+        end_ns = start_ns + int((ttfb + (transfer_time or 0.0)) * 1e9)
+        span = self._tracer.start_span(f"HTTP {method}", start_time = start_ns, attributes = {
+            "http.request.method": method,
+            "server.address": host,
+            "http.response.status_code": status or 0,
+            "http.request.body.size": bytes_sent,
+            "http.response.body.size": bytes_received,
+            "http.request.resend_count": retries,
+            "minio_extensions.time_to_first_byte": ttfb,
+            "minio_extensions.transfer_time": transfer_time or 0.0
+        })
+        span.add_event("first_byte", timestamp = start_ns + int(ttfb * 1e9))
+        span.end(end_time = end_ns)
+
+    def cache_lookup(self, cache, hit):
+        span = self._trace.get_current_span()
+        if span.is_recording():
+            span.add_event("cache_hit" if hit else "cache_miss", attributes = {"cache": cache})
@@ -0,0 +1,630 @@
+import datetime
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from minio import Minio, S3Error
+from minio.datatypes import Object
+
+from minio_extensions._concurrency import (
+    iter_completed,
+    resolve_max_workers
+)
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    Union,
+    Iterable,
+    Any
+)
+from minio_extensions.environment import MINIO_S3_INVENTORY_PATH
+from minio_extensions.metadata.constants import VERSION_INDEX_PREFIX
+from minio_extensions.reports import (
+    InventoryRefreshReport,
+    TagIndexRefreshReport
+)
+from minio_extensions.table import (
+    DEFAULT_BATCH_SIZE,
+    ObjectTable
+)
+from minio_extensions._timestamps import MISSING_TIMESTAMP
+
+Timestamp = Union[datetime.datetime, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version_id TEXT NOT NULL DEFAULT '',
+    size INTEGER,
+    etag TEXT,
+    last_modified REAL,
+    is_latest INTEGER NOT NULL DEFAULT 1,
+    is_delete_marker INTEGER NOT NULL DEFAULT 0,
+    metadata TEXT,
+    tags TEXT,
+    PRIMARY KEY (bucket, key, version_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS objects_last_modified ON objects (bucket, last_modified);
+CREATE INDEX IF NOT EXISTS objects_size ON objects (bucket, size);
+CREATE TABLE IF NOT EXISTS object_tags (
+    bucket TEXT NOT NULL,
+    key TEXT NOT NULL,
+    version_id TEXT NOT NULL DEFAULT '',
+    name TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (bucket, key, version_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS object_tags_lookup ON object_tags (bucket, name, value);
+CREATE TABLE IF NOT EXISTS refreshes (
+    bucket TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    watermark REAL,
+    PRIMARY KEY (bucket, prefix)
+) WITHOUT ROWID;
+"""
+
+_COLUMNS = "key, version_id, size, etag, last_modified, is_latest, is_delete_marker, metadata"
+
+# Tags fetched for an object are kept while its content is the same, and forgotten once it is overwritten
+_UPSERT = f"""
+INSERT INTO objects (bucket, {_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (bucket, key, version_id) DO UPDATE SET
+    size = excluded.size,
+    etag = excluded.etag,
+    last_modified = excluded.last_modified,
+    is_latest = excluded.is_latest,
+    is_delete_marker = excluded.is_delete_marker,
+    metadata = excluded.metadata,
+    tags = CASE WHEN objects.etag IS excluded.etag AND objects.last_modified IS excluded.last_modified
+                THEN objects.tags END
+"""
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Smallest string greater than every string starting with prefix, in SQLite binary collation."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+
+def _glob_literal_prefix(pattern: str) -> str:
+    for i, c in enumerate(pattern):
+        if c in "*?[":
+            return pattern[:i]
+    return pattern
+
+
+def _as_timestamp(value: Optional[Timestamp]) -> Optional[float]:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return value.timestamp()
+
+
+def _as_row(obj: Object) -> Tuple[Any, ...]:
+    return (
+        obj.object_name,
+        obj.version_id or "",
+        obj.size,
+        obj.etag,
+        _as_timestamp(obj.last_modified),
+        0 if str(obj.is_latest).lower() == "false" else 1,
+        1 if obj.is_delete_marker else 0,
+        json.dumps(dict(obj.metadata)) if obj.metadata else None
+    )
+
+
+class BucketInventory:
+    """
+    Persistent local inventory of bucket listings stored on a SQLite database.
+
+    The inventory is populated by a full scan of the bucket and then refreshed incrementally, re-listing only
+    the requested prefixes and writing only the rows of objects added, modified or removed since the previous
+    refresh. Prefix, glob, size and modification date queries run against the local database with no request
+    sent to the server, so they answer in milliseconds regardless of the bucket size. Listings served by the
+    inventory are only as recent as its last refresh.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        path = path if path is not None else MINIO_S3_INVENTORY_PATH.get()
+        self._path = path if path is not None \
+            else os.path.join(tempfile.gettempdir(), "minio-extensions-inventory.sqlite3")
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self._path, check_same_thread = False)
+
+        if self._path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+        # Inventories created before tags were indexed lack the column holding them
+        if "tags" not in {row[1] for row in self._connection.execute("PRAGMA table_info(objects)")}:
+            self._connection.execute("ALTER TABLE objects ADD COLUMN tags TEXT")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "BucketInventory":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def refresh(self, client: Type[Minio], bucket: str,
+                prefixes: Optional[Iterable[str]] = None,
+                include_versions: bool = False,
+                include_metadata: bool = False,
+                max_workers: Optional[int] = None) -> InventoryRefreshReport:
+        """
+        Synchronizes the inventory of a bucket with its current listing.
+
+        Args:
+            client: Minio client instance.
+            bucket: Name of the bucket to inventory.
+            prefixes: Prefixes known to have changed. Only the keys below them are listed again while the rest
+                of the inventory is left untouched. When not specified the whole bucket is listed, with each
+                top level folder listed concurrently.
+            include_versions: Whether to inventory every object version and delete marker instead of the
+                latest object versions only.
+            include_metadata: Whether to store the user metadata of each object along with it.
+            max_workers: Maximum number of listings running at the same time.
+
+        Returns:
+            Report with the amount of rows added, updated and removed on each refreshed prefix.
+        """
+        report = InventoryRefreshReport()
+
+        def _list(scope: Tuple[str, bool]):
+            prefix, recursive = scope
+            return [
+                obj for obj in client.list_objects(bucket_name = bucket, prefix = prefix or None,
+                                                   recursive = recursive, include_version = include_versions,
+                                                   include_user_meta = include_metadata)
+                if not obj.is_dir and not obj.object_name.startswith(VERSION_INDEX_PREFIX)
+            ]
+
+        if prefixes is not None:
+            scopes = [(p, True) for p in sorted(set(prefixes))]
+        else:
+            # Top level folders are listed on their own so a full scan is spread over several connections
+            folders = sorted(obj.object_name for obj in client.list_objects(bucket_name = bucket, recursive = False)
+                             if obj.is_dir and not obj.object_name.startswith(VERSION_INDEX_PREFIX))
+            scopes = [("", False)] + [(f, True) for f in folders]
+
+            with self._lock, self._connection:
+                report.removed += self._remove_missing_folders(bucket, folders)
+
+        for (prefix, recursive), objects, error in iter_completed(_list, scopes, resolve_max_workers(max_workers)):
+            if error is not None:
+                report.errors[prefix] = str(error)
+                continue
+
+            self._apply(bucket, prefix, recursive, objects, report)
+            report.prefixes.append(prefix)
+
+        report.prefixes.sort()
+        return report
+
+    def refresh_object(self, client: Type[Minio], bucket: str, object_name: str):
+        """
+        Updates the inventory row of a single object, e.g. right after uploading or removing it.
+        """
+        try:
+            stat = client.stat_object(bucket_name = bucket, object_name = object_name)
+        except S3Error as e:
+            if e.code not in ("NoSuchKey", "NoSuchObject"):
+                raise
+            stat = None
+
+        with self._lock, self._connection:
+            self._connection.execute("UPDATE objects SET is_latest = 0 WHERE bucket = ? AND key = ?",
+                                     (bucket, object_name))
+
+            if stat is None or stat.version_id is not None:
+                self._connection.execute("DELETE FROM objects WHERE bucket = ? AND key = ? AND version_id = ''",
+                                         (bucket, object_name))
+
+            if stat is not None:
+                obj = Object(bucket_name = bucket, object_name = object_name, last_modified = stat.last_modified,
+                             etag = stat.etag, size = stat.size, version_id = stat.version_id)
+                self._connection.execute(_UPSERT, (bucket,) + _as_row(obj))
+
+    def refresh_tags(self, client: Type[Minio], bucket: str,
+                     prefix: Optional[str] = None,
+                     include_versions: bool = False,
+                     force: bool = False,
+                     max_workers: Optional[int] = None) -> TagIndexRefreshReport:
+        """
+        Fetches the tags of inventoried objects into the tag index, concurrently.
+
+        Tags are fetched once per object content: objects overwritten since their tags were indexed are fetched
+        again while the rest are skipped, unless force is set. Tags written by MinioExtensions.tag_objects are
+        indexed as they are written, so they need no refresh.
+
+        Args:
+            client: Minio client instance.
+            bucket: Name of the inventoried bucket.
+            prefix: Prefix of the objects whose tags are fetched. Fetches the tags of the whole bucket when not
+                specified.
+            include_versions: Whether to fetch the tags of every inventoried version instead of the latest ones.
+            force: Whether to fetch the tags of objects already indexed as well.
+            max_workers: Maximum number of tag requests running at the same time.
+
+        Returns:
+            Report with the amount of objects fetched and skipped.
+        """
+        report = TagIndexRefreshReport()
+        where, params = self._where(bucket, prefix = prefix, include_versions = include_versions)
+
+        with self._lock:
+            rows = self._connection.execute(f"SELECT key, version_id, tags IS NOT NULL FROM objects WHERE {where} "
+                                            f"AND is_delete_marker = 0", params).fetchall()
+
+        targets = [(key, version_id) for key, version_id, indexed in rows if force or not indexed]
+        report.skipped = len(rows) - len(targets)
+
+        def _fetch(target: Tuple[str, str]):
+            key, version_id = target
+            return client.get_object_tags(bucket_name = bucket, object_name = key, version_id = version_id or None)
+
+        for (key, version_id), tags, error in iter_completed(_fetch, targets, resolve_max_workers(max_workers)):
+            if error is not None:
+                report.errors[(key, version_id or None)] = str(error)
+                continue
+
+            with self._lock, self._connection:
+                self._store_tags(bucket, key, version_id, tags)
+
+            report.fetched += 1
+
+        return report
+
+    def store_tags(self, bucket: str, object_name: str, tags: Optional[Dict[str, str]],
+                   version_id: Optional[str] = None) -> bool:
+        """
+        Indexes the tags just written to an object, replacing any tags previously indexed for it.
+
+        Args:
+            bucket: Name of the inventoried bucket.
+            object_name: Fully qualified name of the object.
+            tags: Current tags of the object.
+            version_id: Version whose tags were written. Defaults to the latest version of the object.
+
+        Returns:
+            Whether the object was found on the inventory. Objects not inventoried yet are not indexed.
+        """
+        with self._lock, self._connection:
+            if version_id is None:
+                row = self._connection.execute("SELECT version_id FROM objects WHERE bucket = ? AND key = ? AND "
+                                               "is_latest = 1 AND is_delete_marker = 0",
+                                               (bucket, object_name)).fetchone()
+            else:
+                row = self._connection.execute("SELECT version_id FROM objects WHERE bucket = ? AND key = ? AND "
+                                               "version_id = ?", (bucket, object_name, version_id)).fetchone()
+
+            if row is None:
+                return False
+
+            self._store_tags(bucket, object_name, row[0], tags)
+            return True
+
+    def get_tags(self, bucket: str, object_name: str, version_id: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """
+        Returns the indexed tags of an object, or None when they were never indexed or the object was
+        overwritten since then.
+        """
+        version_clause = "version_id = ?" if version_id is not None else "is_latest = 1"
+
+        with self._lock:
+            row = self._connection.execute(f"SELECT tags FROM objects WHERE bucket = ? AND key = ? AND "
+                                           f"{version_clause}",
+                                           (bucket, object_name) + ((version_id,) if version_id else ())).fetchone()
+
+        if row is None or row[0] is None:
+            return None
+
+        return json.loads(row[0])
+
+    def forget(self, bucket: str, prefix: Optional[str] = None):
+        """
+        Drops the inventory of a whole bucket, or of the keys below a prefix.
+        """
+        where, params = self._where(bucket, prefix = prefix, include_versions = True)
+
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM objects WHERE {where}", params)
+            self._connection.execute(f"DELETE FROM object_tags WHERE {where}", params)
+            self._connection.execute("DELETE FROM refreshes WHERE bucket = ? AND substr(prefix, 1, ?) = ?",
+                                     (bucket, len(prefix or ""), prefix or ""))
+
+    def watermark(self, bucket: str) -> Optional[datetime.datetime]:
+        """
+        Returns the most recent modification date seen on the last refresh of a bucket, if any.
+        """
+        with self._lock:
+            row = self._connection.execute("SELECT MAX(watermark) FROM refreshes WHERE bucket = ?",
+                                           (bucket,)).fetchone()
+
+        if row is None or row[0] is None:
+            return None
+
+        return datetime.datetime.fromtimestamp(row[0], tz = datetime.timezone.utc)
+
+    def query(self, bucket: str,
+              prefix: Optional[str] = None,
+              glob: Optional[str] = None,
+              min_size: Optional[int] = None,
+              max_size: Optional[int] = None,
+              modified_after: Optional[Timestamp] = None,
+              modified_before: Optional[Timestamp] = None,
+              include_versions: bool = False,
+              tags: Optional[Dict[str, Optional[str]]] = None,
+              limit: Optional[int] = None) -> List[Object]:
+        """
+        Searches the inventory of a bucket.
+
+        Args:
+            bucket: Name of the bucket to search.
+            prefix: Prefix every returned key starts with.
+            glob: Unix style pattern every returned key matches. ``*`` and ``?`` also match ``/``.
+            min_size: Minimum object size in bytes, inclusive.
+            max_size: Maximum object size in bytes, inclusive.
+            modified_after: Returns only objects modified after this date, exclusive.
+            modified_before: Returns only objects modified before this date, exclusive.
+            include_versions: Whether to return every inventoried version and delete marker.
+            tags: Tags every returned object holds, by name and value. A None value matches any value of the tag.
+                Only objects whose tags were indexed, by refresh_tags or store_tags, are matched.
+            limit: Maximum number of objects to return.
+
+        Returns:
+            Matching objects ordered by key, in the same shape returned by minio listings.
+        """
+        where, params = self._where(bucket, prefix, glob, min_size, max_size, modified_after, modified_before,
+                                    include_versions, tags)
+        sql = f"SELECT {_COLUMNS} FROM objects WHERE {where} ORDER BY key, last_modified DESC"
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+
+        return [self._as_object(bucket, row) for row in rows]
+
+    def query_table(self, bucket: str, prefix: Optional[str] = None, batch_size: Optional[int] = None,
+                    **filters) -> ObjectTable:
+        """
+        Searches the inventory of a bucket like query, loading the matches into a column oriented table
+        straight from the database rows, without building an Object per match.
+
+        Args:
+            bucket: Name of the bucket to search.
+            prefix: Prefix every returned key starts with.
+            batch_size: Rows fetched from the database per batch. Defaults to DEFAULT_BATCH_SIZE.
+            **filters: Any other filter accepted by query, except limit.
+        """
+        where, params = self._where(bucket, prefix, **filters)
+        table = ObjectTable(bucket)
+
+        with self._lock:
+            cursor = self._connection.execute(f"SELECT {_COLUMNS} FROM objects WHERE {where} "
+                                              f"ORDER BY key, last_modified DESC", params)
+
+            while rows := cursor.fetchmany(batch_size or DEFAULT_BATCH_SIZE):
+                table.append_columns(
+                    names = [row[0] for row in rows],
+                    sizes = [row[2] or 0 for row in rows],
+                    etags = [row[3] for row in rows],
+                    last_modified = [round(row[4] * 1000000) if row[4] is not None else MISSING_TIMESTAMP
+                                     for row in rows],
+                    version_ids = [row[1] for row in rows],
+                    content_types = [None] * len(rows),
+                    is_latest = [bool(row[5]) for row in rows],
+                    is_delete_marker = [bool(row[6]) for row in rows]
+                )
+
+        return table
+
+    def count(self, bucket: str, prefix: Optional[str] = None, **filters) -> Tuple[int, int]:
+        """
+        Returns the amount of objects and bytes matching the same filters accepted by query.
+        """
+        where, params = self._where(bucket, prefix, **filters)
+
+        with self._lock:
+            objects, size = self._connection.execute(f"SELECT COUNT(*), SUM(size) FROM objects WHERE {where}",
+                                                     params).fetchone()
+
+        return objects, size or 0
+
+    def list_objects(self, bucket: str, prefix: Optional[str] = None, recursive: bool = False,
+                     include_versions: bool = False) -> List[Object]:
+        """
+        Lists the inventory of a bucket the way minio lists a bucket. Non recursive listings collapse the keys
+        below each folder of prefix into a single folder entry.
+        """
+        if recursive:
+            return self.query(bucket, prefix = prefix, include_versions = include_versions)
+
+        start = len(prefix or "") + 1
+        name = f"CASE WHEN instr(substr(key, {start}), '/') > 0 " \
+               f"THEN substr(key, 1, {start - 1} + instr(substr(key, {start}), '/')) ELSE NULL END"
+        where, params = self._where(bucket, prefix = prefix, include_versions = include_versions)
+
+        with self._lock:
+            folders = self._connection.execute(f"SELECT DISTINCT {name} AS folder FROM objects "
+                                               f"WHERE {where} AND folder IS NOT NULL", params).fetchall()
+            rows = self._connection.execute(f"SELECT {_COLUMNS} FROM objects WHERE {where} AND "
+                                            f"instr(substr(key, {start}), '/') = 0 "
+                                            f"ORDER BY key, last_modified DESC", params).fetchall()
+
+        objects = [self._as_object(bucket, row) for row in rows]
+        objects.extend(Object(bucket_name = bucket, object_name = folder) for (folder,) in folders)
+        objects.sort(key = lambda o: o.object_name)
+        return objects
+
+    def is_folder(self, bucket: str, folder_name: str) -> bool:
+        """
+        Checks whether any inventoried object lives below a folder.
+        """
+        folder_name = folder_name if folder_name.endswith("/") else folder_name + "/"
+        return len(self.query(bucket, prefix = folder_name, limit = 1)) > 0
+
+    def exists(self, bucket: str, object_name: str) -> bool:
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM objects WHERE bucket = ? AND key = ? AND is_latest = 1 "
+                                           "AND is_delete_marker = 0 LIMIT 1", (bucket, object_name)).fetchone()
+        return row is not None
+
+    def _apply(self, bucket: str, prefix: str, recursive: bool, objects: List[Object],
+               report: InventoryRefreshReport):
+        where, params = self._where(bucket, prefix = prefix, include_versions = True)
+
+        if not recursive:
+            where += f" AND instr(substr(key, {len(prefix) + 1}), '/') = 0"
+
+        with self._lock, self._connection:
+            known = {
+                (key, version_id): (etag, last_modified, is_latest, metadata)
+                for key, version_id, etag, last_modified, is_latest, metadata in self._connection.execute(
+                    f"SELECT key, version_id, etag, last_modified, is_latest, metadata FROM objects WHERE {where}",
+                    params)
+            }
+
+            writes = []
+            watermark = None
+
+            for obj in objects:
+                row = _as_row(obj)
+                identity = row[:2]
+                previous = known.pop(identity, None)
+
+                if row[4] is not None:
+                    watermark = row[4] if watermark is None else max(watermark, row[4])
+
+                if previous is not None and previous == (row[3], row[4], row[5], row[7]):
+                    report.unchanged += 1
+                    continue
+
+                if previous is None:
+                    report.added += 1
+                else:
+                    report.updated += 1
+
+                writes.append((bucket,) + row)
+
+            self._connection.executemany(_UPSERT, writes)
+
+            for table in ("objects", "object_tags"):
+                self._connection.executemany(f"DELETE FROM {table} WHERE bucket = ? AND key = ? AND version_id = ?",
+                                             [(bucket, key, version_id) for key, version_id in known])
+            self._connection.execute("INSERT OR REPLACE INTO refreshes (bucket, prefix, refreshed_at, watermark) "
+                                     "VALUES (?, ?, ?, ?)", (bucket, prefix, time.time(), watermark))
+            report.removed += len(known)
+
+    def _store_tags(self, bucket: str, key: str, version_id: str, tags: Optional[Dict[str, str]]):
+        tags = dict(tags or {})
+        self._connection.execute("UPDATE objects SET tags = ? WHERE bucket = ? AND key = ? AND version_id = ?",
+                                 (json.dumps(tags), bucket, key, version_id))
+        self._connection.execute("DELETE FROM object_tags WHERE bucket = ? AND key = ? AND version_id = ?",
+                                 (bucket, key, version_id))
+        self._connection.executemany("INSERT INTO object_tags (bucket, key, version_id, name, value) "
+                                     "VALUES (?, ?, ?, ?, ?)",
+                                     [(bucket, key, version_id, name, value) for name, value in tags.items()])
+
+    def _remove_missing_folders(self, bucket: str, folders: List[str]) -> int:
+        self._connection.execute("CREATE TEMP TABLE IF NOT EXISTS listed_folders (folder TEXT PRIMARY KEY)")
+        self._connection.execute("DELETE FROM listed_folders")
+        self._connection.executemany("INSERT INTO listed_folders (folder) VALUES (?)", [(f,) for f in folders])
+        removed = self._connection.execute(
+            "DELETE FROM objects WHERE bucket = ? AND instr(key, '/') > 0 AND "
+            "substr(key, 1, instr(key, '/')) NOT IN (SELECT folder FROM listed_folders)", (bucket,)).rowcount
+        self._connection.execute(
+            "DELETE FROM object_tags WHERE bucket = ? AND instr(key, '/') > 0 AND "
+            "substr(key, 1, instr(key, '/')) NOT IN (SELECT folder FROM listed_folders)", (bucket,))
+        self._connection.execute("DELETE FROM refreshes WHERE bucket = ? AND prefix != '' AND "
+                                 "prefix NOT IN (SELECT folder FROM listed_folders)", (bucket,))
+        return removed
+
+    @staticmethod
+    def _where(bucket: str,
+               prefix: Optional[str] = None,
+               glob: Optional[str] = None,
+               min_size: Optional[int] = None,
+               max_size: Optional[int] = None,
+               modified_after: Optional[Timestamp] = None,
+               modified_before: Optional[Timestamp] = None,
+               include_versions: bool = False,
+               tags: Optional[Dict[str, Optional[str]]] = None) -> Tuple[str, List[Any]]:
+        clauses = ["bucket = ?"]
+        params: List[Any] = [bucket]
+
+        # Both prefixes and the literal head of glob patterns become key ranges, which are served by the
+        # primary key index instead of a full scan
+        for head in (prefix, _glob_literal_prefix(glob) if glob else None):
+            if not head:
+                continue
+
+            clauses.append("key >= ?")
+            params.append(head)
+
+            if (upper := _prefix_upper_bound(head)) is not None:
+                clauses.append("key < ?")
+                params.append(upper)
+
+        for clause, value in (("key GLOB ?", glob),
+                              ("size >= ?", min_size),
+                              ("size <= ?", max_size),
+                              ("last_modified > ?", _as_timestamp(modified_after)),
+                              ("last_modified < ?", _as_timestamp(modified_before))):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        if not include_versions:
+            clauses.append("is_latest = 1 AND is_delete_marker = 0")
+
+        # Each tag condition is answered by the tag lookup index, over objects whose tags are still current
+        if tags:
+            clauses.append("tags IS NOT NULL")
+
+        for name, value in (tags or {}).items():
+            clauses.append("(key, version_id) IN (SELECT key, version_id FROM object_tags WHERE bucket = ? AND "
+                           "name = ?" + (" AND value = ?)" if value is not None else ")"))
+            params.extend([bucket, name] if value is None else [bucket, name, value])
+
+        return " AND ".join(clauses), params
+
+    @staticmethod
+    def _as_object(bucket: str, row: Tuple[Any, ...]) -> Object:
+        key, version_id, size, etag, last_modified, is_latest, is_delete_marker, metadata = row
+
+        return Object(
+            bucket_name = bucket,
+            object_name = key,
+            last_modified = datetime.datetime.fromtimestamp(last_modified, tz = datetime.timezone.utc)
+            if last_modified is not None else None,
+            etag = etag,
+            size = size,
+            metadata = json.loads(metadata) if metadata else None,
+            version_id = version_id or None,
+            is_latest = "true" if is_latest else "false",
+            is_delete_marker = bool(is_delete_marker)
+        )
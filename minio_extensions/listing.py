@@ -0,0 +1,156 @@
+import collections
+import threading
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait
+)
+
+from minio import Minio
+from minio.datatypes import Object
+
+from minio_extensions._concurrency import resolve_max_workers
+from minio_extensions._typing import (
+    Optional,
+    Union,
+    Deque,
+    Iterator,
+    List,
+    Type
+)
+
+# Listing pages hold up to 1000 keys, so a shard filling a whole page is likely to span several of them
+DEFAULT_SPLIT_THRESHOLD = 1000
+
+
+class _Shard:
+    """
+    Key range holding every key starting with prefix. A shard is either listed, holding its objects, or split,
+    holding the objects directly below its prefix and the shards of its common prefixes, in key order.
+    """
+
+    __slots__ = ("prefix", "objects", "entries")
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.objects: Optional[List[Object]] = None
+        self.entries: Optional[List[Union[Object, "_Shard"]]] = None
+
+
+def iter_objects_parallel(client: Type[Minio], bucket: str,
+                          prefix: Optional[str] = None,
+                          include_versions: bool = False,
+                          include_metadata: bool = False,
+                          max_workers: Optional[int] = None,
+                          ordered: bool = True,
+                          split_threshold: Optional[int] = None) -> Iterator[Object]:
+    """
+    Lists every object below prefix recursively, spreading the listing over several concurrent requests.
+
+    The common prefixes below prefix are discovered with a delimiter listing and each one is listed on its own.
+    Prefixes whose listing reaches split_threshold keys are considered hot and split again by their own common
+    prefixes, so large folders are fanned out as deep as their layout allows. A hot prefix costs a single extra
+    listing page, the one used to detect it.
+
+    Args:
+        client: Minio client instance.
+        bucket: Name of the listed bucket.
+        prefix: Prefix of the listed objects. Lists the whole bucket when not specified.
+        include_versions: Whether to list every object version and delete marker.
+        include_metadata: Whether to request the user metadata of objects.
+        max_workers: Maximum number of listings running at the same time. Defaults to
+            MINIO_S3_TRANSFER_MAX_WORKERS.
+        ordered: Whether objects are yielded in key order, as a sequential listing would. Otherwise objects are
+            yielded as soon as their prefix is listed, keeping fewer of them in memory.
+        split_threshold: Number of keys from which a prefix is split. Defaults to DEFAULT_SPLIT_THRESHOLD.
+
+    Returns:
+        Iterator over the listed objects. Failed listings are raised once reached, and closing the iterator stops
+        the listings still running.
+    """
+    threshold = split_threshold or DEFAULT_SPLIT_THRESHOLD
+    stopped = threading.Event()
+
+    if threshold < 1:
+        raise ValueError("The split threshold must be greater than zero.")
+
+    def _list(shard: _Shard, recursive: bool) -> Optional[List[Object]]:
+        objects = []
+
+        for obj in client.list_objects(bucket_name = bucket, prefix = shard.prefix or None, recursive = recursive,
+                                       include_version = include_versions, include_user_meta = include_metadata):
+            if stopped.is_set():
+                break
+
+            objects.append(obj)
+
+            # Hot prefixes are split instead of being paginated until their end
+            if recursive and len(objects) >= threshold:
+                return None
+
+        return objects
+
+    root = _Shard(prefix or "")
+    frontier: Deque[Union[Object, _Shard]] = collections.deque([root])
+
+    with ThreadPoolExecutor(max_workers = resolve_max_workers(max_workers),
+                            thread_name_prefix = "minio-extensions-list") as executor:
+        # The listing root is split right away, discovering its common prefixes
+        pending = {executor.submit(_list, root, False): (root, False)}
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when = FIRST_COMPLETED)
+
+                for future in done:
+                    shard, recursive = pending.pop(future)
+                    objects = future.result()
+
+                    if objects is None:
+                        pending[executor.submit(_list, shard, False)] = (shard, False)
+                    elif recursive:
+                        shard.objects = objects
+                    else:
+                        # Keys ending with a slash are listed as their own common prefix, yet they are objects
+                        shard.entries = sorted((_Shard(obj.object_name)
+                                                if obj.is_dir and obj.object_name != shard.prefix else obj
+                                                for obj in objects),
+                                               key = lambda entry: entry.prefix if isinstance(entry, _Shard)
+                                               else entry.object_name)
+
+                        for entry in shard.entries:
+                            if isinstance(entry, _Shard):
+                                pending[executor.submit(_list, entry, True)] = (entry, True)
+
+                        if not ordered:
+                            yield from (entry for entry in shard.entries if not isinstance(entry, _Shard))
+
+                    if not ordered and shard.objects is not None:
+                        yield from shard.objects
+                        shard.objects = []
+
+                if ordered:
+                    yield from _drain(frontier)
+        finally:
+            stopped.set()
+
+            for future in pending:
+                future.cancel()
+
+
+def _drain(frontier: Deque[Union[Object, _Shard]]) -> Iterator[Object]:
+    # Yields objects in key order up to the first shard still being listed
+    while frontier:
+        entry = frontier[0]
+
+        if not isinstance(entry, _Shard):
+            frontier.popleft()
+            yield entry
+        elif entry.objects is not None:
+            frontier.popleft()
+            yield from entry.objects
+        elif entry.entries is not None:
+            frontier.popleft()
+            frontier.extendleft(reversed(entry.entries))
+        else:
+            return
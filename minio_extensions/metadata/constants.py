@@ -14,6 +14,12 @@ OBJECT_META_ETAG_ATT = 'ETag'
 
 MAX_TAG_DESCRIPTION_LEN = 255
 
+# Maximum amount of keys accepted by a single multi-object delete request
+MAX_DELETE_OBJECTS_PER_REQUEST = 1000
+
+# Prefix under which the version index manifests of versioned objects are stored on bucket
+VERSION_INDEX_PREFIX = '.minio-extensions/versions/'
+
 # Minio object content types constants for upload on bucket    
 CsvLike = Literal["application/csv", "text/csv"]
 Text = "application/octet-stream"
@@ -20,6 +20,7 @@ from minio_extensions.metadata.constants import (
 )
 
 from minio_extensions._typing import PosInt
+from minio_extensions._timestamps import parse_http_date
 
 T = TypeVar('T', bound = "Tags")
 TT = TypeVar('TT', bound = "TagMetadata")
@@ -40,6 +41,29 @@ class VersionMetadata(BaseModel):
     
     revision: Optional[PosInt] = Field(0, alias = "revision")
     """Revision of the file"""
+    
+    def __str__(self) -> str:
+        return "{0}.{1}.{2}".format(self.major, self.minor or 0, self.revision or 0)
+    
+    @classmethod
+    def from_string(cls, value: str) -> "VersionMetadata":
+        """
+        Parses a version from its string representation. Both the dotted ``major.minor.revision`` form and the
+        dictionary form written by previous package versions are supported.
+        """
+        import ast
+        
+        value = str(value).strip()
+        
+        if value.startswith("{"):
+            return cls(**ast.literal_eval(value))
+        
+        parts = [int(p) for p in value.split(".")]
+        
+        if not 0 < len(parts) <= 3:
+            raise ValueError(f"Invalid version string {value}")
+        
+        return cls(**dict(zip(["major", "minor", "revision"], parts)))
 
 
 class TagMetadata(BaseModel):
@@ -77,6 +101,41 @@ class TagMetadata(BaseModel):
                 for t in flattened
             ]
     
+    @staticmethod
+    def merge(tags: Dict[str, str], name: str, content: Optional[str],
+              duplicate_options: Optional['TagDuplicateOptions'] = "raise",
+              duplicates_prefix: Optional[str] = "_",
+              separator: Optional[str] = "-") -> str:
+        """
+        Adds a tag to a set of tags, handling a tag already present with the same name according to
+        duplicate_options: raise a ValueError, preserve both tags naming the new one after the existing one
+        followed by duplicates_prefix and a counter (``name_1``), or append the new content to the existing one
+        joined by separator.
+        
+        Returns:
+            Name under which the tag was stored.
+        """
+        if name not in tags:
+            tags[name] = content
+            return name
+        
+        if duplicate_options == "raise":
+            raise ValueError(f"Duplicate tag name {name} found on tags.")
+        
+        if duplicate_options == "append":
+            tags[name] = f"{tags[name]}{separator}{content}"
+            return name
+        
+        repetitions = 1
+        new_name = f"{name}{duplicates_prefix}{repetitions}"
+        
+        while new_name in tags:
+            repetitions += 1
+            new_name = f"{name}{duplicates_prefix}{repetitions}"
+        
+        tags[new_name] = content
+        return new_name
+    
     @classmethod
     def as_tag(cls,
                metadata: Optional[Union[List[TT], TT]],
@@ -91,6 +150,9 @@ class TagMetadata(BaseModel):
         if metadata is None:
             return cast(Type[T], _tag)
         
+        if duplicate_options not in ["raise", "preserve", "append"]:
+            raise ValueError("The parameter errors must be either 'raise', 'preserve' or append")
+        
         if isinstance(metadata, list):
             for m in metadata:
                 
@@ -98,37 +160,9 @@ class TagMetadata(BaseModel):
                     warnings.warn(f"Warning: Element {m} is not of type {cls.__name__}. Skipping...")
                     continue
                 
-                if m.name not in _tag.keys():
-                    _tag[m.name] = m.content
-                
-                if (m.name, m.content) in _tag.keys():
-                    raise ValueError(f"Element {m} is already present on tags list")
-                
-                if duplicate_options not in ["raise", "preserve", "append"]:
-                    raise ValueError("The parameter errors must be either 'raise', 'preserve' or append")
-                
-                if duplicate_options == "raise" and len(set(_tag.keys())) < len(_tag.keys()):
-                    raise ValueError(
-                        "Duplicate tag names found on provided list. First occurrence: {index} -> {m.name}")
-                
-                if duplicate_options == "append":
-                    if m.name in _tag:
-                        _tag[m.name] = f"{_tag[m.name]}{separator}{m.content}"
-                    else:
-                        _tag[m.name] = m.content
-                    
-                    continue
-                
-                repetitions = 0
-                new_name = m.name
-                
-                while m.name in _tag:
-                    repetitions += 1
-                    new_name = f"{m.name}_{repetitions}"
-                    
-                _tag[new_name] = m.content
-                
-
+                cls.merge(_tag, m.name, m.content, duplicate_options = duplicate_options,
+                          duplicates_prefix = duplicates_prefix, separator = separator)
+        
         else:
             if not isinstance(metadata, cls):
                 warnings.warn(f"Warning: Element {metadata} is not of type {cls.__name__}. Skipping...")
@@ -149,10 +183,12 @@ class ObjectMetadata(BaseModel):
 
 
 class ObjectMetadataInfo(BaseModel):
+    object_name: Optional[str] = None
     content_length: Optional[int] = None
     content_type: Optional[str] = None
     last_modified: Optional[datetime.datetime] = None
     id: Optional[Union[str, uuid.UUID]] = None
+    version: Optional[VersionMetadata] = None
     tags: Optional[List[TagMetadata]] = None
     
     @classmethod
@@ -163,13 +199,28 @@ class ObjectMetadataInfo(BaseModel):
         data_dict["content_type"] = cls._get_meta_content_type(metadata)
         data_dict["last_modified"] = cls._get_meta_last_modified_date(metadata)
         data_dict["id"] = cls._get_meta_version_id(metadata)
+        data_dict["version"] = cls._get_meta_version(metadata)
+        
+        if metadata.get("tags"):
+            data_dict["tags"] = [TagMetadata.from_value_pair(t) for t in metadata["tags"].items()]
         
         return ObjectMetadataInfo.model_construct(**data_dict)
     
     @staticmethod
     def _get_meta_last_modified_date(metadata: Dict[str, Any]):
         if OBJECT_META_LAST_MODIFIED_ATT in metadata.keys():
-            return datetime.datetime.strptime(str(metadata[OBJECT_META_LAST_MODIFIED_ATT]), '%a, %d %b %Y %H:%M:%S %Z')
+            return parse_http_date(str(metadata[OBJECT_META_LAST_MODIFIED_ATT]))
+    
+    @staticmethod
+    def _get_meta_version(metadata: Dict[str, Any]):
+        # User metadata keys casing depends on the server, so the lookup is case insensitive
+        value = next((v for k, v in metadata.items() if str(k).lower() == USER_META_VERSION_ATT), None)
+        
+        if value is not None:
+            try:
+                return VersionMetadata.from_string(value)
+            except (ValueError, SyntaxError):
+                warnings.warn(f"Warning: Could not parse object version from metadata value {value}.")
     
     @staticmethod
     def _get_meta_tagging_count(metadata: Dict[str, Any]):
@@ -189,9 +240,24 @@ class ObjectMetadataInfo(BaseModel):
     @staticmethod
     def _get_meta_content_size(metadata: Dict[str, Any]):
         if OBJECT_META_CONTENT_LENGTH_ATT in metadata.keys():
-            return metadata[OBJECT_META_CONTENT_LENGTH_ATT]
+            return int(metadata[OBJECT_META_CONTENT_LENGTH_ATT])
     
     @staticmethod
     def _get_meta_e_tagging(metadata: Dict[str, Any]):
         if OBJECT_META_ETAG_ATT in metadata.keys():
             return metadata[OBJECT_META_ETAG_ATT]
+
+
+class VersionIndex(BaseModel):
+    """
+    Sidecar manifest mapping the semantic versions of an object to its bucket version ids.
+    """
+    
+    object_name: str
+    """Fully qualified name of the indexed object"""
+    
+    versions: Dict[str, str] = {}
+    """Mapping of ``major.minor.revision`` strings to object version ids"""
+    
+    def resolve(self, version: VersionMetadata) -> Optional[str]:
+        return self.versions.get(str(version))
@@ -0,0 +1,232 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+
+from minio import Minio
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Tuple,
+    Type
+)
+from minio_extensions.environment import (
+    MINIO_S3_READ_BLOCK_SIZE,
+    MINIO_S3_READ_CACHE_BLOCKS,
+    MINIO_S3_READ_AHEAD_MAX_BLOCKS
+)
+from minio_extensions.exceptions import ObjectIntegrityException
+from minio_extensions.instrumentation import (
+    is_enabled,
+    record_cache_lookup
+)
+
+
+class ObjectFile(io.RawIOBase):
+    """
+    Seekable, read only file-like object over a single object version, served by ranged GET requests.
+
+    The object is split in fixed size blocks kept on a bounded LRU cache, so re-reading the same region, like
+    the footer of a parquet file, sends no further requests. Reads continuing where the previous one ended
+    fetch a growing number of blocks ahead on the same request, while random reads fetch only the blocks they
+    touch. The object version and ETag are pinned when the file is opened, so the contents read never mix two
+    versions of an object overwritten meanwhile.
+
+    Instances can be passed anywhere a binary file is expected, e.g. ``pyarrow.parquet.ParquetFile`` or
+    ``pandas.read_parquet``, so column projected reads only transfer the column chunks they need.
+    """
+
+    def __init__(self, client: Type[Minio], bucket_name: str, object_name: str,
+                 version_id: Optional[str] = None,
+                 block_size: Optional[int] = None,
+                 cache_blocks: Optional[int] = None,
+                 max_read_ahead: Optional[int] = None) -> None:
+        super().__init__()
+
+        self._client = client
+        self._bucket_name = bucket_name
+        self._object_name = object_name
+        self._block_size = block_size or MINIO_S3_READ_BLOCK_SIZE.get()
+        self._cache_blocks = max(1, cache_blocks or MINIO_S3_READ_CACHE_BLOCKS.get())
+        self._max_read_ahead = max_read_ahead if max_read_ahead is not None \
+            else MINIO_S3_READ_AHEAD_MAX_BLOCKS.get()
+
+        stat = client.stat_object(bucket_name = bucket_name, object_name = object_name, version_id = version_id)
+
+        self._size = stat.size
+        self._etag = stat.etag
+        self._version_id = stat.version_id or version_id
+        self._request_headers = {"If-Match": '"{0}"'.format(stat.etag.strip('"'))} if stat.etag else None
+
+        self._blocks: "OrderedDict[int, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._position = 0
+        self._last_end = None
+        self._read_ahead = 0
+
+        self.name = f"{bucket_name}/{object_name}"
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self._etag
+
+    @property
+    def version_id(self) -> Optional[str]:
+        return self._version_id
+
+    @property
+    def mode(self) -> str:
+        return "rb"
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        self._checkClosed()
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._checkClosed()
+
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}.")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")
+
+        self._position = position
+        return position
+
+    def readall(self) -> bytes:
+        self._checkClosed()
+        buffer = bytearray(max(0, self._size - self._position))
+        read = self.readinto(buffer)
+        return bytes(buffer[:read])
+
+    def readinto(self, buffer) -> int:
+        self._checkClosed()
+
+        view = memoryview(buffer).cast("B")
+
+        with self._lock:
+            start = self._position
+            length = min(view.nbytes, self._size - start)
+
+            if length <= 0:
+                return 0
+
+            # Sequential reads double the read-ahead window up to its limit, random reads reset it
+            if start == self._last_end:
+                self._read_ahead = min(max(1, self._read_ahead * 2), self._max_read_ahead)
+            else:
+                self._read_ahead = 0
+
+            first = start // self._block_size
+            last = (start + length - 1) // self._block_size
+            blocks = self._load(first, last)
+
+            written = 0
+            for index in range(first, last + 1):
+                block = blocks[index]
+                block_start = index * self._block_size
+                begin = max(start, block_start) - block_start
+                end = min(start + length, block_start + len(block)) - block_start
+                view[written:written + end - begin] = block[begin:end]
+                written += end - begin
+
+            self._position = start + written
+            self._last_end = self._position
+            return written
+
+    def close(self):
+        with self._lock:
+            self._blocks.clear()
+        super().close()
+
+    def _load(self, first: int, last: int) -> Dict[int, bytes]:
+        blocks: Dict[int, bytes] = {}
+
+        for index in range(first, last + 1):
+            if (block := self._blocks.get(index)) is not None:
+                self._blocks.move_to_end(index)
+                blocks[index] = block
+
+        if is_enabled():
+            for index in range(first, last + 1):
+                record_cache_lookup("object_file_blocks", hit = index in blocks)
+
+        if len(blocks) == last - first + 1:
+            return blocks
+
+        # Blocks ahead are only fetched along with a missing block, so cached reads never send requests
+        last_block = (self._size - 1) // self._block_size
+        fetch_until = min(last + self._read_ahead, last_block)
+
+        for run_first, run_last in self._missing_runs(first, fetch_until, blocks):
+            for index, block in self._fetch(run_first, run_last):
+                self._store(index, block)
+                if index <= last:
+                    blocks[index] = block
+
+        return blocks
+
+    def _missing_runs(self, first: int, last: int, loaded: Dict[int, bytes]) -> List[Tuple[int, int]]:
+        runs: List[Tuple[int, int]] = []
+
+        for index in range(first, last + 1):
+            if index in loaded or index in self._blocks:
+                continue
+            if runs and runs[-1][1] == index - 1:
+                runs[-1] = (runs[-1][0], index)
+            else:
+                runs.append((index, index))
+
+        return runs
+
+    def _fetch(self, first: int, last: int) -> List[Tuple[int, bytes]]:
+        offset = first * self._block_size
+        length = min(self._size, (last + 1) * self._block_size) - offset
+
+        response = self._client.get_object(bucket_name = self._bucket_name, object_name = self._object_name,
+                                           offset = offset, length = length,
+                                           request_headers = self._request_headers,
+                                           version_id = self._version_id)
+        try:
+            data = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+        if len(data) != length:
+            raise ObjectIntegrityException(f"Expected {length} bytes at offset {offset} but received {len(data)}.",
+                                           object_name = self._object_name)
+
+        self.requests += 1
+        self.bytes_fetched += length
+
+        return [(first + i, data[i * self._block_size:(i + 1) * self._block_size])
+                for i in range(last - first + 1)]
+
+    def _store(self, index: int, block: bytes):
+        self._blocks[index] = block
+        self._blocks.move_to_end(index)
+
+        while len(self._blocks) > self._cache_blocks:
+            self._blocks.popitem(last = False)
@@ -1,6 +1,8 @@
 
 import warnings
 import os
+import socket
+import certifi
 from typing import Literal
 from minio_extensions.environment import (
     MINIO_S3_CHECK_CERTIFICATES,
@@ -14,31 +16,102 @@ from minio_extensions.environment import (
     MINIO_S3_HTTP_REQUEST_TIMEOUT,
     MINIO_S3_HTTP_REQUEST_PROXY_FORCE_ERROR_CODES,
     MINIO_S3_HTTP_REQUEST_PROXY_URL,
-    MINIO_S3_IGNORE_SECURE_CONNECTION
+    MINIO_S3_IGNORE_SECURE_CONNECTION,
+    MINIO_S3_HTTP_POOL_MAXSIZE,
+    MINIO_S3_TRANSFER_MAX_WORKERS,
+    MINIO_S3_HTTP_NUM_POOLS,
+    MINIO_S3_HTTP_POOL_BLOCK,
+    MINIO_S3_HTTP_KEEP_ALIVE,
+    MINIO_S3_HTTP_CONNECT_TIMEOUT,
+    MINIO_S3_HTTP_READ_TIMEOUT,
+    MINIO_S3_HTTP_RETRY_BACKOFF_FACTOR,
+    MINIO_S3_STORAGE_BACKEND,
+    MINIO_S3_LOCAL_ROOT
 )
 from minio_extensions.exceptions import (
     ClientConfigurationException,
     ClientProxyConfigurationException 
 )
+from minio_extensions.backends import (
+    MemoryBackend,
+    LocalDirectoryBackend
+)
+from minio_extensions.instrumentation import (
+    InstrumentedPoolManager,
+    InstrumentedProxyManager
+)
 from minio import Minio
 from urllib.parse import urlparse
-from urllib3 import ProxyManager
-from urllib3 import Retry
+from urllib3 import PoolManager
+from urllib3 import Retry, Timeout
+from urllib3.connection import HTTPConnection
 from typing import Optional
 
-ConfigurationOptions = Literal["env", "toml", "xml"]
+ConfigurationOptions = Literal["env", "toml", "xml", "memory", "local"]
+
+# Connect and read timeout of the HTTP client minio builds when none is given
+_MINIO_DEFAULT_TIMEOUT = 300
 
 class ClientBuilder:
     
-    def __init__(self, creation_option: ConfigurationOptions, is_proxy_conn: Optional[bool] = False) -> None:
+    def __init__(self, creation_option: ConfigurationOptions, is_proxy_conn: Optional[bool] = False,
+                 pool_maxsize: Optional[int] = None,
+                 num_pools: Optional[int] = None,
+                 pool_block: Optional[bool] = None,
+                 keep_alive: Optional[bool] = None,
+                 connect_timeout: Optional[float] = None,
+                 read_timeout: Optional[float] = None,
+                 max_retries: Optional[int] = None,
+                 backoff_factor: Optional[float] = None,
+                 root: Optional[str] = None) -> None:
+        """
+        Args:
+            creation_option: Source of the client configuration. ``memory`` and ``local`` create storage backends
+                keeping objects in process memory or on a local directory instead of connecting to a server.
+            is_proxy_conn: Whether the client connects through the proxy defined on MINIO_S3_HTTP_REQUEST_PROXY_URL.
+            pool_maxsize: Connections kept open per host. Defaults to MINIO_S3_HTTP_POOL_MAXSIZE, or
+                MINIO_S3_TRANSFER_MAX_WORKERS when not declared.
+            num_pools: Per host connection pools kept. Defaults to MINIO_S3_HTTP_NUM_POOLS.
+            pool_block: Whether to wait for a free connection when the pool is exhausted. Defaults to
+                MINIO_S3_HTTP_POOL_BLOCK.
+            keep_alive: Whether to enable TCP keep-alive on pooled connections. Defaults to MINIO_S3_HTTP_KEEP_ALIVE.
+            connect_timeout: Connection timeout in seconds. Defaults to MINIO_S3_HTTP_CONNECT_TIMEOUT.
+            read_timeout: Read timeout in seconds. Defaults to MINIO_S3_HTTP_READ_TIMEOUT.
+            max_retries: Maximum retries per request. Defaults to MINIO_S3_HTTP_REQUEST_MAX_RETRIES.
+            backoff_factor: Backoff factor between retries. Defaults to MINIO_S3_HTTP_RETRY_BACKOFF_FACTOR.
+            root: Directory holding the buckets of the local storage backend. Defaults to MINIO_S3_LOCAL_ROOT.
+        """
         self._creation_option = creation_option
         self._is_proxy_conn = is_proxy_conn
+        self._root = root
+        self._http_options = dict(
+            pool_maxsize = pool_maxsize,
+            num_pools = num_pools,
+            pool_block = pool_block,
+            keep_alive = keep_alive,
+            connect_timeout = connect_timeout,
+            read_timeout = read_timeout,
+            max_retries = max_retries,
+            backoff_factor = backoff_factor
+        )
         
     def _from_env(self):
         client = None
         params = {}
         url_parsed = None
         
+        backend = MINIO_S3_STORAGE_BACKEND.get()
+        
+        if backend == "memory":
+            return self._from_memory()
+        
+        if backend == "local":
+            return self._from_local()
+        
+        if backend != "s3":
+            raise ClientConfigurationException(f"Unknown storage backend {backend} on MINIO_S3_STORAGE_BACKEND, "
+                                               f"expected one of s3, memory or local.")
+        
         if not MINIO_S3_USERNAME.is_defined:
             raise ClientConfigurationException(message="Expected user defined, but was not found on enviroment variables.")
         
@@ -79,39 +152,73 @@ class ClientBuilder:
         
         endpoint_url = "{0}:{1}".format(url_parsed.hostname, url_parsed.port)
         
-        if not self._is_proxy_conn:
-            return Minio(
-                endpoint = endpoint_url,
-                access_key = params["username"],
-                secret_key = params["password"],
-                cert_check = params["check_cert"],
-                secure = params["is_secure"]
-            )
-        
         if self._is_proxy_conn and not MINIO_S3_HTTP_REQUEST_PROXY_URL.is_defined:
             raise ClientProxyConfigurationException("Proxy URL expect on environment variables.")
-            
-        proxy = ProxyManager(
-            proxy_url = MINIO_S3_HTTP_REQUEST_PROXY_URL.get(),
-            timeout = MINIO_S3_HTTP_REQUEST_TIMEOUT.get()
-            if MINIO_S3_HTTP_REQUEST_TIMEOUT.is_defined else MINIO_S3_HTTP_REQUEST_TIMEOUT.default
-            if MINIO_S3_HTTP_REQUEST_TIMEOUT.is_defined else MINIO_S3_HTTP_REQUEST_TIMEOUT.default,
-            retries = Retry(
-                total = MINIO_S3_HTTP_REQUEST_MAX_RETRIES.get()
-                if MINIO_S3_HTTP_REQUEST_MAX_RETRIES.is_defined else MINIO_S3_HTTP_REQUEST_MAX_RETRIES.default
-            ),
-            cert_reqs = "CERT_REQUIRED"
-        )
-            
+        
         return Minio(
             endpoint = endpoint_url,
             access_key = params["username"],
             secret_key = params["password"],
             cert_check = params["check_cert"],
             secure = params["is_secure"],
-            http_client=proxy
+            http_client = self._build_http_client(check_cert = params["check_cert"])
         )
+    
+    def _build_http_client(self, check_cert: bool) -> PoolManager:
+        """
+        Builds the pooled HTTP client used by minio from builder options, falling back to environment variables.
+        The same pool settings are applied on direct and proxy connections.
+        """
+        # Direct connections used minio's own pool before, so its timeout is kept unless one is declared
+        timeout = MINIO_S3_HTTP_REQUEST_TIMEOUT.get() \
+            if self._is_proxy_conn or MINIO_S3_HTTP_REQUEST_TIMEOUT.is_defined else _MINIO_DEFAULT_TIMEOUT
+        connect_timeout = self._option("connect_timeout", MINIO_S3_HTTP_CONNECT_TIMEOUT)
+        read_timeout = self._option("read_timeout", MINIO_S3_HTTP_READ_TIMEOUT)
+        
+        options = dict(
+            num_pools = self._option("num_pools", MINIO_S3_HTTP_NUM_POOLS),
+            maxsize = self._option("pool_maxsize", MINIO_S3_HTTP_POOL_MAXSIZE) or MINIO_S3_TRANSFER_MAX_WORKERS.get(),
+            block = self._option("pool_block", MINIO_S3_HTTP_POOL_BLOCK),
+            timeout = Timeout(
+                connect = connect_timeout if connect_timeout is not None else timeout,
+                read = read_timeout if read_timeout is not None else timeout
+            ),
+            retries = Retry(
+                total = self._option("max_retries", MINIO_S3_HTTP_REQUEST_MAX_RETRIES),
+                backoff_factor = self._option("backoff_factor", MINIO_S3_HTTP_RETRY_BACKOFF_FACTOR),
+                status_forcelist = [500, 502, 503, 504]
+            ),
+            cert_reqs = "CERT_REQUIRED" if check_cert else "CERT_NONE",
+            ca_certs = os.environ.get("SSL_CERT_FILE") or certifi.where()
+        )
+        
+        if self._option("keep_alive", MINIO_S3_HTTP_KEEP_ALIVE):
+            options["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        
+        # Instrumented managers only measure requests while an instrumentation hook is registered
+        if not self._is_proxy_conn:
+            return InstrumentedPoolManager(**options)
         
+        return InstrumentedProxyManager(proxy_url = MINIO_S3_HTTP_REQUEST_PROXY_URL.get(), **options)
+    
+    def _option(self, name: str, variable):
+        value = self._http_options.get(name)
+        return value if value is not None else variable.get()
+    
+    def _from_memory(self) -> MemoryBackend:
+        return MemoryBackend()
+    
+    def _from_local(self) -> LocalDirectoryBackend:
+        root = self._root or MINIO_S3_LOCAL_ROOT.get()
+        
+        if root is None:
+            raise ClientConfigurationException("Expected a root directory for the local storage backend, either "
+                                               "passed to the builder or declared on MINIO_S3_LOCAL_ROOT.")
+        
+        return LocalDirectoryBackend(root)
+    
     def _from_toml(self):
         raise NotImplementedError
     
@@ -122,6 +229,12 @@ class ClientBuilder:
         if self._creation_option == "env":
             return self._from_env()
         
+        if self._creation_option == "memory":
+            return self._from_memory()
+        
+        if self._creation_option == "local":
+            return self._from_local()
+        
         if self._creation_option == "toml":
             return self._from_toml()
         
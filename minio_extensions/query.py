@@ -0,0 +1,185 @@
+import csv
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from minio import Minio
+from minio.select import (
+    SelectRequest,
+    CSVInputSerialization,
+    CSVOutputSerialization,
+    JSONInputSerialization,
+    JSONOutputSerialization,
+    ParquetInputSerialization,
+    COMPRESSION_TYPE_NONE,
+    COMPRESSION_TYPE_GZIP,
+    COMPRESSION_TYPE_BZIP2,
+    FILE_HEADER_INFO_USE,
+    JSON_TYPE_LINES
+)
+
+from minio_extensions._typing import (
+    Literal,
+    Optional,
+    Dict,
+    Tuple,
+    Type,
+    Iterable,
+    Iterator,
+    Any
+)
+from minio_extensions.environment import MINIO_S3_TRANSFER_CHUNK_SIZE
+
+InputFormat = Literal["csv", "json", "parquet"]
+OutputFormat = Literal["json", "csv"]
+
+_COMPRESSION_SUFFIXES = {
+    ".gz": COMPRESSION_TYPE_GZIP,
+    ".bz2": COMPRESSION_TYPE_BZIP2
+}
+
+_FORMAT_SUFFIXES = {
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".json": "json",
+    ".jsonl": "json",
+    ".ndjson": "json",
+    ".parquet": "parquet"
+}
+
+# Marks the end of the records of one object on fan-out queries
+_DONE = object()
+
+
+def input_serialization(object_name: str,
+                        input_format: Optional[InputFormat] = None,
+                        compression: Optional[str] = None,
+                        file_header_info: Optional[str] = FILE_HEADER_INFO_USE,
+                        field_delimiter: Optional[str] = None):
+    """
+    Builds the S3 Select input serialization of an object, inferring its format and compression from the
+    object name extensions when not specified.
+    """
+    name = object_name.lower()
+
+    for suffix, compression_type in _COMPRESSION_SUFFIXES.items():
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            compression = compression or compression_type
+
+    if input_format is None:
+        input_format = next((f for suffix, f in _FORMAT_SUFFIXES.items() if name.endswith(suffix)), None)
+
+        if input_format is None:
+            raise ValueError(f"Could not infer the format of {object_name}, specify one of csv, json or parquet.")
+
+    if input_format == "csv":
+        return CSVInputSerialization(compression_type = compression or COMPRESSION_TYPE_NONE,
+                                     file_header_info = file_header_info,
+                                     field_delimiter = field_delimiter or ("\t" if name.endswith(".tsv") else ","))
+    if input_format == "json":
+        return JSONInputSerialization(compression_type = compression or COMPRESSION_TYPE_NONE,
+                                      json_type = JSON_TYPE_LINES)
+    if input_format == "parquet":
+        return ParquetInputSerialization()
+
+    raise ValueError(f"Unsupported input format {input_format}, expected one of csv, json or parquet.")
+
+
+def _iter_lines(chunks: Iterable[bytes]) -> Iterator[str]:
+    pending = b""
+
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8") + "\n"
+
+    if pending:
+        yield pending.decode("utf-8")
+
+
+def select_records(client: Type[Minio], bucket_name: str, object_name: str, expression: str,
+                   output_format: OutputFormat = "json", **serialization) -> Iterator[Any]:
+    """
+    Runs an S3 Select expression against a single object yielding each matching record as soon as it is
+    received, as a dictionary for json output or as a list of fields for csv output.
+    """
+    request = SelectRequest(
+        expression,
+        input_serialization(object_name, **serialization),
+        JSONOutputSerialization(record_delimiter = "\n") if output_format == "json" else CSVOutputSerialization(),
+        request_progress = False
+    )
+
+    reader = client.select_object_content(bucket_name = bucket_name, object_name = object_name, request = request)
+    try:
+        lines = _iter_lines(reader.stream(MINIO_S3_TRANSFER_CHUNK_SIZE.get()))
+
+        if output_format == "json":
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            # The csv reader joins the lines of quoted fields holding record delimiters
+            yield from csv.reader(lines)
+    finally:
+        reader.close()
+
+
+def fan_out_select(client: Type[Minio], bucket_name: str, object_names: Iterable[str], expression: str,
+                   max_workers: int,
+                   errors: Dict[str, BaseException],
+                   max_pending_records: int = 10000,
+                   **kwargs) -> Iterator[Tuple[str, Any]]:
+    """
+    Runs an S3 Select expression against several objects concurrently, yielding (object_name, record) tuples
+    in arrival order. Producers block once max_pending_records records are waiting to be consumed, and stop
+    as soon as the consumer closes the iterator. The exception raised by each failed object is stored on
+    errors.
+    """
+    records: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize = max_pending_records)
+    stopped = threading.Event()
+    names = list(object_names)
+
+    def _put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                records.put(item, timeout = 0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _select(object_name: str):
+        try:
+            for record in select_records(client, bucket_name, object_name, expression, **kwargs):
+                if not _put((object_name, record)):
+                    return
+        except Exception as e:
+            errors[object_name] = e
+        finally:
+            _put((object_name, _DONE))
+
+    executor = ThreadPoolExecutor(max_workers = max_workers, thread_name_prefix = "minio-extensions-select")
+    futures = []
+    try:
+        for name in names:
+            futures.append(executor.submit(_select, name))
+
+        remaining = len(names)
+        while remaining > 0:
+            object_name, record = records.get()
+            if record is _DONE:
+                remaining -= 1
+                continue
+            yield object_name, record
+
+    finally:
+        # Queued objects are cancelled by hand, as shutdown only cancels them from Python 3.9, and before the
+        # producers are stopped so no worker picks up another object in between
+        for future in futures:
+            future.cancel()
+        stopped.set()
+        executor.shutdown(wait = True)
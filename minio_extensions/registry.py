@@ -0,0 +1,142 @@
+import os
+import threading
+import weakref
+
+from urllib3 import PoolManager
+
+from minio_extensions import environment
+from minio_extensions._typing import (
+    Dict,
+    Tuple,
+    Any
+)
+from minio_extensions.providers import (
+    ClientBuilder,
+    ConfigurationOptions
+)
+
+# Environment variables taking part on the configuration of clients built by the registry. Declared variables are
+# collected by their actual names, as some of them do not follow the MINIO_S3_ prefix
+_CONFIGURATION_VARIABLES = tuple(sorted(
+    {v.name for v in vars(environment).values() if isinstance(v, environment._EnvVarBase)} | {"SSL_CERT_FILE"}
+))
+
+
+class ClientRegistry:
+    """
+    Hands out a single shared client per configuration and process, so repeated client requests skip the
+    configuration parsing and reuse the same warm connection pools.
+
+    Clients are keyed by their creation options, their builder options and the declared environment variables
+    they were built from, so changing the environment yields a new client instead of a stale one. The .env file
+    is loaded once, on the first request, until the registry is reloaded. Forked child processes keep the
+    registered clients but drop the pooled connections inherited from their parent, opening new ones on demand.
+    """
+
+    def __init__(self) -> None:
+        self._clients: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._environment_loaded = False
+        _registries.add(self)
+
+    def get(self, creation_options: ConfigurationOptions = "env", **builder_options) -> Any:
+        """
+        Returns the client shared by the process for a configuration, building it on the first request.
+
+        Args:
+            creation_options: Source of the client configuration, as accepted by ClientBuilder.
+            **builder_options: Any other option accepted by ClientBuilder, like the HTTP pool settings.
+        """
+        with self._lock:
+            if not self._environment_loaded:
+                self._load_environment(override = False)
+
+            key = self._key(creation_options, builder_options)
+            client = self._clients.get(key)
+
+            if client is None:
+                client = ClientBuilder(creation_option = creation_options, **builder_options).configure()
+                self._clients[key] = client
+
+            return client
+
+    def load_environment(self):
+        """
+        Loads the .env file into the environment unless it was already loaded by the registry.
+        """
+        with self._lock:
+            if not self._environment_loaded:
+                self._load_environment(override = False)
+
+    def reload(self):
+        """
+        Reloads the .env file, overriding variables already defined, and forgets every registered client,
+        closing their idle connections. Clients already handed out keep working with their previous settings.
+        """
+        with self._lock:
+            self._load_environment(override = True)
+            clients, self._clients = self._clients, {}
+
+        for client in clients.values():
+            _close_pools(client)
+
+    def clear(self):
+        """
+        Forgets every registered client, closing their idle connections.
+        """
+        with self._lock:
+            clients, self._clients = self._clients, {}
+
+        for client in clients.values():
+            _close_pools(client)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def _load_environment(self, override: bool):
+        import dotenv as de
+        de.load_dotenv(override = override)
+        self._environment_loaded = True
+
+    @staticmethod
+    def _key(creation_options: str, builder_options: Dict[str, Any]) -> Tuple:
+        variables = tuple((name, os.environ.get(name)) for name in _CONFIGURATION_VARIABLES)
+        return creation_options, tuple(sorted(builder_options.items())), variables
+
+    def _after_fork_in_child(self):
+        # Another thread of the parent process may have held the lock when forking
+        self._lock = threading.Lock()
+
+        for client in self._clients.values():
+            _reset_pools(client)
+
+
+def _close_pools(client: Any):
+    http = getattr(client, "_http", None)
+
+    if isinstance(http, PoolManager):
+        http.clear()
+
+
+def _reset_pools(client: Any):
+    http = getattr(client, "_http", None)
+
+    # Inherited sockets are shared with the parent process, so they are dropped instead of being closed by the
+    # pool, whose own lock could also have been held by a parent thread when forking
+    if isinstance(http, PoolManager):
+        http.pools = type(http.pools)(http.pools._maxsize)
+
+
+_registries: "weakref.WeakSet[ClientRegistry]" = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    for registry in list(_registries):
+        registry._after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child = _after_fork_in_child)
+
+#: Registry shared by the process, used by MinioExtensions.create_provider.
+CLIENT_REGISTRY = ClientRegistry()
@@ -0,0 +1,133 @@
+from pydantic import BaseModel
+
+from minio_extensions._typing import (
+    List,
+    Dict,
+    Optional,
+    Tuple
+)
+
+
+class SyncReport(BaseModel):
+    """
+    Outcome of a directory synchronization between a local folder and a bucket prefix.
+    """
+
+    transferred: List[str] = []
+    """Keys whose contents were transferred"""
+
+    skipped: List[str] = []
+    """Keys found unchanged on both sides"""
+
+    deleted: List[str] = []
+    """Extraneous keys or local files removed from the destination"""
+
+    errors: Dict[str, str] = {}
+    """Error message of each key that could not be synchronized"""
+
+    bytes_transferred: int = 0
+    """Total amount of bytes transferred"""
+
+
+class ObjectRemovalResult(BaseModel):
+    """
+    Outcome of the removal of a single object or object version.
+    """
+
+    object_name: str
+    version_id: Optional[str] = None
+    removed: bool = True
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+class RemovalReport(BaseModel):
+    """
+    Outcome of a bulk object removal.
+    """
+
+    results: List[ObjectRemovalResult] = []
+
+    @property
+    def deleted(self) -> List[ObjectRemovalResult]:
+        return [r for r in self.results if r.removed]
+
+    @property
+    def failed(self) -> List[ObjectRemovalResult]:
+        return [r for r in self.results if not r.removed]
+
+
+class InventoryRefreshReport(BaseModel):
+    """
+    Outcome of a bucket inventory refresh.
+    """
+
+    prefixes: List[str] = []
+    """Prefixes whose listing was refreshed"""
+
+    added: int = 0
+    """Rows of objects not previously known to the inventory"""
+
+    updated: int = 0
+    """Rows of objects modified since the previous refresh"""
+
+    removed: int = 0
+    """Rows of objects no longer present on the bucket"""
+
+    unchanged: int = 0
+    """Rows found unchanged and left untouched"""
+
+    errors: Dict[str, str] = {}
+    """Error message of each prefix that could not be listed"""
+
+
+class ObjectTaggingResult(BaseModel):
+    """
+    Outcome of the tagging of a single object or object version.
+    """
+
+    object_name: str
+    version_id: Optional[str] = None
+    tagged: bool = True
+    changed: bool = True
+    """Whether the tags of the object were written, False when they already matched"""
+    tags: Dict[str, str] = {}
+    """Tags of the object once the operation finished"""
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+
+
+class TaggingReport(BaseModel):
+    """
+    Outcome of a bulk object tagging.
+    """
+
+    results: List[ObjectTaggingResult] = []
+
+    @property
+    def tagged(self) -> List[ObjectTaggingResult]:
+        return [r for r in self.results if r.tagged]
+
+    @property
+    def failed(self) -> List[ObjectTaggingResult]:
+        return [r for r in self.results if not r.tagged]
+
+    @property
+    def by_object(self) -> Dict[Tuple[str, Optional[str]], ObjectTaggingResult]:
+        """Results keyed by (object_name, version_id), as versions of the same object are tagged separately"""
+        return {(r.object_name, r.version_id): r for r in self.results}
+
+
+class TagIndexRefreshReport(BaseModel):
+    """
+    Outcome of a tag index refresh.
+    """
+
+    fetched: int = 0
+    """Objects whose tags were fetched and indexed"""
+
+    skipped: int = 0
+    """Objects whose indexed tags were still current"""
+
+    errors: Dict[Tuple[str, Optional[str]], str] = {}
+    """Error message of each (object_name, version_id) whose tags could not be fetched"""
@@ -0,0 +1,167 @@
+import functools
+import inspect
+import threading
+import time
+
+from minio import Minio, S3Error
+
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    Type,
+    Any
+)
+from minio_extensions.environment import MINIO_S3_SESSION_BUCKET_TTL
+from minio_extensions.extensions import MinioExtensions
+
+
+class _SessionClient:
+    """
+    Proxy over a Minio client remembering which buckets are known to exist.
+
+    Bucket existence checks are answered from memory while the validation is within its TTL, and any
+    NoSuchBucket error raised by the wrapped client, including while iterating its lazy results, invalidates
+    the bucket right away.
+    """
+
+    def __init__(self, client: Type[Minio], bucket_ttl: float) -> None:
+        self._client = client
+        self._bucket_ttl = bucket_ttl
+        self._buckets: Dict[str, float] = {}
+        self._wrappers: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def wrapped(self) -> Type[Minio]:
+        return self._client
+
+    def validate_bucket(self, bucket_name: str):
+        with self._lock:
+            self._buckets[bucket_name] = time.monotonic() + self._bucket_ttl
+
+    def invalidate_bucket(self, bucket_name: Optional[str] = None):
+        with self._lock:
+            if bucket_name is None:
+                self._buckets.clear()
+            else:
+                self._buckets.pop(bucket_name, None)
+
+    def is_bucket_validated(self, bucket_name: str) -> bool:
+        expires_at = self._buckets.get(bucket_name)
+        return expires_at is not None and time.monotonic() < expires_at
+
+    def bucket_exists(self, bucket_name: str) -> bool:
+        if self.is_bucket_validated(bucket_name):
+            return True
+
+        exists = self._client.bucket_exists(bucket_name = bucket_name)
+
+        if exists:
+            self.validate_bucket(bucket_name)
+        else:
+            self.invalidate_bucket(bucket_name)
+
+        return exists
+
+    def make_bucket(self, bucket_name: str, *args, **kwargs):
+        result = self._client.make_bucket(bucket_name, *args, **kwargs)
+        self.validate_bucket(bucket_name)
+        return result
+
+    def remove_bucket(self, bucket_name: str):
+        self.invalidate_bucket(bucket_name)
+        return self._client.remove_bucket(bucket_name)
+
+    def __getattr__(self, name: str) -> Any:
+        # Client methods are wrapped once and reused, keeping hot paths free of a closure per call
+        wrapper = self._wrappers.get(name)
+
+        if wrapper is not None:
+            return wrapper
+
+        attribute = getattr(self._client, name)
+
+        if not callable(attribute):
+            return attribute
+
+        def _invalidate_missing_bucket(e: S3Error, args, kwargs):
+            if e.code == "NoSuchBucket":
+                self.invalidate_bucket(e.bucket_name or kwargs.get("bucket_name") or (args[0] if args else None))
+
+        def _iterate(result, args, kwargs):
+            try:
+                yield from result
+            except S3Error as e:
+                _invalidate_missing_bucket(e, args, kwargs)
+                raise
+
+        @functools.wraps(attribute)
+        def _call(*args, **kwargs):
+            try:
+                result = attribute(*args, **kwargs)
+            except S3Error as e:
+                _invalidate_missing_bucket(e, args, kwargs)
+                raise
+
+            # Lazy results like listings only raise once iterated
+            return _iterate(result, args, kwargs) if inspect.isgenerator(result) else result
+
+        self._wrappers[name] = _call
+        return _call
+
+
+class MinioSession:
+    """
+    Stateful context around a Minio client exposing every MinioExtensions operation without the client
+    argument, and caching validated buckets so repeated operations skip the bucket existence requests.
+
+    Example:
+        with MinioSession(client) as session:
+            files = session.get_objects(bucket = "bucket", files = ["a.parquet", "b.parquet"])
+    """
+
+    def __init__(self, client: Optional[Type[Minio]] = None, bucket_ttl: Optional[float] = None) -> None:
+        self._client = _SessionClient(
+            client if client is not None else MinioExtensions.create_provider(),
+            bucket_ttl if bucket_ttl is not None else MINIO_S3_SESSION_BUCKET_TTL.get()
+        )
+
+    @property
+    def client(self) -> Type[Minio]:
+        """Session bound client. Calls made through it share the session bucket validations."""
+        return self._client
+
+    def invalidate_bucket(self, bucket: Optional[str] = None):
+        """
+        Forgets the validation of a bucket, or of every bucket when not specified.
+        """
+        self._client.invalidate_bucket(bucket)
+
+    def close(self):
+        self._client.invalidate_bucket()
+
+    def __enter__(self) -> "MinioSession":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        operation = getattr(MinioExtensions, name)
+
+        if not _takes_client(operation):
+            return operation
+
+        return functools.partial(operation, self._client)
+
+
+@functools.lru_cache(maxsize = None)
+def _takes_client(operation) -> bool:
+    if not callable(operation):
+        return False
+
+    parameters = list(inspect.signature(operation).parameters)
+    return len(parameters) > 0 and parameters[0] == "client"
@@ -0,0 +1,206 @@
+import mimetypes
+import os
+
+from minio import Minio
+from minio.datatypes import Object
+from minio.helpers import get_part_info
+
+from minio_extensions._concurrency import (
+    iter_completed,
+    resolve_max_workers
+)
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    Tuple,
+    Type
+)
+from minio_extensions.environment import MINIO_S3_TRANSFER_PART_SIZE
+from minio_extensions.metadata.constants import VERSION_INDEX_PREFIX
+from minio_extensions.reports import SyncReport
+from minio_extensions.transfer import etag_matches
+
+LocalFile = Tuple[str, int, float]
+
+
+def _object_key(prefix: Optional[str], relative_path: str) -> str:
+    relative_key = relative_path.replace(os.sep, "/")
+    return f"{prefix.rstrip('/')}/{relative_key}" if prefix else relative_key
+
+
+def _relative_path(prefix: Optional[str], key: str) -> str:
+    relative_key = key[len(prefix.rstrip("/")) + 1:] if prefix else key
+    return relative_key.replace("/", os.sep)
+
+
+def scan_local(local_dir: str, prefix: Optional[str] = None) -> Dict[str, LocalFile]:
+    """
+    Lists every file below a local directory keyed by the object key it maps to under prefix.
+    """
+    files: Dict[str, LocalFile] = {}
+
+    for root, _, names in os.walk(local_dir):
+        for name in names:
+            path = os.path.join(root, name)
+
+            if name.endswith(".part.minio"):
+                continue
+
+            st = os.stat(path)
+            files[_object_key(prefix, os.path.relpath(path, local_dir))] = (path, st.st_size, st.st_mtime)
+
+    return files
+
+
+def scan_remote(client: Type[Minio], bucket: str, prefix: Optional[str] = None) -> Dict[str, Type[Object]]:
+    """
+    Lists every object below a bucket prefix with a single recursive listing.
+    """
+    list_prefix = f"{prefix.rstrip('/')}/" if prefix else None
+
+    return {
+        obj.object_name: obj
+        for obj in client.list_objects(bucket_name = bucket, prefix = list_prefix, recursive = True)
+        if not obj.is_dir and not obj.object_name.startswith(VERSION_INDEX_PREFIX)
+    }
+
+
+def is_unchanged(local: LocalFile, remote: Type[Object], newer_side: str) -> bool:
+    """
+    Checks whether a local file and a remote object hold the same contents.
+
+    Sizes are compared first. When the destination copy is at least as recent as the source one the files
+    are assumed equal, otherwise the local file ETag is computed and compared to the remote one.
+    """
+    path, size, mtime = local
+
+    if remote.size != size:
+        return False
+
+    remote_mtime = remote.last_modified.timestamp() if remote.last_modified is not None else None
+
+    if remote_mtime is not None:
+        if newer_side == "remote" and remote_mtime >= mtime:
+            return True
+        if newer_side == "local" and mtime >= remote_mtime:
+            return True
+
+    return etag_matches(path, remote.etag)
+
+
+def _delete_remote(client: Type[Minio], bucket: str, keys, report: SyncReport, max_workers: Optional[int]):
+    from minio_extensions.extensions import MinioExtensions
+
+    removal = MinioExtensions.remove_objects(client, bucket = bucket, files = keys, max_workers = max_workers)
+
+    for result in removal.results:
+        if result.removed:
+            report.deleted.append(result.object_name)
+        else:
+            report.errors[result.object_name] = result.error_message or result.error_code
+
+
+def sync_up(client: Type[Minio], bucket: str, local_dir: str, prefix: Optional[str] = None,
+            delete: bool = False, max_workers: Optional[int] = None,
+            part_size: Optional[int] = None, remove_all: bool = False) -> SyncReport:
+    """
+    Uploads the files of a local directory missing or changed under a bucket prefix. Deleting the objects
+    missing locally from the bucket root requires remove_all, as with remove_objects.
+    """
+    if not os.path.isdir(local_dir):
+        raise ValueError(f"Local directory {local_dir} does not exists.")
+
+    if delete and not prefix and not remove_all:
+        raise ValueError(f"Deleting without a prefix removes every object of bucket {bucket} missing locally, "
+                         f"set remove_all to do so.")
+
+    part_size = part_size or MINIO_S3_TRANSFER_PART_SIZE.get()
+    local_files = scan_local(local_dir, prefix)
+    remote_objects = scan_remote(client, bucket, prefix)
+    report = SyncReport()
+
+    def _check_and_upload(item):
+        key, local = item
+        remote = remote_objects.get(key)
+
+        # Remote copies newer than the local file were uploaded after its last change
+        if remote is not None and is_unchanged(local, remote, newer_side = "remote"):
+            return False
+
+        path, size, _ = local
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        client.fput_object(bucket_name = bucket, object_name = key, file_path = path, content_type = content_type,
+                           part_size = max(part_size, get_part_info(size, 0)[0]), num_parallel_uploads = 1)
+        return True
+
+    for (key, (_, size, _)), transferred, error in iter_completed(_check_and_upload, local_files.items(),
+                                                                  resolve_max_workers(max_workers)):
+        if error is not None:
+            report.errors[key] = str(error)
+        elif transferred:
+            report.transferred.append(key)
+            report.bytes_transferred += size
+        else:
+            report.skipped.append(key)
+
+    extraneous = sorted(set(remote_objects) - set(local_files))
+
+    if delete and len(extraneous) > 0:
+        _delete_remote(client, bucket, extraneous, report, max_workers)
+
+    return report
+
+
+def sync_down(client: Type[Minio], bucket: str, local_dir: str, prefix: Optional[str] = None,
+              delete: bool = False, max_workers: Optional[int] = None) -> SyncReport:
+    """
+    Downloads the objects of a bucket prefix missing or changed on a local directory.
+    """
+    os.makedirs(local_dir, exist_ok = True)
+
+    local_root = os.path.realpath(local_dir)
+    local_files = scan_local(local_dir, prefix)
+    remote_objects = scan_remote(client, bucket, prefix)
+    report = SyncReport()
+
+    def _check_and_download(item):
+        key, remote = item
+        path = os.path.realpath(os.path.join(local_root, _relative_path(prefix, key)))
+
+        if not path.startswith(local_root + os.sep):
+            raise ValueError(f"Object key {key} resolves outside of {local_dir}.")
+
+        local = local_files.get(key)
+
+        # Local copies newer than the remote object were downloaded after its last change
+        if local is not None and is_unchanged(local, remote, newer_side = "local"):
+            return False
+
+        client.fget_object(bucket_name = bucket, object_name = key, file_path = path)
+
+        if remote.last_modified is not None:
+            # Aligning the local modification time lets the next sync skip the file without hashing it
+            timestamp = remote.last_modified.timestamp()
+            os.utime(path, (timestamp, timestamp))
+
+        return True
+
+    for (key, remote), transferred, error in iter_completed(_check_and_download, remote_objects.items(),
+                                                            resolve_max_workers(max_workers)):
+        if error is not None:
+            report.errors[key] = str(error)
+        elif transferred:
+            report.transferred.append(key)
+            report.bytes_transferred += remote.size or 0
+        else:
+            report.skipped.append(key)
+
+    if delete:
+        for key in sorted(set(local_files) - set(remote_objects)):
+            try:
+                os.remove(local_files[key][0])
+                report.deleted.append(key)
+            except OSError as e:
+                report.errors[key] = str(e)
+
+    return report
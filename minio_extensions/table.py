@@ -0,0 +1,345 @@
+import datetime
+import importlib
+import itertools
+from array import array
+
+from minio.datatypes import Object
+
+from minio_extensions._timestamps import (
+    MISSING_TIMESTAMP,
+    datetime_to_epoch_us,
+    epoch_us_to_datetime,
+    parse_http_dates
+)
+from minio_extensions._typing import (
+    Optional,
+    Dict,
+    List,
+    Tuple,
+    Iterable,
+    Iterator,
+    Any
+)
+from minio_extensions.metadata.constants import (
+    OBJECT_META_LAST_MODIFIED_ATT,
+    OBJECT_META_VERSION_ATT,
+    OBJECT_META_ETAG_ATT,
+    OBJECT_META_CONTENT_LENGTH_ATT,
+    OBJECT_CONTENT_TYPE_ATT
+)
+
+# Objects appended to tables per batch when building them from iterables
+DEFAULT_BATCH_SIZE = 10000
+
+
+def _require(module: str, feature: str):
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(f"{feature} requires the {module} package.") from e
+
+
+class _StringColumn:
+    """
+    Strings kept on a single UTF-8 buffer indexed by int64 offsets, the layout of arrow large string arrays.
+    Missing values are kept as empty strings.
+    """
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+
+    def extend(self, values: Iterable[Optional[str]]):
+        encoded = [v.encode("utf-8") if v else b"" for v in values]
+        ends = itertools.accumulate(map(len, encoded), initial = self.offsets[-1])
+        next(ends)
+
+        self.data += b"".join(encoded)
+        self.offsets.extend(ends)
+
+    def __getitem__(self, index: int) -> str:
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def values(self) -> List[str]:
+        data, offsets = self.data, self.offsets
+        return [data[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+class _DictionaryColumn:
+    """
+    Low cardinality strings kept as int32 codes into a list of distinct values, -1 for missing values.
+    """
+
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def extend(self, values: Iterable[Optional[str]]):
+        index = self._index
+        codes = []
+
+        for value in values:
+            if not value:
+                codes.append(-1)
+                continue
+
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(self.categories)
+                self.categories.append(value)
+            codes.append(code)
+
+        self.codes.extend(codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        code = self.codes[index]
+        return self.categories[code] if code >= 0 else None
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes)
+
+
+class ObjectRecord:
+    """
+    Single row of an ObjectTable.
+    """
+
+    __slots__ = ("object_name", "size", "etag", "last_modified", "version_id", "content_type", "is_latest",
+                 "is_delete_marker")
+
+    def __init__(self, object_name: str, size: int, etag: Optional[str],
+                 last_modified: Optional[datetime.datetime],
+                 version_id: Optional[str],
+                 content_type: Optional[str],
+                 is_latest: bool,
+                 is_delete_marker: bool) -> None:
+        self.object_name = object_name
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.version_id = version_id
+        self.content_type = content_type
+        self.is_latest = is_latest
+        self.is_delete_marker = is_delete_marker
+
+    def __repr__(self) -> str:
+        return "ObjectRecord({0})".format(", ".join(f"{k}={getattr(self, k)!r}" for k in self.__slots__))
+
+
+class ObjectTable:
+    """
+    Column oriented table of object listings or metadata, holding millions of objects in a fraction of the
+    memory taken by minio Object instances.
+
+    Names, ETags and version ids are kept on UTF-8 buffers indexed by int64 offsets, sizes and modification
+    times (microseconds since epoch, UTC) on int64 arrays and content types dictionary encoded. The layout is
+    arrow's, so columns are exported to pyarrow, and numeric columns to NumPy, without copying them. Exported
+    buffers pin the table, which can not grow while they are referenced.
+    """
+
+    COLUMNS = ("object_name", "size", "etag", "last_modified", "version_id", "content_type", "is_latest",
+               "is_delete_marker")
+
+    def __init__(self, bucket_name: Optional[str] = None) -> None:
+        self.bucket_name = bucket_name
+        self._names = _StringColumn()
+        self._sizes = array("q")
+        self._etags = _StringColumn()
+        self._last_modified = array("q")
+        self._version_ids = _StringColumn()
+        self._content_types = _DictionaryColumn()
+        self._is_latest = array("b")
+        self._is_delete_marker = array("b")
+
+    @classmethod
+    def from_objects(cls, objects: Iterable[Object], bucket_name: Optional[str] = None,
+                     batch_size: Optional[int] = None) -> "ObjectTable":
+        """
+        Builds a table from minio listing or stat_object results. Folder entries of non recursive listings
+        are skipped.
+        """
+        table = cls(bucket_name)
+        table.extend(objects, batch_size = batch_size)
+        return table
+
+    def extend(self, objects: Iterable[Object], batch_size: Optional[int] = None):
+        """
+        Appends minio listing or stat_object results, consuming the iterable in batches so listings are
+        never fully materialized as Object instances.
+        """
+        iterator = iter(objects)
+
+        while batch := list(itertools.islice(iterator, batch_size or DEFAULT_BATCH_SIZE)):
+            batch = [o for o in batch if not o.is_dir]
+            self.append_columns(
+                names = [o.object_name for o in batch],
+                sizes = [o.size or 0 for o in batch],
+                etags = [o.etag for o in batch],
+                last_modified = [datetime_to_epoch_us(o.last_modified) for o in batch],
+                version_ids = [o.version_id for o in batch],
+                content_types = [o.content_type or _metadata_content_type(o.metadata) for o in batch],
+                is_latest = [o.is_latest != "false" for o in batch],
+                is_delete_marker = [bool(o.is_delete_marker) for o in batch]
+            )
+
+    def extend_metadata(self, metadata: Iterable[Tuple[str, Dict[str, Any]]], batch_size: Optional[int] = None):
+        """
+        Appends (object_name, metadata) pairs, where metadata holds the response headers of stat_object as
+        returned by MinioExtensions.get_object_metadata. Modification dates are parsed per batch.
+        """
+        iterator = iter(metadata)
+
+        while batch := list(itertools.islice(iterator, batch_size or DEFAULT_BATCH_SIZE)):
+            self.append_columns(
+                names = [name for name, _ in batch],
+                sizes = [int(m.get(OBJECT_META_CONTENT_LENGTH_ATT) or 0) for _, m in batch],
+                etags = [(m.get(OBJECT_META_ETAG_ATT) or "").strip('"') for _, m in batch],
+                last_modified = parse_http_dates(m.get(OBJECT_META_LAST_MODIFIED_ATT) for _, m in batch),
+                version_ids = [m.get(OBJECT_META_VERSION_ATT) for _, m in batch],
+                content_types = [m.get(OBJECT_CONTENT_TYPE_ATT) for _, m in batch],
+                is_latest = [True] * len(batch),
+                is_delete_marker = [False] * len(batch)
+            )
+
+    def append_columns(self, names: List[str], sizes: List[int], etags: List[Optional[str]],
+                       last_modified: List[int],
+                       version_ids: List[Optional[str]],
+                       content_types: List[Optional[str]],
+                       is_latest: List[bool],
+                       is_delete_marker: List[bool]):
+        """
+        Appends a batch of rows given column wise. Modification times are microseconds since epoch, UTC, or
+        MISSING_TIMESTAMP when unknown.
+        """
+        self._names.extend(names)
+        self._sizes.extend(sizes)
+        self._etags.extend(etags)
+        self._last_modified.extend(last_modified)
+        self._version_ids.extend(version_ids)
+        self._content_types.extend(content_types)
+        self._is_latest.extend(is_latest)
+        self._is_delete_marker.extend(is_delete_marker)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __getitem__(self, index: int) -> ObjectRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ObjectTable index out of range")
+
+        return ObjectRecord(
+            object_name = self._names[index],
+            size = self._sizes[index],
+            etag = self._etags[index] or None,
+            last_modified = epoch_us_to_datetime(self._last_modified[index]),
+            version_id = self._version_ids[index] or None,
+            content_type = self._content_types[index],
+            is_latest = bool(self._is_latest[index]),
+            is_delete_marker = bool(self._is_delete_marker[index])
+        )
+
+    def __iter__(self) -> Iterator[ObjectRecord]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def nbytes(self) -> int:
+        """Memory taken by the table columns, in bytes."""
+        return (self._names.nbytes + self._etags.nbytes + self._version_ids.nbytes + self._content_types.nbytes +
+                self._sizes.itemsize * len(self._sizes) * 2 + len(self._is_latest) * 2)
+
+    @property
+    def total_size(self) -> int:
+        """Sum of the sizes of every object on the table, in bytes."""
+        return sum(self._sizes)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Exports the table as a dictionary of NumPy arrays. Sizes, modification times (``datetime64[us]``, NaT
+        when unknown) and flags are views over the table columns, strings are object arrays.
+        """
+        np = _require("numpy", "ObjectTable.to_numpy")
+
+        categories = np.array(self._content_types.categories + [None], dtype = object)
+        return {
+            "object_name": np.array(self._names.values(), dtype = object),
+            "size": np.frombuffer(self._sizes, dtype = np.int64),
+            "etag": np.array(self._etags.values(), dtype = object),
+            "last_modified": np.frombuffer(self._last_modified, dtype = np.int64).view("datetime64[us]"),
+            "version_id": np.array([v or None for v in self._version_ids.values()], dtype = object),
+            # Missing content types index the trailing None
+            "content_type": categories[np.frombuffer(self._content_types.codes, dtype = np.int32)],
+            "is_latest": np.frombuffer(self._is_latest, dtype = np.bool_),
+            "is_delete_marker": np.frombuffer(self._is_delete_marker, dtype = np.bool_)
+        }
+
+    def to_arrow(self):
+        """
+        Exports the table as a pyarrow Table. Names, ETags, sizes and modification times share the table
+        buffers, content types are dictionary encoded.
+        """
+        pa = _require("pyarrow", "ObjectTable.to_arrow")
+        pc = _require("pyarrow.compute", "ObjectTable.to_arrow")
+
+        length = len(self)
+
+        def _strings(column: _StringColumn):
+            return pa.LargeStringArray.from_buffers(length, pa.py_buffer(column.offsets), pa.py_buffer(column.data))
+
+        def _numbers(values: array, type_):
+            return pa.Array.from_buffers(type_, length, [None, pa.py_buffer(values)])
+
+        last_modified = _numbers(self._last_modified, pa.int64())
+        if MISSING_TIMESTAMP in self._last_modified:
+            last_modified = pc.if_else(pc.equal(last_modified, MISSING_TIMESTAMP), None, last_modified)
+
+        version_ids = _strings(self._version_ids)
+        version_ids = pc.if_else(pc.equal(version_ids, ""), None, version_ids)
+
+        codes = _numbers(self._content_types.codes, pa.int32())
+        if -1 in self._content_types.codes:
+            codes = pc.if_else(pc.less(codes, 0), None, codes)
+
+        return pa.table({
+            "object_name": _strings(self._names),
+            "size": _numbers(self._sizes, pa.int64()),
+            "etag": _strings(self._etags),
+            "last_modified": last_modified.cast(pa.timestamp("us", tz = "UTC")),
+            "version_id": version_ids,
+            "content_type": pa.DictionaryArray.from_arrays(codes, pa.array(self._content_types.categories,
+                                                                           type = pa.string())),
+            "is_latest": _numbers(self._is_latest, pa.int8()).cast(pa.bool_()),
+            "is_delete_marker": _numbers(self._is_delete_marker, pa.int8()).cast(pa.bool_())
+        })
+
+    def to_pandas(self):
+        """
+        Exports the table as a pandas DataFrame, through pyarrow when installed.
+        """
+        try:
+            return self.to_arrow().to_pandas()
+        except ImportError:
+            pd = _require("pandas", "ObjectTable.to_pandas")
+            return pd.DataFrame(self.to_numpy())
+
+    def __repr__(self) -> str:
+        return f"ObjectTable(bucket_name={self.bucket_name!r}, rows={len(self)}, nbytes={self.nbytes})"
+
+
+def _metadata_content_type(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    # MinIO lists the content type along with the user metadata of objects
+    if not metadata:
+        return None
+    return metadata.get("content-type") or metadata.get("Content-Type")
@@ -0,0 +1,295 @@
+import hashlib
+import http.client
+import math
+import os
+import re
+
+from minio import Minio, S3Error
+from minio.datatypes import Object
+from minio.helpers import get_part_info, ProgressType
+
+from minio_extensions._concurrency import iter_completed
+from minio_extensions._typing import (
+    Optional,
+    List,
+    Tuple,
+    Type
+)
+from minio_extensions.environment import (
+    MINIO_S3_TRANSFER_CHUNK_SIZE,
+    MINIO_S3_TRANSFER_PART_SIZE
+)
+from minio_extensions.exceptions import ObjectIntegrityException
+
+_MD5_ETAG_PATTERN = re.compile(r"^[0-9a-fA-F]{32}$")
+_MULTIPART_ETAG_PATTERN = re.compile(r"^[0-9a-fA-F]{32}-(\d+)$")
+
+# Part sizes commonly used by S3 clients, tried when guessing how a multipart object was uploaded
+_COMMON_PART_SIZES = [5, 8, 10, 15, 16, 32, 64, 100, 128, 256, 512]
+
+
+def compute_etag(path: str, part_size: Optional[int] = None) -> str:
+    """
+    Computes the S3 ETag a local file would have once uploaded.
+
+    Args:
+        path: Local file path.
+        part_size: Part size used by the multipart upload. Files smaller or equal to the part size
+            (or any file when not specified) are hashed as a single part upload.
+
+    Returns:
+        The md5 hex digest of the file for single part uploads, otherwise the multipart ETag in the
+        ``<md5-of-part-digests>-<part-count>`` format.
+    """
+    size = os.path.getsize(path)
+    chunk_size = MINIO_S3_TRANSFER_CHUNK_SIZE.get()
+
+    if part_size is None or size <= part_size:
+        digest = hashlib.md5()
+        with open(path, "rb") as fb:
+            while chunk := fb.read(chunk_size):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    part_digests = []
+    with open(path, "rb") as fb:
+        while True:
+            remaining = part_size
+            digest = hashlib.md5()
+            while remaining > 0 and (chunk := fb.read(min(chunk_size, remaining))):
+                digest.update(chunk)
+                remaining -= len(chunk)
+            if remaining == part_size:
+                break
+            part_digests.append(digest.digest())
+
+    return "{0}-{1}".format(hashlib.md5(b"".join(part_digests)).hexdigest(), len(part_digests))
+
+
+def candidate_part_sizes(size: int, etag: str) -> List[int]:
+    """
+    Lists the part sizes that could have produced a multipart ETag for an object of the given size,
+    most likely first. Returns an empty list for single part ETags.
+    """
+    match = _MULTIPART_ETAG_PATTERN.match(etag or "")
+
+    if match is None:
+        return []
+
+    part_count = int(match.group(1))
+    mib = 1024 * 1024
+    candidates = [
+        get_part_info(size, 0)[0],
+        MINIO_S3_TRANSFER_PART_SIZE.get(),
+        int(math.ceil(size / part_count / mib)) * mib,
+        *[s * mib for s in _COMMON_PART_SIZES]
+    ]
+
+    found = []
+    for candidate in candidates:
+        if candidate > 0 and candidate not in found and int(math.ceil(size / candidate)) == part_count:
+            found.append(candidate)
+
+    return found
+
+
+def first_part_size(client: Type[Minio], bucket_name: str, stat: Type[Object]) -> Optional[int]:
+    """
+    Asks the server for the size of the first part of a multipart object through a HEAD request with
+    ``partNumber=1``. Returns None when the server does not report it, or reports the whole object instead.
+    """
+    try:
+        part = client.stat_object(bucket_name = bucket_name, object_name = stat.object_name,
+                                  version_id = stat.version_id,
+                                  extra_query_params = {"partNumber": "1"})
+    except S3Error:
+        return None
+
+    if part.size is None or stat.size is None or part.size >= stat.size:
+        return None
+
+    return part.size
+
+
+def verify_download(path: str, stat: Type[Object],
+                    client: Optional[Type[Minio]] = None,
+                    bucket_name: Optional[str] = None):
+    """
+    Verifies a downloaded file against the size and ETag reported by the server.
+
+    Multipart ETags are first checked against the candidate part sizes. When none of them match, the actual
+    part size is requested from the server if a client is given, otherwise the file is only verified by size,
+    as a wrong guess of the part size does not prove the file is corrupt.
+
+    Raises:
+        ObjectIntegrityException: When the file size differs, a single part ETag does not match, or a multipart
+            ETag does not match the part size reported by the server.
+    """
+    local_size = os.path.getsize(path)
+
+    if stat.size is not None and local_size != stat.size:
+        raise ObjectIntegrityException(
+            f"Downloaded file has {local_size} bytes but the object has {stat.size} bytes.",
+            object_name = stat.object_name)
+
+    etag = (stat.etag or "").strip('"')
+    metadata = stat.metadata or {}
+
+    # Encrypted objects do not expose the md5 digest of their contents as ETag
+    if any(str(k).lower().startswith("x-amz-server-side-encryption") for k in metadata.keys()):
+        return
+
+    if _MD5_ETAG_PATTERN.match(etag):
+        if compute_etag(path) != etag.lower():
+            raise ObjectIntegrityException(
+                f"Downloaded file checksum does not match object ETag {etag}.",
+                object_name = stat.object_name)
+        return
+
+    candidates = candidate_part_sizes(local_size, etag)
+
+    if len(candidates) == 0 or any(compute_etag(path, part_size) == etag.lower() for part_size in candidates):
+        return
+
+    part_size = first_part_size(client, bucket_name, stat) if client is not None else None
+
+    if part_size is None:
+        return
+
+    if compute_etag(path, part_size) != etag.lower():
+        raise ObjectIntegrityException(
+            f"Downloaded file checksum does not match multipart object ETag {etag} for its part size "
+            f"{part_size}.",
+            object_name = stat.object_name)
+
+
+def split_ranges(size: int, part_size: int) -> List[Tuple[int, int]]:
+    """Splits an object size in (offset, length) ranges of at most part_size bytes."""
+    return [(offset, min(part_size, size - offset)) for offset in range(0, size, part_size)]
+
+
+def download_ranges(client: Type[Minio],
+                    bucket_name: str,
+                    object_name: str,
+                    file_path: str,
+                    stat: Type[Object],
+                    part_size: Optional[int] = None,
+                    max_workers: int = 1,
+                    progress: Optional[ProgressType] = None):
+    """
+    Downloads an object to a local file fetching byte ranges concurrently. The file is preallocated and
+    every range is written at its own offset, pinned to the stat'ed version and ETag so a concurrent
+    overwrite of the object can not produce a torn file.
+    """
+    part_size = part_size or MINIO_S3_TRANSFER_PART_SIZE.get()
+    chunk_size = MINIO_S3_TRANSFER_CHUNK_SIZE.get()
+    tmp_file_path = f"{file_path}.{(stat.etag or '').strip(chr(34))}.part.minio"
+    request_headers = {"If-Match": '"{0}"'.format(stat.etag.strip('"'))} if stat.etag else None
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok = True)
+
+    with open(tmp_file_path, "wb") as fb:
+        fb.truncate(stat.size)
+
+    if progress is not None:
+        progress.set_meta(object_name = object_name, total_length = stat.size)
+
+    def _fetch(item):
+        offset, length = item
+        response = client.get_object(bucket_name = bucket_name, object_name = object_name,
+                                     offset = offset, length = length,
+                                     request_headers = request_headers,
+                                     version_id = stat.version_id)
+        try:
+            with open(tmp_file_path, "r+b") as fb:
+                fb.seek(offset)
+                written = 0
+                for chunk in response.stream(chunk_size):
+                    fb.write(chunk)
+                    written += len(chunk)
+                    if progress is not None:
+                        progress.update(len(chunk))
+        finally:
+            response.close()
+            response.release_conn()
+
+        if written != length:
+            raise ObjectIntegrityException(
+                f"Expected {length} bytes at offset {offset} but received {written}.",
+                object_name = object_name)
+
+    try:
+        for _, _, error in iter_completed(_fetch, split_ranges(stat.size, part_size), max_workers):
+            if error is not None:
+                raise error
+
+        verify_download(tmp_file_path, stat, client = client, bucket_name = bucket_name)
+        os.replace(tmp_file_path, file_path)
+
+    except BaseException:
+        if os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+        raise
+
+
+def etag_matches(path: str, etag: Optional[str]) -> bool:
+    """
+    Checks whether a local file has the contents described by an S3 ETag, trying the most likely upload
+    part sizes for multipart ETags. ETags that are not content digests, like the ones of encrypted objects,
+    never match.
+    """
+    etag = (etag or "").strip('"').lower()
+
+    if _MD5_ETAG_PATTERN.match(etag):
+        return compute_etag(path) == etag
+
+    return any(compute_etag(path, part_size) == etag
+               for part_size in candidate_part_sizes(os.path.getsize(path), etag))
+
+
+def readinto_response(response, buffer, object_name: Optional[str] = None) -> memoryview:
+    """
+    Reads the whole body of an object response into a writable buffer, returning a view over the bytes read.
+
+    Unencoded bodies are received straight from the socket into the buffer through the underlying
+    http.client response, skipping the intermediate bytes objects urllib3 allocates on each read. Responses
+    not wrapping an http.client response, like the ones of storage backends, are read through their own
+    readinto.
+    """
+    view = memoryview(buffer)
+
+    if view.readonly:
+        raise ValueError("The buffer to read the object into must be writable.")
+
+    view = view.cast("B") if view.format != "B" or view.ndim != 1 else view
+    content_length = response.headers.get("Content-Length")
+    expected = int(content_length) if content_length is not None else None
+
+    if expected is not None and expected > view.nbytes:
+        raise ValueError(f"Buffer of {view.nbytes} bytes can not hold the {expected} bytes of {object_name}.")
+
+    raw = _raw_response(response)
+    reader = raw if raw is not None and not response.headers.get("Content-Encoding") else response
+    limit = expected if expected is not None else view.nbytes
+    position = 0
+
+    while position < limit:
+        read = reader.readinto(view[position:limit])
+        if not read:
+            break
+        position += read
+
+    if expected is not None and position != expected:
+        raise ObjectIntegrityException(f"Expected {expected} bytes but received {position}.",
+                                       object_name = object_name)
+
+    return view[:position]
+
+
+def _raw_response(response) -> Optional[http.client.HTTPResponse]:
+    # urllib3 keeps the http.client response it wraps on its private _fp attribute, on 1.x and 2.x alike. It is
+    # only used when it really is one, so any other layout falls back to the public urllib3 readinto
+    raw = getattr(response, "_fp", None)
+    return raw if isinstance(raw, http.client.HTTPResponse) else None
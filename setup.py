@@ -39,6 +39,11 @@ setup(
         "python-dotenv",
         "annotated-types"
         ],
+    extras_require={
+        "numpy": ["numpy"],
+        "arrow": ["pyarrow"],
+        "pandas": ["pandas", "pyarrow"]
+    },
     tests_require=[],
     license="Apache-2.0",
     classifiers=[
@@ -0,0 +1,170 @@
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import uuid
+
+
+class AsyncMinioExtensionsTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.workdir = tempfile.mkdtemp()
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+    def put(self, name: str, content: bytes):
+        import io
+
+        return self.client.put_object("bucket", name, io.BytesIO(content), len(content))
+
+    def test_gather_should_return_results_and_errors_in_order(self):
+        from minio import S3Error
+        from minio_extensions.aio import AsyncMinioExtensions
+
+        self.put("a.txt", b"a")
+        self.put("b.txt", b"bb")
+
+        async def _main():
+            async with AsyncMinioExtensions(self.client, max_concurrency = 2) as extensions:
+                return await extensions.gather(
+                    extensions.load_file_from_bucket(bucket_name = "bucket", object_name = "a.txt"),
+                    extensions.load_file_from_bucket(bucket_name = "bucket", object_name = "missing.txt"),
+                    extensions.load_file_from_bucket(bucket_name = "bucket", object_name = "b.txt"))
+
+        first, missing, second = asyncio.run(_main())
+
+        self.assertEqual(first.read(), b"a")
+        self.assertIsInstance(missing, S3Error)
+        self.assertEqual(second.read(), b"bb")
+
+    def test_cancelled_download_should_not_leave_partial_files(self):
+        from minio_extensions.aio import AsyncMinioExtensions
+
+        started, released = threading.Event(), threading.Event()
+        get_object = self.client.get_object
+
+        def _blocking_get_object(*args, **kwargs):
+            response = get_object(*args, **kwargs)
+            stream = response.stream
+
+            def _stream(amt = None, decode_content = None):
+                for chunk in stream(1):
+                    yield chunk
+                    started.set()
+                    released.wait(5)
+
+            response.stream = _stream
+            return response
+
+        self.client.get_object = _blocking_get_object
+        folder = uuid.uuid4().hex
+        self.put(f"{folder}/file.bin", b"0123456789")
+
+        async def _main():
+            extensions = AsyncMinioExtensions(self.client, max_concurrency = 1)
+            task = asyncio.ensure_future(extensions.fload_file_from_bucket(bucket_name = "bucket",
+                                                                           object_name = f"{folder}/file.bin"))
+
+            await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            released.set()
+            extensions._executor.shutdown(wait = True)
+
+        asyncio.run(_main())
+
+        directory = os.path.join(tempfile.gettempdir(), folder)
+        leftovers = os.listdir(directory) if os.path.isdir(directory) else []
+        shutil.rmtree(directory, ignore_errors = True)
+
+        self.assertEqual(leftovers, [])
+
+    def test_delegated_operations_should_bind_the_client_only_when_taken(self):
+        from minio_extensions.aio import AsyncMinioExtensions
+        from minio_extensions.backends import MemoryBackend
+
+        path = os.path.join(self.workdir, "file.txt")
+        with open(path, "wb") as fb:
+            fb.write(b"content")
+
+        async def _main():
+            async with AsyncMinioExtensions(self.client) as extensions:
+                exists = await extensions.check_bucket_exists(bucket = "bucket")
+                provider = await extensions.create_provider("memory", shared = False)
+                stream, _, converted = await extensions.as_bytes_io(path)
+                return exists, provider, stream, converted
+
+        exists, provider, stream, converted = asyncio.run(_main())
+
+        self.assertTrue(exists)
+        self.assertIsInstance(provider, MemoryBackend)
+        self.assertTrue(converted)
+        self.assertEqual(stream.read(), b"content")
+
+    def test_objects_metadata_should_cover_prefix_versions(self):
+        from minio_extensions.aio import AsyncMinioExtensions
+        from minio_extensions.extensions import MinioExtensions
+
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+        versions = {self.put("d/a.txt", b"a").version_id, self.put("d/a.txt", b"aa").version_id}
+        errors = {}
+
+        async def _main():
+            async with AsyncMinioExtensions(self.client) as extensions:
+                with self.assertRaises(ValueError):
+                    await extensions.get_objects_metadata(bucket = "other", files = ["d/a.txt"])
+
+                return await extensions.get_objects_metadata(bucket = "bucket", files = [("d/a.txt", "missing")],
+                                                             prefix = "d/", include_versions = True,
+                                                             errors = errors)
+
+        infos = asyncio.run(_main())
+
+        self.assertEqual({i.id for i in infos}, versions)
+        self.assertEqual({i.object_name for i in infos}, {"d/a.txt"})
+        self.assertEqual(list(errors), [("d/a.txt", "missing")])
+
+    def test_closing_should_cancel_queued_calls(self):
+        from minio_extensions.aio import AsyncMinioExtensions
+
+        release = threading.Event()
+        ran = []
+
+        async def _main():
+            extensions = AsyncMinioExtensions(self.client, max_concurrency = 1)
+            running = asyncio.ensure_future(extensions._run(release.wait))
+            queued = asyncio.ensure_future(extensions._run(ran.append, 1))
+            await asyncio.sleep(0.05)
+
+            await extensions.close()
+            release.set()
+            await running
+
+            with self.assertRaises(asyncio.CancelledError):
+                await queued
+
+        asyncio.run(_main())
+
+        self.assertEqual(ran, [])
+
+    def test_private_attributes_should_not_be_delegated(self):
+        from minio_extensions.aio import AsyncMinioExtensions
+
+        extensions = AsyncMinioExtensions(self.client, max_concurrency = 1)
+
+        with self.assertRaises(AttributeError):
+            extensions._version_index_name
+
+
+if __name__ == "__main__":
+    unittest.main()
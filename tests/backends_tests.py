@@ -0,0 +1,125 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from minio import S3Error
+
+
+class _BackendTests:
+    """Behaviour shared by every storage backend, run through the MinioExtensions API."""
+
+    def create_backend(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.client = self.create_backend()
+        self.client.make_bucket("bucket")
+
+        self.local_path = os.path.join(self.workdir, "upload.bin")
+        with open(self.local_path, "wb") as fb:
+            fb.write(b"0123456789")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+    def test_versions_should_resolve_through_version_index(self):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.metadata.metadata import ObjectMetadata, VersionMetadata
+
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+
+        for minor in range(3):
+            with open(self.local_path, "wb") as fb:
+                fb.write(f"minor-{minor}".encode())
+            MinioExtensions.upload_object(self.client, bucket = "bucket", object_name = "data/file.bin",
+                                          local_path = self.local_path, content_type = "application/octet-stream",
+                                          metadata = ObjectMetadata(version = VersionMetadata(major = 1,
+                                                                                              minor = minor)))
+
+        stat, path = MinioExtensions.get_object(self.client, bucket = "bucket", file_name = "data/file.bin",
+                                                tag_version = VersionMetadata(major = 1, minor = 1))
+
+        with open(path, "rb") as fb:
+            self.assertEqual(fb.read(), b"minor-1")
+
+        self.client.remove_object("bucket", "data/file.bin")
+        versions = list(self.client.list_objects("bucket", prefix = "data/", recursive = True,
+                                                 include_version = True))
+
+        self.assertEqual(len(versions), 4)
+        self.assertTrue(versions[0].is_delete_marker)
+        self.assertEqual(list(self.client.list_objects("bucket", prefix = "data/", recursive = True)), [])
+
+        with self.assertRaises(S3Error) as error:
+            self.client.stat_object("bucket", "data/file.bin")
+        self.assertEqual(error.exception.code, "NoSuchKey")
+
+    def test_ranged_reads_and_metadata(self):
+        from minio.commonconfig import Tags
+        from minio_extensions.extensions import MinioExtensions
+
+        tags = Tags.new_object_tags()
+        tags["team"] = "data"
+        self.client.fput_object("bucket", "a/b.bin", self.local_path, metadata = {"owner": "me"}, tags = tags)
+
+        self.assertEqual(bytes(MinioExtensions.load_object_view(self.client, bucket_name = "bucket",
+                                                                object_name = "a/b.bin", offset = 2, length = 3)),
+                         b"234")
+
+        metadata = MinioExtensions.get_object_metadata(self.client, bucket = "bucket", object_name = "a/b.bin")
+
+        self.assertEqual(metadata["x-amz-meta-owner"], "me")
+        self.assertEqual(dict(metadata["tags"]), {"team": "data"})
+        self.assertEqual([o.object_name for o in self.client.list_objects("bucket")], ["a/"])
+
+        with MinioExtensions.open_object_file(self.client, bucket_name = "bucket", object_name = "a/b.bin",
+                                              block_size = 4) as f:
+            f.seek(-3, os.SEEK_END)
+            self.assertEqual(f.read(), b"789")
+
+
+class MemoryBackendTests(_BackendTests, unittest.TestCase):
+
+    def create_backend(self):
+        from minio_extensions.providers import ClientBuilder
+
+        return ClientBuilder("memory").configure()
+
+
+class LocalDirectoryBackendTests(_BackendTests, unittest.TestCase):
+
+    def create_backend(self):
+        from minio_extensions.backends import LocalDirectoryBackend
+
+        self.root = os.path.join(self.workdir, "root")
+        return LocalDirectoryBackend(self.root)
+
+    def test_latest_versions_should_be_regular_files(self):
+        from minio_extensions.backends import LocalDirectoryBackend
+
+        self.client.fput_object("bucket", "a/b.bin", self.local_path)
+
+        with open(os.path.join(self.root, "bucket", "a", "b.bin"), "rb") as fb:
+            self.assertEqual(fb.read(), b"0123456789")
+
+        with self.assertRaises(S3Error) as error:
+            self.client.fput_object("bucket", "a/b.bin/c.bin", self.local_path)
+        self.assertEqual(error.exception.code, "XMinioParentIsObject")
+
+        # Files copied into bucket directories are served once the backend is reopened
+        shutil.copyfile(self.local_path, os.path.join(self.root, "bucket", "seeded.bin"))
+        reopened = LocalDirectoryBackend(self.root)
+
+        self.assertEqual(sorted(o.object_name for o in reopened.list_objects("bucket", recursive = True)),
+                         ["a/b.bin", "seeded.bin"])
+        self.assertEqual(reopened.stat_object("bucket", "seeded.bin").etag,
+                         reopened.stat_object("bucket", "a/b.bin").etag)
+
+        reopened.remove_object("bucket", "a/b.bin")
+        self.assertFalse(os.path.exists(os.path.join(self.root, "bucket", "a")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import io
+import threading
+import time
+import unittest
+
+
+class ByteBudgetTests(unittest.TestCase):
+
+    def test_reservations_over_the_limit_should_wait_for_releases(self):
+        from minio_extensions._concurrency import ByteBudget
+
+        budget = ByteBudget(10)
+        budget.acquire(6)
+        acquired = threading.Event()
+
+        def _acquire():
+            budget.acquire(6)
+            acquired.set()
+
+        thread = threading.Thread(target = _acquire)
+        thread.start()
+
+        self.assertFalse(acquired.wait(0.05))
+
+        budget.release(6)
+        thread.join(1)
+
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(budget.in_flight, 6)
+
+    def test_oversized_reservations_should_be_granted_alone(self):
+        from minio_extensions._concurrency import ByteBudget
+
+        budget = ByteBudget(10)
+
+        with budget.reserve(50):
+            self.assertEqual(budget.in_flight, 50)
+
+        self.assertEqual(budget.in_flight, 0)
+
+
+class IterCompletedTests(unittest.TestCase):
+
+    def test_failures_should_not_stop_the_remaining_items(self):
+        from minio_extensions._concurrency import iter_completed
+
+        def _square(item):
+            if item == 3:
+                raise ValueError(item)
+            return item * item
+
+        outcome = {item: (result, type(error)) for item, result, error in iter_completed(_square, range(6), 2)}
+
+        self.assertEqual(outcome, {0: (0, type(None)), 1: (1, type(None)), 2: (4, type(None)),
+                                   3: (None, ValueError), 4: (16, type(None)), 5: (25, type(None))})
+
+    def test_items_should_be_consumed_lazily(self):
+        from minio_extensions._concurrency import iter_completed
+
+        consumed = []
+
+        def _items():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        completed = iter_completed(lambda item: item, _items(), 2)
+        next(completed)
+        completed.close()
+
+        # Only a window of twice the workers is submitted ahead of the results consumed
+        self.assertLessEqual(len(consumed), 6)
+
+
+class GetObjectsTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+        for name, content in (("a.txt", b"aaaa"), ("b.txt", b"bb")):
+            self.client.put_object("bucket", name, io.BytesIO(content), len(content))
+
+    def test_failures_should_be_raised_once_the_batch_finishes(self):
+        from minio_extensions.exceptions import BatchOperationException
+        from minio_extensions.extensions import MinioExtensions
+
+        with self.assertRaises(BatchOperationException) as raised:
+            MinioExtensions.get_objects(self.client, bucket = "bucket", files = ["a.txt", "missing.txt", "b.txt"],
+                                        max_workers = 2)
+
+        self.assertEqual(sorted(raised.exception.results), ["a.txt", "b.txt"])
+        self.assertEqual(list(raised.exception.errors), ["missing.txt"])
+
+    def test_failures_should_be_collected_when_errors_is_given(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        errors = {}
+        objects = MinioExtensions.get_objects(self.client, bucket = "bucket", files = ["a.txt", "missing.txt"],
+                                              max_workers = 2, errors = errors)
+
+        self.assertEqual(objects["a.txt"].read(), b"aaaa")
+        self.assertEqual(list(errors), ["missing.txt"])
+
+    def test_budget_should_be_reserved_before_requesting_unsized_objects(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        requested = []
+        budget = threading.Lock()
+        get_object = self.client.get_object
+
+        def _get_object(*args, **kwargs):
+            # A single object fits the budget at a time, so bodies are never requested concurrently
+            self.assertTrue(budget.acquire(blocking = False))
+            try:
+                requested.append(kwargs.get("version_id"))
+                time.sleep(0.01)
+                return get_object(*args, **kwargs)
+            finally:
+                budget.release()
+
+        self.client.get_object = _get_object
+        objects = MinioExtensions.get_objects(self.client, bucket = "bucket", files = ["a.txt", "b.txt"],
+                                              max_workers = 2, max_bytes_in_flight = 4)
+
+        self.assertEqual({name: f.read() for name, f in objects.items()}, {"a.txt": b"aaaa", "b.txt": b"bb"})
+        self.assertEqual(len(requested), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+
+class ObjectDiskCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.cache import ObjectDiskCache
+
+        self.workdir = tempfile.mkdtemp()
+        self.cache = ObjectDiskCache(directory = os.path.join(self.workdir, "cache"), max_bytes = 10)
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+    def put(self, name: str, content: bytes):
+        return self.client.put_object("bucket", name, io.BytesIO(content), len(content))
+
+    def fload(self, name: str, version_id = None):
+        from minio_extensions.extensions import MinioExtensions
+
+        _, path = MinioExtensions.fload_file_from_bucket(self.client, bucket_name = "bucket", object_name = name,
+                                                         version_id = version_id, disk_cache = self.cache)
+        with open(path, "rb") as fb:
+            return fb.read()
+
+    def store(self, name: str, content: bytes):
+        path = os.path.join(self.workdir, name)
+        with open(path, "wb") as fb:
+            fb.write(content)
+
+        return self.cache.store(path, "bucket", name)
+
+    def test_pinned_versions_should_be_served_without_requests(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+        version_id = self.put("a.txt", b"v1").version_id
+        self.put("a.txt", b"v2")
+
+        self.assertEqual(self.fload("a.txt", version_id), b"v1")
+
+        with mock.patch.object(self.client, "get_object", side_effect = AssertionError("Unexpected request.")), \
+                mock.patch.object(self.client, "stat_object", side_effect = AssertionError("Unexpected request.")):
+            self.assertEqual(self.fload("a.txt", version_id), b"v1")
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_latest_versions_should_be_revalidated(self):
+        self.put("a.txt", b"v1")
+        get_object = mock.Mock(wraps = self.client.get_object)
+        self.client.get_object = get_object
+
+        self.assertEqual(self.fload("a.txt"), b"v1")
+        self.assertEqual(self.fload("a.txt"), b"v1")
+
+        self.assertIn("If-None-Match", get_object.call_args.kwargs["request_headers"])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        self.put("a.txt", b"v2")
+
+        self.assertEqual(self.fload("a.txt"), b"v2")
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+    def test_least_recently_used_objects_should_be_evicted_over_budget(self):
+        first, second = self.store("a.txt", b"aaaa"), self.store("b.txt", b"bbbb")
+        os.utime(first.path, (2, 2))
+        os.utime(second.path, (1, 1))
+
+        self.store("c.txt", b"cccc")
+
+        self.assertIsNotNone(self.cache.lookup("bucket", "a.txt"))
+        self.assertIsNone(self.cache.lookup("bucket", "b.txt"))
+        self.assertIsNotNone(self.cache.lookup("bucket", "c.txt"))
+        self.assertEqual((self.cache.size, self.cache.evictions), (8, 1))
+
+    def test_stores_under_budget_should_not_scan_the_directory(self):
+        self.store("a.txt", b"aaaa")
+
+        with mock.patch.object(self.cache, "_entries", side_effect = AssertionError("Unexpected scan.")):
+            self.store("b.txt", b"bbbb")
+            self.store("b.txt", b"bbb")
+            self.cache.invalidate("bucket", "a.txt")
+
+            self.assertEqual(self.cache.size, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+
+class _BucketClient:
+
+    def bucket_exists(self, bucket_name):
+        if bucket_name != "bucket":
+            raise RuntimeError("Unknown bucket.")
+        return True
+
+
+class InstrumentationTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions import instrumentation
+        from minio_extensions.instrumentation import PrometheusExporter
+
+        self.exporter = instrumentation.register(PrometheusExporter())
+
+    def tearDown(self):
+        from minio_extensions import instrumentation
+
+        instrumentation.unregister(self.exporter)
+
+    def test_operations_should_be_counted_with_errors(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        MinioExtensions.check_bucket_exists(client = _BucketClient(), bucket = "bucket")
+        with self.assertRaises(RuntimeError):
+            MinioExtensions.check_bucket_exists(client = _BucketClient(), bucket = "other")
+
+        stats = self.exporter.snapshot()["operations"]["MinioExtensions.check_bucket_exists"]
+
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(stats["latency"]["count"], 2)
+
+    def test_metrics_should_render_on_prometheus_text_format(self):
+        from minio_extensions.cache import MetadataCache
+
+        cache = MetadataCache(max_entries = 1)
+        cache.lookup("bucket", "file")
+
+        text = self.exporter.render()
+
+        self.assertIn('minio_extensions_cache_misses_total{cache="metadata"} 1', text)
+        self.assertIn("# TYPE minio_extensions_http_time_to_first_byte_seconds histogram", text)
+
+    def test_unregistered_hooks_should_not_receive_measurements(self):
+        from minio_extensions import instrumentation
+        from minio_extensions.extensions import MinioExtensions
+
+        instrumentation.unregister(self.exporter)
+        MinioExtensions.check_bucket_exists(client = _BucketClient(), bucket = "bucket")
+
+        self.assertEqual(self.exporter.snapshot()["operations"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
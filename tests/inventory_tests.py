@@ -0,0 +1,129 @@
+import datetime
+import io
+import unittest
+
+from minio.datatypes import Object
+
+
+class _ListingClient:
+    """Minimal client double listing an in-memory set of objects."""
+
+    def __init__(self, objects):
+        self.objects = dict(objects)
+        self.listed_prefixes = []
+
+    def list_objects(self, bucket_name, prefix = None, recursive = False, include_version = False,
+                     include_user_meta = False):
+        self.listed_prefixes.append(prefix)
+        prefix = prefix or ""
+        folders = set()
+
+        for name in sorted(self.objects):
+            if not name.startswith(prefix):
+                continue
+
+            rest = name[len(prefix):]
+
+            if not recursive and "/" in rest:
+                folder = prefix + rest.split("/")[0] + "/"
+                if folder not in folders:
+                    folders.add(folder)
+                    yield Object(bucket_name, folder)
+                continue
+
+            size, day = self.objects[name]
+            yield Object(bucket_name, name, size = size, etag = f"{name}-{size}",
+                         last_modified = datetime.datetime(2024, 1, day, tzinfo = datetime.timezone.utc))
+
+
+class BucketInventoryTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.inventory import BucketInventory
+
+        self.client = _ListingClient({
+            "readme.md": (10, 1),
+            "data/a.csv": (100, 2),
+            "data/b.csv": (200, 3),
+            "data/raw/c.json": (300, 4),
+            "logs/2024/01.log": (5, 5)
+        })
+        self.inventory = BucketInventory(":memory:")
+        self.inventory.refresh(self.client, "bucket")
+
+    def tearDown(self):
+        self.inventory.close()
+
+    def test_queries_should_filter_by_prefix_glob_size_and_date(self):
+        names = lambda objects: [o.object_name for o in objects]
+
+        self.assertEqual(names(self.inventory.query("bucket", prefix = "data/")),
+                         ["data/a.csv", "data/b.csv", "data/raw/c.json"])
+        self.assertEqual(names(self.inventory.query("bucket", glob = "data/*.csv")), ["data/a.csv", "data/b.csv"])
+        self.assertEqual(names(self.inventory.query("bucket", min_size = 150, max_size = 300)),
+                         ["data/b.csv", "data/raw/c.json"])
+        self.assertEqual(names(self.inventory.query(
+            "bucket", modified_after = datetime.datetime(2024, 1, 3, tzinfo = datetime.timezone.utc))),
+            ["data/raw/c.json", "logs/2024/01.log"])
+        self.assertEqual(names(self.inventory.list_objects("bucket", prefix = "data/")),
+                         ["data/a.csv", "data/b.csv", "data/raw/"])
+        self.assertTrue(self.inventory.is_folder("bucket", "logs"))
+        self.assertEqual(self.inventory.count("bucket", prefix = "data/"), (3, 600))
+
+    def test_prefix_refresh_should_only_rewrite_changed_rows(self):
+        self.client.objects["data/a.csv"] = (150, 6)
+        self.client.objects["data/d.csv"] = (1, 6)
+        del self.client.objects["data/b.csv"]
+        del self.client.objects["logs/2024/01.log"]
+        self.client.listed_prefixes.clear()
+
+        report = self.inventory.refresh(self.client, "bucket", prefixes = ["data/"])
+
+        self.assertEqual(self.client.listed_prefixes, ["data/"])
+        self.assertEqual((report.added, report.updated, report.removed, report.unchanged), (1, 1, 1, 1))
+        self.assertTrue(self.inventory.exists("bucket", "logs/2024/01.log"))
+
+        report = self.inventory.refresh(self.client, "bucket")
+
+        self.assertEqual(report.removed, 1)
+        self.assertFalse(self.inventory.exists("bucket", "logs/2024/01.log"))
+        self.assertEqual(self.inventory.watermark("bucket"),
+                         datetime.datetime(2024, 1, 6, tzinfo = datetime.timezone.utc))
+
+    def test_tag_queries_should_only_match_current_tags(self):
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.extensions import MinioExtensions
+        from minio.commonconfig import Tags
+
+        client = MemoryBackend()
+        client.make_bucket("bucket")
+
+        for name in ("img/a.png", "img/b.png", "doc/c.txt"):
+            client.put_object("bucket", name, io.BytesIO(b"0"), 1)
+
+        self.inventory.refresh(client, "bucket")
+        report = MinioExtensions.tag_objects(client, bucket = "bucket", prefix = "img/", tags = {"kind": "preview"},
+                                             inventory = self.inventory)
+
+        self.assertEqual(len(report.tagged), 2)
+        self.assertEqual([o.object_name for o in self.inventory.query("bucket", tags = {"kind": "preview"})],
+                         ["img/a.png", "img/b.png"])
+
+        # Tags written elsewhere are indexed on refresh, and forgotten once their object is overwritten
+        tags = Tags.new_object_tags()
+        tags["team"] = "web"
+        client.set_object_tags("bucket", "doc/c.txt", tags)
+
+        self.assertEqual(self.inventory.refresh_tags(client, "bucket").fetched, 1)
+        self.assertEqual(self.inventory.count("bucket", tags = {"team": None}), (1, 1))
+
+        client.put_object("bucket", "img/b.png", io.BytesIO(b"01"), 2)
+        self.inventory.refresh(client, "bucket", prefixes = ["img/"])
+
+        self.assertIsNone(self.inventory.get_tags("bucket", "img/b.png"))
+        self.assertEqual([o.object_name for o in self.inventory.query("bucket", prefix = "img/",
+                                                                      tags = {"kind": "preview"})], ["img/a.png"])
+
+
+if __name__ == '__main__':
+    unittest.main()
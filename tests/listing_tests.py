@@ -0,0 +1,45 @@
+import io
+import unittest
+
+
+class ParallelListingTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+        names = ["top.bin", "a.bin", "a/", "a/b.bin", "a/b/c.bin", "a/b/d/e.bin"]
+        names += [f"hot/{i % 7}/{i}.bin" for i in range(200)] + [f"flat/{i}.bin" for i in range(50)]
+
+        for name in names:
+            self.client.put_object("bucket", name, io.BytesIO(b"0"), 1)
+
+    def test_parallel_listing_should_match_sequential_listing(self):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.listing import iter_objects_parallel
+
+        for prefix in (None, "a", "hot/"):
+            expected = [o.object_name for o in self.client.list_objects("bucket", prefix = prefix, recursive = True)]
+
+            for threshold in (1, 10, 1000):
+                listed = [o.object_name for o in iter_objects_parallel(self.client, "bucket", prefix = prefix,
+                                                                       max_workers = 4, split_threshold = threshold)]
+                self.assertEqual(listed, expected)
+
+            unordered = MinioExtensions.list_files_from_bucket(self.client, bucket = "bucket", prefix = prefix,
+                                                               recurse = True, parallel = True, ordered = False)
+            self.assertCountEqual([o.object_name for o in unordered], expected)
+
+    def test_closing_the_listing_should_stop_it(self):
+        from minio_extensions.listing import iter_objects_parallel
+
+        listing = iter_objects_parallel(self.client, "bucket", max_workers = 2, split_threshold = 1)
+
+        self.assertEqual(next(listing).object_name, "a.bin")
+        listing.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+
+
+class _StatResult:
+
+    def __init__(self, etag, metadata):
+        self.etag = etag
+        self.metadata = metadata
+
+
+class _CountingClient:
+    """Minimal client double counting the metadata requests issued."""
+
+    def __init__(self):
+        self.etag = "etag-1"
+        self.stat_calls = 0
+        self.tags_calls = 0
+
+    def stat_object(self, bucket_name, object_name, version_id = None):
+        self.stat_calls += 1
+        metadata = {"Content-Length": "6", "ETag": self.etag}
+
+        if object_name != "untagged":
+            metadata["x-amz-tagging-count"] = "1"
+
+        return _StatResult(self.etag, metadata)
+
+    def get_object_tags(self, bucket_name, object_name, version_id = None):
+        self.tags_calls += 1
+        return {"kind": "test"}
+
+
+class MetadataCacheTests(unittest.TestCase):
+
+    def test_pinned_version_metadata_should_be_served_from_cache(self):
+        from minio_extensions.cache import MetadataCache
+        from minio_extensions.extensions import MinioExtensions
+
+        client = _CountingClient()
+        cache = MetadataCache(max_entries = 8, ttl = 0)
+
+        for _ in range(3):
+            meta = MinioExtensions.get_object_metadata(client = client, bucket = "bucket", object_name = "file",
+                                                       version_id = "v1", cache = cache)
+
+        self.assertEqual(meta["tags"], {"kind": "test"})
+        self.assertEqual(client.stat_calls, 1)
+        self.assertEqual(client.tags_calls, 1)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+
+    def test_latest_version_metadata_should_be_revalidated_by_etag(self):
+        from minio_extensions.cache import MetadataCache
+        from minio_extensions.extensions import MinioExtensions
+
+        client = _CountingClient()
+        cache = MetadataCache(max_entries = 8, ttl = 0)
+
+        MinioExtensions.get_object_metadata(client = client, bucket = "bucket", object_name = "untagged",
+                                            cache = cache)
+        MinioExtensions.get_object_metadata(client = client, bucket = "bucket", object_name = "untagged",
+                                            cache = cache)
+
+        self.assertEqual(client.stat_calls, 2)
+        self.assertEqual(client.tags_calls, 0)
+        self.assertEqual(cache.revalidations, 1)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+        client.etag = "etag-2"
+        meta = MinioExtensions.get_object_metadata(client = client, bucket = "bucket", object_name = "untagged",
+                                                   cache = cache)
+
+        self.assertEqual(meta["ETag"], "etag-2")
+        self.assertEqual(cache.revalidations, 1)
+
+    def test_stale_tags_should_be_fetched_again(self):
+        import io
+        import time
+        from minio.commonconfig import Tags
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.cache import MetadataCache
+        from minio_extensions.extensions import MinioExtensions
+
+        client = MemoryBackend()
+        client.make_bucket("bucket")
+        client.put_object("bucket", "file", io.BytesIO(b"0"), 1)
+        cache = MetadataCache(max_entries = 8, ttl = 0.01)
+
+        self.assertEqual(MinioExtensions.get_object_metadata(client, bucket = "bucket", object_name = "file",
+                                                             cache = cache)["tags"], {})
+
+        for expected in ({"k": "v"}, {"k": "w"}, {}):
+            tags = Tags.new_object_tags()
+            for name, value in expected.items():
+                tags[name] = value
+            client.set_object_tags("bucket", "file", tags)
+            time.sleep(0.02)
+
+            self.assertEqual(dict(MinioExtensions.get_object_metadata(client, bucket = "bucket", object_name = "file",
+                                                                      cache = cache)["tags"]), expected)
+
+    def test_batch_metadata_should_skip_tags_of_untagged_objects(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        client = _CountingClient()
+        infos = list(MinioExtensions.get_objects_metadata(client = client, bucket = "bucket",
+                                                          files = ["a", ("b", "v1"), "untagged"], max_workers = 4))
+
+        self.assertEqual(sorted(i.object_name for i in infos), ["a", "b", "untagged"])
+        self.assertEqual(client.stat_calls, 3)
+        self.assertEqual(client.tags_calls, 2)
+        self.assertEqual({i.object_name: i.content_length for i in infos}, {"a": 6, "b": 6, "untagged": 6})
+        self.assertIsNone(next(i for i in infos if i.object_name == "untagged").tags)
+
+    def test_batch_metadata_failures_should_be_keyed_by_version(self):
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.extensions import MinioExtensions
+
+        client = MemoryBackend()
+        client.make_bucket("bucket")
+        errors = {}
+
+        infos = list(MinioExtensions.get_objects_metadata(client = client, bucket = "bucket",
+                                                          files = ["missing", ("missing", "v1")], errors = errors))
+
+        self.assertEqual(infos, [])
+        self.assertEqual(set(errors), {("missing", None), ("missing", "v1")})
+
+    def test_least_recently_used_entries_should_be_evicted(self):
+        from minio_extensions.cache import MetadataCache
+
+        cache = MetadataCache(max_entries = 2, ttl = 60)
+        cache.store("bucket", "a", None, {"tags": {}})
+        cache.store("bucket", "b", None, {"tags": {}})
+        cache.lookup("bucket", "a")
+        cache.store("bucket", "c", None, {"tags": {}})
+
+        self.assertIsNotNone(cache.lookup("bucket", "a"))
+        self.assertIsNone(cache.lookup("bucket", "b"))
+        self.assertEqual(cache.evictions, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import glob
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class MmapFileTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.workdir = tempfile.mkdtemp()
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+    def put(self, name: str, content: bytes):
+        self.client.put_object("bucket", name, io.BytesIO(content), len(content))
+
+    def mmap(self, name: str, **kwargs):
+        from minio_extensions.extensions import MinioExtensions
+
+        return MinioExtensions.mmap_file_from_bucket(self.client, bucket_name = "bucket", object_name = name, **kwargs)
+
+    def test_mapped_file_should_be_removed_on_exit(self):
+        self.put("d/f.bin", b"content")
+        downloads = set(glob.glob(os.path.join(tempfile.gettempdir(), "*.minio")))
+
+        with self.mmap("d/f.bin") as (info, mapped):
+            self.assertEqual(mapped[:], b"content")
+            self.assertEqual(info.size, 7)
+            self.assertEqual(len(set(glob.glob(os.path.join(tempfile.gettempdir(), "*.minio"))) - downloads), 1)
+
+        self.assertTrue(mapped.closed)
+        self.assertEqual(set(glob.glob(os.path.join(tempfile.gettempdir(), "*.minio"))), downloads)
+
+    def test_empty_objects_should_yield_an_empty_view(self):
+        self.put("empty.bin", b"")
+
+        with self.mmap("empty.bin") as (info, mapped):
+            self.assertEqual(bytes(mapped), b"")
+            self.assertEqual(info.size, 0)
+
+    def test_concurrent_contexts_should_not_share_files(self):
+        self.put("d/f.bin", b"content")
+
+        with self.mmap("d/f.bin") as (_, outer):
+            with self.mmap("d/f.bin") as (_, inner):
+                self.assertEqual(inner[:], b"content")
+
+            self.assertEqual(outer[:], b"content")
+
+    def test_object_names_should_not_select_the_removed_file(self):
+        # Absolute keys used to be downloaded to, then removed from, the path they name
+        victim = os.path.join(self.workdir, "victim.bin")
+        with open(victim, "wb") as fb:
+            fb.write(b"keep")
+
+        self.put(victim, b"content")
+
+        with self.mmap(victim) as (_, mapped):
+            self.assertEqual(mapped[:], b"content")
+
+        with open(victim, "rb") as fb:
+            self.assertEqual(fb.read(), b"keep")
+
+    def test_cached_files_should_be_kept_on_exit(self):
+        from minio_extensions.cache import ObjectDiskCache
+
+        self.put("d/f.bin", b"content")
+        cache = ObjectDiskCache(directory = os.path.join(self.workdir, "cache"))
+
+        with self.mmap("d/f.bin", disk_cache = cache) as (_, mapped):
+            self.assertEqual(mapped[:], b"content")
+
+        entry = cache.lookup("bucket", "d/f.bin", None)
+        self.assertIsNotNone(entry)
+        self.assertTrue(os.path.isfile(entry.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import unittest
+
+
+class _Stat:
+
+    def __init__(self, size):
+        self.size = size
+        self.etag = "etag-1"
+        self.version_id = "v1"
+
+
+class _Response:
+
+    def __init__(self, data):
+        self._data = data
+
+    def read(self):
+        return self._data
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class _RangeClient:
+    """Minimal client double serving ranged reads of an in-memory object."""
+
+    def __init__(self, data):
+        self.data = data
+        self.ranges = []
+
+    def stat_object(self, bucket_name, object_name, version_id = None):
+        return _Stat(len(self.data))
+
+    def get_object(self, bucket_name, object_name, offset = 0, length = 0, request_headers = None,
+                   version_id = None):
+        self.ranges.append((offset, length))
+        return _Response(self.data[offset:offset + length])
+
+
+class ObjectFileTests(unittest.TestCase):
+    BLOCK_SIZE = 1024
+
+    def setUp(self):
+        from minio_extensions.objectfile import ObjectFile
+
+        self.data = os.urandom(64 * self.BLOCK_SIZE + 100)
+        self.client = _RangeClient(self.data)
+        self.file = ObjectFile(self.client, "bucket", "file.parquet", block_size = self.BLOCK_SIZE,
+                               cache_blocks = 8, max_read_ahead = 4)
+
+    def tearDown(self):
+        self.file.close()
+
+    def test_random_reads_should_only_fetch_touched_blocks(self):
+        self.file.seek(-8, os.SEEK_END)
+        footer = self.file.read(8)
+        self.file.seek(-8, os.SEEK_END)
+        self.file.read(8)
+        self.file.seek(10 * self.BLOCK_SIZE + 10)
+        chunk = self.file.read(20)
+
+        self.assertEqual(footer, self.data[-8:])
+        self.assertEqual(chunk, self.data[10 * self.BLOCK_SIZE + 10:10 * self.BLOCK_SIZE + 30])
+        self.assertEqual(self.client.ranges, [(64 * self.BLOCK_SIZE, 100), (10 * self.BLOCK_SIZE, self.BLOCK_SIZE)])
+
+    def test_sequential_reads_should_grow_read_ahead(self):
+        contents = b"".join(iter(lambda: self.file.read(self.BLOCK_SIZE), b""))
+
+        self.assertEqual(contents, self.data)
+        self.assertLess(len(self.client.ranges), 65 // 2)
+        self.assertEqual(self.file.bytes_fetched, len(self.data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import os
+import unittest
+from unittest import mock
+
+_ENVIRONMENT = {
+    "MINIO_S3_ENDPOINT_URL": "http://127.0.0.1:9000",
+    "MINIO_S3_USERNAME": "user",
+    "MINIO_S3_PASSWORD": "password",
+    "MINIO_S3_IGNORE_SECURE_CONNECTION": "true"
+}
+
+
+class ClientBuilderTests(unittest.TestCase):
+
+    def build(self, environment = None, **options):
+        from minio_extensions.providers import ClientBuilder
+
+        variables = dict(_ENVIRONMENT, **(environment or {}))
+
+        with mock.patch.dict(os.environ, variables):
+            for name in ("MINIO_S3_HTTP_POOL_MAXSIZE", "MINIO_HTTP_REQUEST_TIMEOUT", "MINIO_S3_TRANSFER_MAX_WORKERS"):
+                if name not in variables:
+                    os.environ.pop(name, None)
+
+            return ClientBuilder("env", **options).configure()._http
+
+    def test_pool_options_should_reach_the_pool_manager(self):
+        http = self.build(pool_maxsize = 32, num_pools = 3, pool_block = True)
+
+        self.assertEqual(http.connection_pool_kw["maxsize"], 32)
+        self.assertEqual(http.connection_pool_kw["block"], True)
+        self.assertEqual(http.pools._maxsize, 3)
+
+    def test_pool_size_should_default_to_the_transfer_workers(self):
+        self.assertEqual(self.build().connection_pool_kw["maxsize"], 16)
+        self.assertEqual(self.build({"MINIO_S3_TRANSFER_MAX_WORKERS": "24"}).connection_pool_kw["maxsize"], 24)
+        self.assertEqual(self.build({"MINIO_S3_HTTP_POOL_MAXSIZE": "8"}).connection_pool_kw["maxsize"], 8)
+
+    def test_timeout_options_should_reach_the_pool_manager(self):
+        timeout = self.build(connect_timeout = 5, read_timeout = 60).connection_pool_kw["timeout"]
+
+        self.assertEqual((timeout.connect_timeout, timeout.read_timeout), (5, 60))
+
+    def test_direct_connections_should_keep_minio_default_timeout(self):
+        timeout = self.build().connection_pool_kw["timeout"]
+        self.assertEqual((timeout.connect_timeout, timeout.read_timeout), (300, 300))
+
+        timeout = self.build({"MINIO_HTTP_REQUEST_TIMEOUT": "45"}).connection_pool_kw["timeout"]
+        self.assertEqual((timeout.connect_timeout, timeout.read_timeout), (45, 45))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import json
+import unittest
+
+from minio.datatypes import Object
+
+
+class _SelectReader:
+
+    def __init__(self, data):
+        self.data = data
+
+    def stream(self, num_bytes):
+        # Small chunks split records across chunk boundaries
+        for i in range(0, len(self.data), 7):
+            yield self.data[i:i + 7]
+
+    def close(self):
+        pass
+
+
+class _SelectClient:
+    """Minimal client double answering S3 Select requests with fixed records."""
+
+    def list_objects(self, bucket_name, prefix = None, recursive = False):
+        return [Object(bucket_name, f"{prefix}{i}.jsonl") for i in range(4)] + [Object(bucket_name, "p/bad.jsonl")]
+
+    def select_object_content(self, bucket_name, object_name, request):
+        if "bad" in object_name:
+            raise RuntimeError("Select failed.")
+
+        if object_name.endswith(".csv"):
+            return _SelectReader(b'1,"multi\nline"\n2,plain\n')
+
+        return _SelectReader(b"".join(json.dumps({"id": i}).encode() + b"\n" for i in range(50)))
+
+
+class SelectQueryTests(unittest.TestCase):
+
+    def test_csv_records_should_keep_quoted_record_delimiters(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        records = list(MinioExtensions.select_object(_SelectClient(), bucket = "bucket", object_name = "file.csv",
+                                                     expression = "SELECT * FROM S3Object", output_format = "csv"))
+
+        self.assertEqual(records, [["1", "multi\nline"], ["2", "plain"]])
+
+    def test_prefix_fan_out_should_collect_failures(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        errors = {}
+        records = list(MinioExtensions.select_objects(_SelectClient(), bucket = "bucket", prefix = "p/",
+                                                      expression = "SELECT * FROM S3Object s", max_workers = 2,
+                                                      errors = errors))
+
+        self.assertEqual(len(records), 4 * 50)
+        self.assertEqual(sorted({name for name, _ in records}), [f"p/{i}.jsonl" for i in range(4)])
+        self.assertEqual(list(errors), ["p/bad.jsonl"])
+
+    def test_closed_fan_out_queries_should_not_query_queued_objects(self):
+        from minio_extensions.query import fan_out_select
+
+        queried = []
+        client = _SelectClient()
+        select_object_content = client.select_object_content
+
+        def _select_object_content(bucket_name, object_name, request):
+            queried.append(object_name)
+            return select_object_content(bucket_name, object_name, request)
+
+        client.select_object_content = _select_object_content
+        records = fan_out_select(client, "bucket", [f"p/{i}.jsonl" for i in range(4)], "SELECT * FROM S3Object s",
+                                 max_workers = 1, errors = {}, max_pending_records = 1)
+
+        self.assertEqual(next(records), ("p/0.jsonl", {"id": 0}))
+        records.close()
+
+        self.assertEqual(queried, ["p/0.jsonl"])
+
+    def test_invalid_fan_out_queries_should_raise_before_iterating(self):
+        from minio_extensions.exceptions import InvalidBucketException
+        from minio_extensions.extensions import MinioExtensions
+
+        with self.assertRaises(InvalidBucketException):
+            MinioExtensions.select_objects(_SelectClient(), prefix = "p/", expression = "SELECT * FROM S3Object s")
+
+        with self.assertRaises(ValueError):
+            MinioExtensions.select_objects(_SelectClient(), bucket = "bucket", prefix = "p/")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import unittest
+from unittest import mock
+
+_ENVIRONMENT = {
+    "MINIO_S3_ENDPOINT_URL": "http://127.0.0.1:9000",
+    "MINIO_S3_USERNAME": "user",
+    "MINIO_S3_PASSWORD": "password",
+    "MINIO_S3_IGNORE_SECURE_CONNECTION": "true"
+}
+
+
+class ClientRegistryTests(unittest.TestCase):
+
+    def test_clients_should_be_shared_per_configuration(self):
+        from minio_extensions.registry import ClientRegistry
+
+        registry = ClientRegistry()
+
+        with mock.patch.dict(os.environ, _ENVIRONMENT):
+            client = registry.get("env")
+            self.assertIs(registry.get("env"), client)
+            self.assertIsNot(registry.get("env", pool_maxsize = 4), client)
+
+            with mock.patch.dict(os.environ, {"MINIO_S3_PASSWORD": "rotated"}):
+                self.assertIsNot(registry.get("env"), client)
+
+            # Declared variables are tracked by their actual names, even without the MINIO_S3_ prefix
+            with mock.patch.dict(os.environ, {"MINIO_HTTP_REQUEST_TIMEOUT": "5"}):
+                self.assertIsNot(registry.get("env"), client)
+
+            with mock.patch.dict(os.environ, {"MINIO_S3_UNRELATED": "value"}):
+                self.assertIs(registry.get("env"), client)
+
+            registry.reload()
+            self.assertIsNot(registry.get("env"), client)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "Requires fork.")
+    def test_forked_children_should_not_reuse_parent_connections(self):
+        from minio_extensions.registry import ClientRegistry
+
+        registry = ClientRegistry()
+
+        with mock.patch.dict(os.environ, _ENVIRONMENT):
+            client = registry.get("env")
+
+        parent_pools = client._http.pools
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+
+        if pid == 0:
+            with mock.patch.dict(os.environ, _ENVIRONMENT):
+                shared = registry.get("env") is client
+            os.write(write_fd, b"1" if shared and client._http.pools is not parent_pools else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+
+        self.assertEqual(os.read(read_fd, 1), b"1")
+        self.assertIs(client._http.pools, parent_pools)
+        os.close(read_fd)
+
+
+if __name__ == '__main__':
+    unittest.main()
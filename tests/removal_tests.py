@@ -0,0 +1,195 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+
+class RemoveObjectsTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.workdir = tempfile.mkdtemp()
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+    def put(self, name: str, content: bytes = b"content"):
+        return self.client.put_object("bucket", name, io.BytesIO(content), len(content))
+
+    def names(self, include_versions: bool = False):
+        return sorted((o.object_name, o.version_id) if include_versions else o.object_name
+                      for o in self.client.list_objects("bucket", recursive = True,
+                                                        include_version = include_versions))
+
+    def test_objects_should_be_removed_in_batches(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        for i in range(5):
+            self.put(f"d/{i}.txt")
+
+        batches = []
+        remove_objects = self.client.remove_objects
+
+        def _remove_objects(bucket_name, delete_object_list, **kwargs):
+            batches.append(len(delete_object_list))
+            return remove_objects(bucket_name, delete_object_list, **kwargs)
+
+        self.client.remove_objects = _remove_objects
+
+        with mock.patch("minio_extensions.extensions.MAX_DELETE_OBJECTS_PER_REQUEST", 2):
+            report = MinioExtensions.remove_objects(self.client, bucket = "bucket", prefix = "d/")
+
+        self.assertEqual(sorted(batches), [1, 2, 2])
+        self.assertEqual(len(report.deleted), 5)
+        self.assertEqual(self.names(), [])
+
+    def test_failures_should_be_reported_per_key(self):
+        from minio import S3Error
+        from minio.deleteobjects import DeleteError
+        from minio_extensions.extensions import MinioExtensions
+
+        for name in ("a.txt", "b.txt", "c.txt"):
+            self.put(name)
+
+        remove_objects = self.client.remove_objects
+
+        def _remove_objects(bucket_name, delete_object_list, **kwargs):
+            if any(d.name == "c.txt" for d in delete_object_list):
+                raise S3Error(None, "SlowDown", "Reduce your request rate.", None, None, None)
+
+            kept = [d for d in delete_object_list if d.name != "b.txt"]
+            yield from remove_objects(bucket_name, kept, **kwargs)
+            yield DeleteError("AccessDenied", "Access Denied.", "b.txt", None)
+
+        self.client.remove_objects = _remove_objects
+
+        with mock.patch("minio_extensions.extensions.MAX_DELETE_OBJECTS_PER_REQUEST", 2):
+            report = MinioExtensions.remove_objects(self.client, bucket = "bucket",
+                                                    files = ["a.txt", "b.txt", "c.txt"])
+
+        outcome = {r.object_name: (r.removed, r.error_code) for r in report.results}
+        self.assertEqual(outcome, {"a.txt": (True, None), "b.txt": (False, "AccessDenied"),
+                                   "c.txt": (False, "SlowDown")})
+        self.assertEqual(self.names(), ["b.txt", "c.txt"])
+
+    def test_versions_should_be_removed_when_included(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+        self.put("d/a.txt", b"v1")
+        self.put("d/a.txt", b"v2")
+        self.put("e/b.txt")
+
+        report = MinioExtensions.remove_objects(self.client, bucket = "bucket", prefix = "d/",
+                                                include_versions = True)
+
+        self.assertEqual(len(report.deleted), 2)
+        self.assertTrue(all(r.version_id is not None for r in report.deleted))
+        self.assertEqual([name for name, _ in self.names(include_versions = True)], ["e/b.txt"])
+
+    def test_empty_prefix_should_require_remove_all(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.put("a.txt")
+
+        with self.assertRaises(ValueError):
+            MinioExtensions.remove_objects(self.client, bucket = "bucket", prefix = "")
+
+        self.assertEqual(self.names(), ["a.txt"])
+
+        MinioExtensions.remove_objects(self.client, bucket = "bucket", prefix = "", remove_all = True)
+        self.assertEqual(self.names(), [])
+
+    def test_removed_versions_should_be_dropped_from_the_version_index(self):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.metadata.metadata import ObjectMetadata, VersionMetadata
+
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+        path = os.path.join(self.workdir, "upload.bin")
+        versions = []
+
+        for minor in range(2):
+            with open(path, "wb") as fb:
+                fb.write(b"v%d" % minor)
+
+            versions.append(MinioExtensions.upload_object(
+                self.client, bucket = "bucket", object_name = "d/f.bin", local_path = path,
+                content_type = "application/octet-stream",
+                metadata = ObjectMetadata(version = VersionMetadata(major = 1, minor = minor))).version_id)
+
+        MinioExtensions.remove_objects(self.client, bucket = "bucket", files = [("d/f.bin", versions[0])])
+        index = MinioExtensions.read_version_index(self.client, bucket = "bucket", object_name = "d/f.bin")
+        self.assertEqual(index.versions, {"1.1.0": versions[1]})
+
+        MinioExtensions.remove_objects(self.client, bucket = "bucket", files = [("d/f.bin", versions[1])])
+        self.assertIsNone(MinioExtensions.read_version_index(self.client, bucket = "bucket",
+                                                             object_name = "d/f.bin"))
+
+    def test_version_indexes_should_only_be_read_when_they_exist(self):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.metadata.metadata import ObjectMetadata, VersionMetadata
+
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+        path = os.path.join(self.workdir, "upload.bin")
+
+        with open(path, "wb") as fb:
+            fb.write(b"v0")
+
+        for i in range(5):
+            self.put(f"d/{i}.txt")
+
+        MinioExtensions.upload_object(self.client, bucket = "bucket", object_name = "d/f.bin", local_path = path,
+                                      content_type = "application/octet-stream",
+                                      metadata = ObjectMetadata(version = VersionMetadata(major = 1, minor = 0)))
+        self.client.get_object = mock.Mock(wraps = self.client.get_object)
+
+        MinioExtensions.remove_objects(self.client, bucket = "bucket", prefix = "d/", include_versions = True)
+
+        self.assertEqual([c.kwargs["object_name"] for c in self.client.get_object.call_args_list],
+                         [MinioExtensions._version_index_name("d/f.bin")])
+        self.assertIsNone(MinioExtensions.read_version_index(self.client, bucket = "bucket",
+                                                             object_name = "d/f.bin"))
+
+    def test_bucket_wide_removals_should_remove_version_indexes(self):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.metadata.metadata import ObjectMetadata, VersionMetadata
+
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+        path = os.path.join(self.workdir, "upload.bin")
+
+        with open(path, "wb") as fb:
+            fb.write(b"v0")
+
+        MinioExtensions.upload_object(self.client, bucket = "bucket", object_name = "d/f.bin", local_path = path,
+                                      content_type = "application/octet-stream",
+                                      metadata = ObjectMetadata(version = VersionMetadata(major = 1, minor = 0)))
+        MinioExtensions.remove_objects(self.client, bucket = "bucket", prefix = "", include_versions = True,
+                                       remove_all = True)
+
+        self.assertEqual(self.names(include_versions = True), [])
+        self.client.remove_bucket("bucket")
+
+
+class IsFileTests(unittest.TestCase):
+
+    def test_is_file_should_stat_instead_of_downloading(self):
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.extensions import MinioExtensions
+
+        client = MemoryBackend()
+        client.make_bucket("bucket")
+        client.put_object("bucket", "a.txt", io.BytesIO(b"a"), 1)
+        client.get_object = mock.Mock(side_effect = AssertionError("is_file must not download objects."))
+
+        self.assertTrue(MinioExtensions.is_file(client, bucket_name = "bucket", object_name = "a.txt"))
+        self.assertFalse(MinioExtensions.is_file(client, bucket_name = "bucket", object_name = "missing.txt"))
+        client.get_object.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import io
+import time
+import unittest
+from unittest import mock
+
+
+class MinioSessionTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+        self.client.put_object("bucket", "a.txt", io.BytesIO(b"a"), 1)
+        self.client.bucket_exists = mock.Mock(wraps = self.client.bucket_exists)
+
+    def test_validated_buckets_should_be_trusted_until_their_ttl_expires(self):
+        from minio_extensions.session import MinioSession
+
+        with MinioSession(self.client, bucket_ttl = 0.05) as session:
+            self.assertTrue(session.check_bucket_exists(bucket = "bucket"))
+            self.assertTrue(session.check_bucket_exists(bucket = "bucket"))
+            self.assertEqual(self.client.bucket_exists.call_count, 1)
+
+            time.sleep(0.06)
+
+            self.assertTrue(session.check_bucket_exists(bucket = "bucket"))
+            self.assertEqual(self.client.bucket_exists.call_count, 2)
+
+    def test_missing_bucket_errors_should_invalidate_the_bucket(self):
+        from minio import S3Error
+        from minio_extensions.session import MinioSession
+
+        with MinioSession(self.client, bucket_ttl = 60) as session:
+            self.assertTrue(session.check_bucket_exists(bucket = "bucket"))
+
+            self.client.remove_object("bucket", "a.txt")
+            self.client.remove_bucket("bucket")
+
+            with self.assertRaises(S3Error):
+                session.client.stat_object(bucket_name = "bucket", object_name = "a.txt")
+
+            self.assertFalse(session.client.is_bucket_validated("bucket"))
+            self.assertFalse(session.check_bucket_exists(bucket = "bucket"))
+
+    def test_missing_bucket_errors_raised_while_iterating_should_invalidate_the_bucket(self):
+        from minio import S3Error
+        from minio_extensions.session import MinioSession
+
+        def _list_objects(bucket_name, **kwargs):
+            raise S3Error(None, "NoSuchBucket", "The specified bucket does not exist.", None, None, None,
+                          bucket_name = bucket_name)
+            yield
+
+        self.client.list_objects = _list_objects
+
+        with MinioSession(self.client, bucket_ttl = 60) as session:
+            self.assertTrue(session.check_bucket_exists(bucket = "bucket"))
+
+            objects = session.client.list_objects("bucket", recursive = True)
+            self.assertTrue(session.client.is_bucket_validated("bucket"))
+
+            with self.assertRaises(S3Error):
+                list(objects)
+
+            self.assertFalse(session.client.is_bucket_validated("bucket"))
+
+    def test_client_methods_should_be_wrapped_once(self):
+        from minio_extensions.session import MinioSession
+
+        session = MinioSession(self.client)
+
+        self.assertIs(session.client.stat_object, session.client.stat_object)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import io
+import unittest
+from unittest import mock
+
+
+class StreamObjectTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+        self.client.put_object("bucket", "a.bin", io.BytesIO(b"0123456789"), 10)
+        self.responses = []
+
+        get_object = self.client.get_object
+
+        def _get_object(*args, **kwargs):
+            response = get_object(*args, **kwargs)
+            response.release_conn = mock.Mock(wraps = response.release_conn)
+            self.responses.append(response)
+            return response
+
+        self.client.get_object = _get_object
+
+    def test_objects_should_be_streamed_in_chunks(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        chunks = list(MinioExtensions.stream_object(self.client, bucket_name = "bucket", object_name = "a.bin",
+                                                    chunk_size = 4))
+
+        self.assertEqual(chunks, [b"0123", b"4567", b"89"])
+        self.responses[0].release_conn.assert_called()
+
+    def test_connection_should_be_released_when_closed_early(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        chunks = MinioExtensions.stream_object(self.client, bucket_name = "bucket", object_name = "a.bin",
+                                               chunk_size = 4)
+
+        self.assertEqual(next(chunks), b"0123")
+        self.responses[0].release_conn.assert_not_called()
+
+        chunks.close()
+
+        self.assertTrue(self.responses[0].closed)
+        self.responses[0].release_conn.assert_called()
+
+    def test_opened_objects_should_release_the_connection_on_exit(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        with MinioExtensions.open_object(self.client, bucket_name = "bucket", object_name = "a.bin",
+                                         offset = 2, length = 4) as reader:
+            self.assertEqual(reader.read(2), b"23")
+
+        self.assertTrue(self.responses[0].closed)
+        self.responses[0].release_conn.assert_called()
+
+    def test_loaded_objects_should_hold_the_whole_contents(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        file_io = MinioExtensions.load_file_from_bucket(self.client, bucket_name = "bucket", object_name = "a.bin")
+
+        self.assertEqual(file_io.read(), b"0123456789")
+
+
+if __name__ == "__main__":
+    unittest.main()
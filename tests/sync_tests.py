@@ -0,0 +1,141 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+
+class SyncTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.workdir = tempfile.mkdtemp()
+        self.local_dir = os.path.join(self.workdir, "local")
+        os.makedirs(os.path.join(self.local_dir, "sub"))
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+    def write(self, relative_path: str, content: bytes):
+        path = os.path.join(self.local_dir, relative_path)
+        with open(path, "wb") as fb:
+            fb.write(content)
+        return path
+
+    def put(self, name: str, content: bytes):
+        return self.client.put_object("bucket", name, io.BytesIO(content), len(content))
+
+    def read(self, name: str) -> bytes:
+        response = self.client.get_object("bucket", name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def names(self):
+        return sorted(o.object_name for o in self.client.list_objects("bucket", recursive = True))
+
+    def test_new_and_changed_files_should_be_uploaded(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.write("a.txt", b"a")
+        self.write(os.path.join("sub", "b.txt"), b"b")
+
+        report = MinioExtensions.sync_up(self.client, bucket = "bucket", local_dir = self.local_dir, prefix = "p")
+
+        self.assertEqual(sorted(report.transferred), ["p/a.txt", "p/sub/b.txt"])
+        self.assertEqual(self.read("p/sub/b.txt"), b"b")
+
+        path = self.write("a.txt", b"aa")
+        # Local changes newer than the remote copy are uploaded again
+        os.utime(path, (os.path.getmtime(path) + 60, os.path.getmtime(path) + 60))
+
+        report = MinioExtensions.sync_up(self.client, bucket = "bucket", local_dir = self.local_dir, prefix = "p")
+
+        self.assertEqual(report.transferred, ["p/a.txt"])
+        self.assertEqual(sorted(report.skipped), ["p/sub/b.txt"])
+        self.assertEqual(self.read("p/a.txt"), b"aa")
+
+    def test_unchanged_files_should_be_skipped_without_uploading(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.write("a.txt", b"a")
+        MinioExtensions.sync_up(self.client, bucket = "bucket", local_dir = self.local_dir, prefix = "p")
+
+        with mock.patch.object(self.client, "fput_object", side_effect = AssertionError("Unexpected upload.")):
+            report = MinioExtensions.sync_up(self.client, bucket = "bucket", local_dir = self.local_dir,
+                                             prefix = "p")
+
+        self.assertEqual((report.transferred, report.skipped), ([], ["p/a.txt"]))
+
+    def test_remote_objects_missing_locally_should_be_deleted(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.write("a.txt", b"a")
+        self.put("p/stale.txt", b"s")
+        self.put("other/kept.txt", b"k")
+
+        report = MinioExtensions.sync_up(self.client, bucket = "bucket", local_dir = self.local_dir, prefix = "p",
+                                         delete = True)
+
+        self.assertEqual(report.deleted, ["p/stale.txt"])
+        self.assertEqual(self.names(), ["other/kept.txt", "p/a.txt"])
+
+    def test_deleting_from_the_bucket_root_should_require_remove_all(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.write("a.txt", b"a")
+        self.put("other/kept.txt", b"k")
+
+        with self.assertRaises(ValueError):
+            MinioExtensions.sync_up(self.client, bucket = "bucket", local_dir = self.local_dir, delete = True)
+
+        self.assertEqual(self.names(), ["other/kept.txt"])
+
+        report = MinioExtensions.sync_up(self.client, bucket = "bucket", local_dir = self.local_dir, delete = True,
+                                         remove_all = True)
+
+        self.assertEqual(report.deleted, ["other/kept.txt"])
+        self.assertEqual(self.names(), ["a.txt"])
+
+    def test_objects_should_be_downloaded_and_skipped_once_unchanged(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.put("p/a.txt", b"a")
+        self.put("p/sub/b.txt", b"b")
+        target = os.path.join(self.workdir, "target")
+
+        report = MinioExtensions.sync_down(self.client, bucket = "bucket", local_dir = target, prefix = "p")
+
+        self.assertEqual(sorted(report.transferred), ["p/a.txt", "p/sub/b.txt"])
+        self.assertEqual(report.bytes_transferred, 2)
+
+        with open(os.path.join(target, "sub", "b.txt"), "rb") as fb:
+            self.assertEqual(fb.read(), b"b")
+
+        with mock.patch.object(self.client, "fget_object", side_effect = AssertionError("Unexpected download.")):
+            report = MinioExtensions.sync_down(self.client, bucket = "bucket", local_dir = target, prefix = "p")
+
+        self.assertEqual((report.transferred, sorted(report.skipped)), ([], ["p/a.txt", "p/sub/b.txt"]))
+
+    def test_local_files_missing_remotely_should_be_deleted(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.put("p/a.txt", b"a")
+        stale = self.write("stale.txt", b"s")
+
+        report = MinioExtensions.sync_down(self.client, bucket = "bucket", local_dir = self.local_dir, prefix = "p",
+                                           delete = True)
+
+        self.assertEqual(report.deleted, ["p/stale.txt"])
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(os.path.join(self.local_dir, "a.txt")))
+
+
+if __name__ == "__main__":
+    unittest.main()
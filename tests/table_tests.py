@@ -0,0 +1,91 @@
+import datetime
+import io
+import unittest
+
+
+def _has(module: str) -> bool:
+    try:
+        __import__(module)
+        return True
+    except ImportError:
+        return False
+
+
+class ObjectTableTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+
+        for i in range(25):
+            self.client.put_object("bucket", f"p{i % 3}/o{i}.bin", io.BytesIO(b"x" * i), i,
+                                   content_type = "text/plain" if i % 2 else "application/json")
+
+    def test_table_should_be_built_in_batches(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        table = MinioExtensions.list_objects_table(self.client, bucket = "bucket", batch_size = 4)
+
+        self.assertEqual(len(table), 25)
+        self.assertEqual(table.total_size, sum(range(25)))
+        self.assertEqual(sorted(r.object_name for r in table),
+                         sorted(f"p{i % 3}/o{i}.bin" for i in range(25)))
+        self.assertIsNotNone(table[-1].last_modified.tzinfo)
+
+    def test_stat_table_should_collect_failures(self):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.exceptions import BatchOperationException
+
+        errors = {}
+        table = MinioExtensions.stat_objects_table(self.client, bucket = "bucket",
+                                                   files = ["p0/o0.bin", "missing.bin", ("p1/o1.bin", None)],
+                                                   errors = errors)
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(list(errors), ["missing.bin"])
+        self.assertEqual({r.content_type for r in table}, {"text/plain", "application/json"})
+
+        with self.assertRaises(BatchOperationException):
+            MinioExtensions.stat_objects_table(self.client, bucket = "bucket", files = ["missing.bin"])
+
+    @unittest.skipUnless(_has("numpy"), "Requires numpy.")
+    def test_numpy_columns_should_share_table_buffers(self):
+        import numpy as np
+        from minio_extensions.extensions import MinioExtensions
+
+        table = MinioExtensions.list_objects_table(self.client, bucket = "bucket")
+        columns = table.to_numpy()
+
+        self.assertEqual(columns["size"].dtype, np.int64)
+        self.assertEqual(columns["last_modified"].dtype, np.dtype("datetime64[us]"))
+        self.assertEqual(int(columns["size"].sum()), table.total_size)
+        self.assertFalse(columns["size"].flags.owndata)
+
+    @unittest.skipUnless(_has("pyarrow"), "Requires pyarrow.")
+    def test_arrow_export(self):
+        import pyarrow as pa
+        from minio_extensions.extensions import MinioExtensions
+
+        table = MinioExtensions.stat_objects_table(self.client, bucket = "bucket",
+                                                   files = [f"p{i % 3}/o{i}.bin" for i in range(25)])
+        exported = table.to_arrow()
+
+        self.assertEqual(exported.num_rows, 25)
+        self.assertEqual(exported.schema.field("last_modified").type, pa.timestamp("us", tz = "UTC"))
+        self.assertTrue(pa.types.is_dictionary(exported.schema.field("content_type").type))
+        self.assertEqual(exported.column("version_id").null_count, 25)
+        self.assertEqual(sorted(exported.column("object_name").to_pylist()), sorted(r.object_name for r in table))
+
+    def test_http_dates_should_match_strptime(self):
+        from minio_extensions._timestamps import parse_http_date
+
+        value = "Sat, 17 Oct 2026 13:10:06 GMT"
+
+        self.assertEqual(parse_http_date(value), datetime.datetime.strptime(value, "%a, %d %b %Y %H:%M:%S %Z"))
+        self.assertEqual(parse_http_date("Sat, 17 Oct 2026 13:10:06 +0100"), datetime.datetime(2026, 10, 17, 12, 10, 6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import io
+import unittest
+
+
+class TagObjectsTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.extensions import MinioExtensions
+
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+        self.versions = [self.put("img/a.png", b"0").version_id, self.put("img/a.png", b"1").version_id]
+
+    def put(self, name: str, content: bytes):
+        return self.client.put_object("bucket", name, io.BytesIO(content), len(content))
+
+    def test_tags_without_value_should_only_be_accepted_by_removals(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        for operation in ("set", "merge"):
+            with self.assertRaises(ValueError):
+                MinioExtensions.tag_objects(self.client, bucket = "bucket", files = ["img/a.png"], tags = ["kind"],
+                                            operation = operation)
+
+        MinioExtensions.tag_objects(self.client, bucket = "bucket", files = ["img/a.png"],
+                                    tags = {"kind": "preview", "team": "web"})
+        report = MinioExtensions.tag_objects(self.client, bucket = "bucket", files = ["img/a.png"], tags = ["kind"],
+                                             operation = "remove")
+
+        self.assertEqual(report.results[0].tags, {"team": "web"})
+
+    def test_versions_should_be_reported_separately(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        first, second = self.versions
+        MinioExtensions.tag_objects(self.client, bucket = "bucket", files = [("img/a.png", first)],
+                                    tags = {"kind": "draft"})
+        report = MinioExtensions.tag_objects(self.client, bucket = "bucket", prefix = "img/",
+                                             tags = {"kind": "preview"}, duplicate_options = "append",
+                                             include_versions = True)
+
+        results = report.by_object
+        self.assertEqual(set(results), {("img/a.png", first), ("img/a.png", second)})
+        self.assertEqual(results[("img/a.png", first)].tags, {"kind": "draft-preview"})
+        self.assertEqual(results[("img/a.png", second)].tags, {"kind": "preview"})
+
+    def test_tag_refresh_errors_should_be_keyed_by_version(self):
+        from minio import S3Error
+        from minio_extensions.inventory import BucketInventory
+
+        first, second = self.versions
+        get_object_tags = self.client.get_object_tags
+
+        def _get_object_tags(bucket_name, object_name, version_id = None, **kwargs):
+            if version_id == first:
+                raise S3Error(None, "AccessDenied", "Access Denied.", None, None, None)
+            return get_object_tags(bucket_name, object_name, version_id = version_id, **kwargs)
+
+        self.client.get_object_tags = _get_object_tags
+        inventory = BucketInventory(":memory:")
+
+        try:
+            inventory.refresh(self.client, "bucket", include_versions = True)
+            report = inventory.refresh_tags(self.client, "bucket", include_versions = True)
+        finally:
+            inventory.close()
+
+        self.assertEqual(report.fetched, 1)
+        self.assertEqual(list(report.errors), [("img/a.png", first)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,230 @@
+import hashlib
+import http.client
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+
+class ObjectEtagTests(unittest.TestCase):
+    PART_SIZE = 5 * 1024 * 1024
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        self.data = os.urandom(2 * self.PART_SIZE + 123)
+        with os.fdopen(fd, "wb") as fb:
+            fb.write(self.data)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_single_part_etag_should_match_content_md5(self):
+        from minio_extensions.transfer import compute_etag, etag_matches
+
+        expected = hashlib.md5(self.data).hexdigest()
+
+        self.assertEqual(compute_etag(self.path), expected)
+        self.assertTrue(etag_matches(self.path, f'"{expected}"'))
+
+    def test_multipart_etag_should_match_part_digests(self):
+        from minio_extensions.transfer import compute_etag, etag_matches
+
+        parts = [self.data[i:i + self.PART_SIZE] for i in range(0, len(self.data), self.PART_SIZE)]
+        expected = "{0}-{1}".format(hashlib.md5(b"".join(hashlib.md5(p).digest() for p in parts)).hexdigest(),
+                                    len(parts))
+
+        self.assertEqual(compute_etag(self.path, self.PART_SIZE), expected)
+        self.assertTrue(etag_matches(self.path, expected))
+        self.assertFalse(etag_matches(self.path, "0" * 32 + "-3"))
+
+    def multipart_etag(self, part_size: int) -> str:
+        parts = [self.data[i:i + part_size] for i in range(0, len(self.data), part_size)]
+        return "{0}-{1}".format(hashlib.md5(b"".join(hashlib.md5(p).digest() for p in parts)).hexdigest(),
+                                len(parts))
+
+    def part_client(self, part_size: int):
+        from unittest import mock
+        from minio.datatypes import Object
+
+        client = mock.Mock()
+        client.stat_object.return_value = Object("bucket", "file", size = part_size)
+        return client
+
+    def test_mismatching_etags_should_fail_verification(self):
+        from minio.datatypes import Object
+        from minio_extensions.exceptions import ObjectIntegrityException
+        from minio_extensions.transfer import verify_download
+
+        with self.assertRaises(ObjectIntegrityException):
+            verify_download(self.path, Object("bucket", "file", etag = "0" * 32, size = len(self.data)))
+
+        with self.assertRaises(ObjectIntegrityException):
+            verify_download(self.path, Object("bucket", "file", etag = "0" * 32 + "-3", size = len(self.data)),
+                            client = self.part_client(self.PART_SIZE), bucket_name = "bucket")
+
+    def test_uncommon_part_sizes_should_be_confirmed_by_the_server(self):
+        from minio.datatypes import Object
+        from minio_extensions.exceptions import ObjectIntegrityException
+        from minio_extensions.transfer import candidate_part_sizes, verify_download
+
+        part_size = 7 * 1024 * 1024
+        stat = Object("bucket", "file", etag = self.multipart_etag(part_size), size = len(self.data))
+        client = self.part_client(part_size)
+
+        self.assertNotIn(part_size, candidate_part_sizes(len(self.data), stat.etag))
+
+        # Unconfirmed part sizes only verify the size
+        verify_download(self.path, stat)
+        verify_download(self.path, stat, client = client, bucket_name = "bucket")
+
+        self.assertEqual(client.stat_object.call_args.kwargs["extra_query_params"], {"partNumber": "1"})
+
+        with self.assertRaises(ObjectIntegrityException):
+            verify_download(self.path, Object("bucket", "file", etag = "0" * 32 + "-2", size = len(self.data)),
+                            client = client, bucket_name = "bucket")
+
+
+class UploadObjectTests(unittest.TestCase):
+
+    def setUp(self):
+        from unittest import mock
+        from minio_extensions.backends import MemoryBackend
+
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as fb:
+            fb.write(b"content")
+
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+        self.client.fput_object = mock.Mock(return_value = mock.Mock(version_id = None))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def upload(self, **kwargs):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.metadata.metadata import ObjectMetadata, TagMetadata, VersionMetadata
+
+        metadata = ObjectMetadata(version = VersionMetadata(major = 1, minor = 2),
+                                  tags = [TagMetadata(name = "kind", content = "raw")])
+        MinioExtensions.upload_object(self.client, bucket = "bucket", object_name = "file.bin", local_path = self.path,
+                                      content_type = "application/octet-stream", metadata = metadata, **kwargs)
+        return self.client.fput_object.call_args.kwargs
+
+    def test_transfer_options_should_be_passed_to_the_client(self):
+        from unittest import mock
+        from minio.helpers import MIN_PART_SIZE, get_part_info
+
+        kwargs = self.upload(max_workers = 4, part_size = 8 * 1024 * 1024)
+
+        self.assertEqual((kwargs["num_parallel_uploads"], kwargs["part_size"]), (4, 8 * 1024 * 1024))
+
+        # Part sizes below the minimum allowed for the file are raised to it
+        self.assertEqual(self.upload(part_size = 1024)["part_size"], MIN_PART_SIZE)
+
+        size = 100 * 1024 ** 3
+        with mock.patch("os.path.getsize", return_value = size):
+            self.assertEqual(self.upload(part_size = MIN_PART_SIZE)["part_size"], get_part_info(size, 0)[0])
+
+    def test_metadata_and_tags_should_not_depend_on_transfer_options(self):
+        default, tuned = self.upload(), self.upload(max_workers = 2, part_size = 8 * 1024 * 1024)
+
+        self.assertNotIn("part_size", default)
+        self.assertNotIn("num_parallel_uploads", default)
+        self.assertEqual(default["metadata"], {"version": "1.2.0"})
+        self.assertEqual(dict(default["tags"]), {"kind": "raw"})
+        self.assertEqual((tuned["metadata"], dict(tuned["tags"])), (default["metadata"], dict(default["tags"])))
+
+
+class DownloadRangesTests(unittest.TestCase):
+
+    def test_objects_should_be_downloaded_by_ranges(self):
+        from unittest import mock
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.extensions import MinioExtensions
+
+        data = os.urandom(3000)
+        client = MemoryBackend()
+        client.make_bucket("bucket")
+        client.put_object("bucket", "file.bin", io.BytesIO(data), len(data))
+        client.get_object = mock.Mock(wraps = client.get_object)
+        directory = tempfile.mkdtemp()
+
+        try:
+            with mock.patch.dict(os.environ, {"MINIO_S3_TRANSFER_MULTIPART_THRESHOLD": "1024"}):
+                _, path = MinioExtensions.fload_file_from_bucket(client, bucket_name = "bucket",
+                                                                 object_name = "file.bin", max_workers = 2,
+                                                                 part_size = 1024,
+                                                                 file_path = os.path.join(directory, "file.bin"))
+
+            with open(path, "rb") as fb:
+                self.assertEqual(fb.read(), data)
+
+            self.assertEqual(sorted((c.kwargs["offset"], c.kwargs["length"]) for c in client.get_object.call_args_list),
+                             [(0, 1024), (1024, 1024), (2048, 952)])
+            self.assertEqual(os.listdir(directory), ["file.bin"])
+        finally:
+            shutil.rmtree(directory, ignore_errors = True)
+
+
+class _Socket:
+    """Socket double serving a canned HTTP response to http.client."""
+
+    def __init__(self, data):
+        self.data = data
+
+    def makefile(self, mode):
+        return io.BytesIO(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n" % len(self.data) + self.data)
+
+
+def _response(data, raw = True):
+    from urllib3 import HTTPResponse
+
+    headers = {"Content-Length": str(len(data))}
+
+    if not raw:
+        return HTTPResponse(body = io.BytesIO(data), headers = headers, preload_content = False)
+
+    original = http.client.HTTPResponse(_Socket(data))
+    original.begin()
+    return HTTPResponse(body = original, headers = headers, preload_content = False, original_response = original)
+
+
+class ReadIntoTests(unittest.TestCase):
+
+    def test_object_should_be_read_into_caller_buffer(self):
+        from unittest import mock
+        from minio_extensions.transfer import readinto_response
+
+        data = os.urandom(4096)
+        buffer = bytearray(8192)
+        response = _response(data)
+
+        # Unencoded bodies skip the urllib3 reads, going straight to the http.client response
+        with mock.patch.object(response, "read", side_effect = AssertionError("Unexpected urllib3 read.")):
+            view = readinto_response(response, buffer, object_name = "file")
+
+        self.assertEqual(view.nbytes, len(data))
+        self.assertIs(view.obj, buffer)
+        self.assertEqual(bytes(buffer[:len(data)]), data)
+
+    def test_responses_without_http_client_body_should_be_read_through_urllib3(self):
+        from minio_extensions.transfer import readinto_response
+
+        data = os.urandom(4096)
+        buffer = bytearray(4096)
+
+        view = readinto_response(_response(data, raw = False), buffer, object_name = "file")
+
+        self.assertEqual(bytes(view), data)
+
+    def test_undersized_buffer_should_be_rejected(self):
+        from minio_extensions.transfer import readinto_response
+
+        with self.assertRaises(ValueError):
+            readinto_response(_response(b"0123456789"), bytearray(4), object_name = "file")
+
+
+if __name__ == '__main__':
+    unittest.main()
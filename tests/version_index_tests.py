@@ -0,0 +1,99 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+
+class VersionIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        from minio_extensions.backends import MemoryBackend
+        from minio_extensions.extensions import MinioExtensions
+
+        self.workdir = tempfile.mkdtemp()
+        self.client = MemoryBackend()
+        self.client.make_bucket("bucket")
+        MinioExtensions.enable_object_versioning(self.client, bucket = "bucket")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors = True)
+
+    def upload(self, minor: int, content: bytes):
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.metadata.metadata import ObjectMetadata, VersionMetadata
+
+        path = os.path.join(self.workdir, "upload.bin")
+        with open(path, "wb") as fb:
+            fb.write(content)
+
+        return MinioExtensions.upload_object(self.client, bucket = "bucket", object_name = "d/f.bin", local_path = path,
+                                             content_type = "application/octet-stream",
+                                             metadata = ObjectMetadata(version = VersionMetadata(major = 1,
+                                                                                                 minor = minor)))
+
+    def read(self, minor: int) -> bytes:
+        from minio_extensions.extensions import MinioExtensions
+        from minio_extensions.metadata.metadata import VersionMetadata
+
+        _, path = MinioExtensions.get_object(self.client, bucket = "bucket", file_name = "d/f.bin",
+                                             tag_version = VersionMetadata(major = 1, minor = minor))
+        with open(path, "rb") as fb:
+            return fb.read()
+
+    def test_uploads_should_write_through_the_index(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        first, second = self.upload(0, b"v0").version_id, self.upload(1, b"v1").version_id
+        index = MinioExtensions.read_version_index(self.client, bucket = "bucket", object_name = "d/f.bin")
+
+        self.assertEqual(index.versions, {"1.0.0": first, "1.1.0": second})
+        self.assertEqual(self.read(0), b"v0")
+
+    def test_missing_index_should_be_resolved_without_writing(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.upload(0, b"v0")
+        self.upload(1, b"v1")
+        self.client.remove_object("bucket", MinioExtensions._version_index_name("d/f.bin"))
+
+        put_object = self.client.put_object
+        self.client.put_object = mock.Mock(side_effect = AssertionError("Unexpected write."))
+
+        self.assertEqual(self.read(1), b"v1")
+        self.assertIsNone(MinioExtensions.read_version_index(self.client, bucket = "bucket", object_name = "d/f.bin"))
+
+        self.client.put_object = put_object
+        MinioExtensions.rebuild_version_index(self.client, bucket = "bucket", object_name = "d/f.bin")
+
+        self.assertEqual(sorted(MinioExtensions.read_version_index(self.client, bucket = "bucket",
+                                                                   object_name = "d/f.bin").versions),
+                         ["1.0.0", "1.1.0"])
+
+    def test_index_pointing_to_removed_versions_should_be_rescanned(self):
+        old = self.upload(1, b"old").version_id
+        removed = self.upload(1, b"new").version_id
+        self.client.remove_object("bucket", "d/f.bin", version_id = removed)
+
+        self.assertEqual(self.read(1), b"old")
+
+        self.client.remove_object("bucket", "d/f.bin", version_id = old)
+
+        with self.assertRaises(ValueError):
+            self.read(1)
+
+    def test_listings_should_hide_the_index(self):
+        from minio_extensions.extensions import MinioExtensions
+
+        self.upload(0, b"v0")
+        names = lambda **kwargs: [o.object_name for o in MinioExtensions.list_files_from_bucket(
+            self.client, bucket = "bucket", **kwargs)]
+
+        self.assertEqual(names(recurse = True), ["d/f.bin"])
+        self.assertEqual(names(), ["d/"])
+        self.assertEqual(names(prefix = ".minio-extensions/", recurse = True),
+                         [MinioExtensions._version_index_name("d/f.bin")])
+
+
+if __name__ == '__main__':
+    unittest.main()